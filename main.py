@@ -3,6 +3,7 @@ import os
 import argparse
 import time
 import threading # Für den Hintergrund-Server
+from typing import Any
 
 # Passe den Python-Pfad an, damit Module gefunden werden
 # Gehe zwei Ebenen hoch von main.py -> zum Projekt-Root
@@ -29,6 +30,17 @@ def main():
                         help='Startmodus des Systems (headless, ui, debug).')
     parser.add_argument('--api-port', type=int, default=5000,
                         help='Port für den Flask API Server.')
+    parser.add_argument('--server', type=str, default='dev', choices=['dev', 'production'],
+                        help='API-Server im Headless-Modus: Flask-Entwicklungsserver (dev) oder '
+                             'gunicorn/waitress mit mehreren Workern (production).')
+    parser.add_argument('--workers', type=int, help='Worker-Prozesse des Produktionsservers.')
+    parser.add_argument('--threads', type=int, help='Threads pro Worker des Produktionsservers.')
+    parser.add_argument('--keepalive', type=int, help='Keep-Alive-Timeout in Sekunden.')
+    parser.add_argument('--max-concurrency', type=int,
+                        help='Gleichzeitige Anfragen pro Worker, darüber antwortet der Server mit 503.')
+    parser.add_argument('--max-streams', type=int,
+                        help='Live-Feed-Verbindungen (SSE) pro Worker; jede belegt einen Thread, '
+                             'daher kleiner als --threads halten.')
 
     args = parser.parse_args()
 
@@ -45,9 +57,11 @@ def main():
             print("Kritischer Fehler: System konnte nicht initialisiert werden. Beende.")
             sys.exit(1)
         
-        # Starte den DurgaAPI Server im Hintergrund
         api_server_instance = DurgaAPIServer(context_manager, port=args.api_port)
-        api_server_instance.start_in_background()
+        production = args.mode == 'headless' and args.server == 'production'
+        if not production:
+            # Starte den DurgaAPI Server im Hintergrund
+            api_server_instance.start_in_background()
 
         print(f"\nNEET-OS gestartet im Modus: {args.mode}")
         print(f"System-Metadaten: {context_manager.get_component_metadata()}")
@@ -61,6 +75,12 @@ def main():
             while True:
                 time.sleep(1) # Kurze Pause, um CPU-Auslastung zu reduzieren
 
+        elif production:
+            # Blockiert, bis der Server per Strg+C/SIGTERM beendet wird; danach fährt 'finally' den Kern herunter
+            api_server_instance.serve_production(workers=args.workers, threads=args.threads,
+                                                 keepalive=args.keepalive, max_concurrency=args.max_concurrency,
+                                                 max_streams=args.max_streams)
+
         elif args.mode == 'headless' or args.mode == 'debug':
             print("System läuft im Headless-Modus. Bereit für Befehle oder Hintergrundaufgaben.")
             print("Drücken Sie Strg+C, um das System zu beenden.")
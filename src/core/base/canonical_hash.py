@@ -0,0 +1,281 @@
+# src/core/base/canonical_hash.py
+
+import collections
+import hashlib
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Iterable, Tuple
+
+# Typ-Tags der kanonischen Kodierung
+_NONE = b"N"
+_TRUE = b"T"
+_FALSE = b"F"
+_INT = b"I"
+_FLOAT = b"D"
+_STR = b"S"
+_BYTES = b"B"
+_LIST = b"L" # list und tuple
+_MAP = b"M"
+_SET = b"E" # set und frozenset
+
+_pack_length = struct.Struct(">I").pack
+_pack_float = struct.Struct(">d").pack
+_pack_head = struct.Struct(">cI").pack # Typ-Tag + Länge in einem Aufruf
+_pack_tagged_float = struct.Struct(">cd").pack
+
+# Sortierte, fertig kodierte Schlüssel je Schlüsselfolge eines Dicts mit String-Schlüsseln.
+# Karten, Card-IDs usw. haben immer dieselben Schlüssel: Sortieren und Kodieren entfällt dann.
+_key_orders: Dict[Tuple[str, ...], List[Tuple[bytes, str]]] = {}
+_key_orders_size = 1024
+
+
+def list_header(count: int) -> bytes:
+    """Kopf einer Liste mit 'count' Elementen; erlaubt das Streamen einer Liste in einen Hash."""
+    return _LIST + _pack_length(count)
+
+
+def canonical_encode(value: Any) -> bytes:
+    """
+    Kanonische Binärkodierung: jeder Wert bekommt ein Typ-Tag, Längen sind vorangestellt,
+    Dict-Schlüssel und Mengen werden nach ihrer Kodierung sortiert. Gleiche Daten ergeben damit
+    unabhängig von Einfügereihenfolge dieselben Bytes, und 1, 1.0, True und "1" bleiben verschieden.
+    Objekte mit to_dict() werden über ihr Dictionary kodiert.
+    """
+    buffer = bytearray()
+    _encode_into(value, buffer)
+    return bytes(buffer)
+
+
+def _encode_into(value: Any, buffer: bytearray) -> None:
+    # Die häufigen Typen direkt (ohne weiteren Funktionsaufruf), exakte Typen vor isinstance
+    value_type = type(value)
+    if value_type is str:
+        raw = value.encode('utf-8')
+        buffer += _pack_head(_STR, len(raw))
+        buffer += raw
+    elif value_type is int:
+        raw = value.to_bytes((value.bit_length() + 8) // 8, 'big', signed=True)
+        buffer += _pack_head(_INT, len(raw))
+        buffer += raw
+    elif value_type is float:
+        buffer += _pack_tagged_float(_FLOAT, value)
+    elif value_type is dict:
+        _encode_dict(value, buffer)
+    elif value_type is list or value_type is tuple:
+        _encode_sequence(value, buffer)
+    elif value_type is bool:
+        buffer += _TRUE if value else _FALSE
+    elif value is None:
+        buffer += _NONE
+    elif value_type is bytes or value_type is bytearray:
+        buffer += _pack_head(_BYTES, len(value))
+        buffer += value
+    elif value_type is set or value_type is frozenset:
+        _encode_set(value, buffer)
+    # Unterklassen der Grundtypen (z.B. IntEnum, OrderedDict) über isinstance zuordnen
+    elif isinstance(value, bool):
+        buffer += _TRUE if value else _FALSE
+    elif isinstance(value, int):
+        _encode_into(int(value), buffer)
+    elif isinstance(value, float):
+        _encode_into(float(value), buffer)
+    elif isinstance(value, str):
+        _encode_into(str(value), buffer)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        _encode_into(bytes(value), buffer)
+    elif isinstance(value, (list, tuple)):
+        _encode_sequence(value, buffer)
+    elif isinstance(value, dict):
+        _encode_dict(value, buffer)
+    elif isinstance(value, (set, frozenset)):
+        _encode_set(value, buffer)
+    elif hasattr(value, "to_dict"):
+        _encode_into(value.to_dict(), buffer)
+    else:
+        raise TypeError(f"Typ '{type(value).__name__}' ist nicht kanonisch kodierbar.")
+
+
+def _encode_sequence(value: Any, buffer: bytearray) -> None:
+    buffer += _pack_head(_LIST, len(value))
+    for item in value:
+        _encode_into(item, buffer)
+
+
+def _key_order(keys: Tuple[Any, ...]) -> Optional[List[Tuple[bytes, str]]]:
+    """Kodierte String-Schlüssel in kanonischer Reihenfolge; None, wenn nicht alle Schlüssel Strings sind."""
+    if not all(type(key) is str for key in keys):
+        return None
+    encoded = []
+    for key in keys:
+        raw = key.encode('utf-8')
+        encoded.append((_pack_head(_STR, len(raw)) + raw, key))
+    # Die kodierten Schlüssel sind eindeutig, der Vergleich erreicht den zweiten Tupel-Eintrag nie
+    encoded.sort()
+    if len(_key_orders) >= _key_orders_size:
+        _key_orders.clear()
+    _key_orders[keys] = encoded
+    return encoded
+
+
+def _encode_dict(value: Dict[Any, Any], buffer: bytearray) -> None:
+    buffer += _pack_head(_MAP, len(value))
+    keys = tuple(value)
+    order = _key_orders.get(keys)
+    if order is None:
+        order = _key_order(keys)
+    if order is None:
+        for key, item in sorted((canonical_encode(key), canonical_encode(item)) for key, item in value.items()):
+            buffer += key
+            buffer += item
+        return
+    for encoded, key in order:
+        buffer += encoded
+        item = value[key]
+        # Skalare Werte wie in _encode_into, ohne den zusätzlichen Aufruf
+        item_type = type(item)
+        if item_type is str:
+            raw = item.encode('utf-8')
+            buffer += _pack_head(_STR, len(raw))
+            buffer += raw
+        elif item_type is int:
+            raw = item.to_bytes((item.bit_length() + 8) // 8, 'big', signed=True)
+            buffer += _pack_head(_INT, len(raw))
+            buffer += raw
+        elif item_type is float:
+            buffer += _pack_tagged_float(_FLOAT, item)
+        else:
+            _encode_into(item, buffer)
+
+
+def _encode_set(value: Any, buffer: bytearray) -> None:
+    buffer += _pack_head(_SET, len(value))
+    for item in sorted(canonical_encode(item) for item in value):
+        buffer += item
+
+
+def _memo_key(value: Any) -> Optional[Tuple[Any, ...]]:
+    """Schlüssel für den Memo-Cache, nur für unveränderliche Werte; None = nicht memoisierbar."""
+    value_type = type(value)
+    if value_type is float:
+        # Nach Bitmuster: -0.0 == 0.0 und NaN != NaN dürfen sich keinen Eintrag teilen bzw. ihn verfehlen
+        return (float, _pack_float(value))
+    if value_type in (str, bytes, int, bool) or value is None:
+        return (value_type, value)
+    if value_type is tuple:
+        keys = tuple(_memo_key(item) for item in value)
+        return None if None in keys else (tuple, keys)
+    if value_type is frozenset:
+        keys = frozenset(_memo_key(item) for item in value)
+        return None if None in keys else (frozenset, keys)
+    return None
+
+
+class CanonicalHasher:
+    """
+    Hasht Werte über ihre kanonische Kodierung.
+    Ein vorinitialisiertes Hash-Objekt wird per copy() wiederverwendet; Ergebnisse für unveränderliche
+    Eingaben (Strings, Zahlen, Tupel daraus, ...) werden in einem LRU-Memo gehalten. hash_many() verteilt
+    große Puffer auf einen Thread-Pool, hashlib gibt dabei ab ca. 2 KiB den GIL frei.
+    """
+    parallel_threshold = 16 * 1024 # Ab dieser Puffergröße wird in hash_many() parallel gehasht
+    memo_size = 4096
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, algorithm: str = "sha256", **hash_options: Any):
+        """
+        :param algorithm: Name eines hashlib-Algorithmus (z.B. "md5", "sha256", "blake2b").
+        :param hash_options: Zusätzliche Optionen für den Konstruktor, z.B. digest_size für BLAKE2.
+        """
+        self.algorithm = algorithm
+        self._prototype = hashlib.new(algorithm, **hash_options)
+        self._memo: "collections.OrderedDict[Tuple[Any, ...], str]" = collections.OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    def hash_bytes(self, data: bytes) -> str:
+        digest = self._prototype.copy()
+        digest.update(data)
+        return digest.hexdigest()
+
+    def hash(self, value: Any) -> str:
+        key = _memo_key(value)
+        if key is not None:
+            with self._memo_lock:
+                cached = self._memo.get(key)
+                if cached is not None:
+                    self._memo.move_to_end(key)
+                    return cached
+        result = self.hash_bytes(canonical_encode(value))
+        if key is not None:
+            with self._memo_lock:
+                self._memo[key] = result
+                if len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+        return result
+
+    def digest_bytes(self, data: bytes) -> bytes:
+        digest = self._prototype.copy()
+        digest.update(data)
+        return digest.digest()
+
+    def hash_many(self, values: Iterable[Any]) -> List[str]:
+        """Hasht viele Werte; große Puffer werden parallel im Thread-Pool verarbeitet."""
+        return [digest.hex() for digest in self.digest_many(values)]
+
+    def digest_many(self, values: Iterable[Any]) -> List[bytes]:
+        """Wie hash_many(), liefert aber die binären Digests (kompakter als Hex, z.B. als Dict-Schlüssel)."""
+        buffers = [canonical_encode(value) for value in values]
+        results: List[Optional[bytes]] = [None] * len(buffers)
+        large = [index for index, buffer in enumerate(buffers) if len(buffer) >= self.parallel_threshold]
+        if len(large) > 1:
+            for index, result in zip(large, self._get_executor().map(self.digest_bytes, [buffers[i] for i in large])):
+                results[index] = result
+        for index, buffer in enumerate(buffers):
+            if results[index] is None:
+                results[index] = self.digest_bytes(buffer)
+        return results
+
+    def new(self) -> Any:
+        """Frisches Hash-Objekt (Kopie des Prototyps) für inkrementelles Hashen."""
+        return self._prototype.copy()
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(thread_name_prefix="hash-worker")
+            return cls._executor
+
+
+_hashers: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], CanonicalHasher] = {}
+_hashers_lock = threading.Lock()
+
+
+def get_hasher(algorithm: str = "sha256", **hash_options: Any) -> CanonicalHasher:
+    """Geteilte Hasher-Instanz pro Algorithmus und Optionen (inklusive Memo)."""
+    key = (algorithm, tuple(sorted(hash_options.items())))
+    with _hashers_lock:
+        hasher = _hashers.get(key)
+        if hasher is None:
+            hasher = _hashers[key] = CanonicalHasher(algorithm, **hash_options)
+        return hasher
+
+
+def md5_hex(value: Any) -> str:
+    return _md5.hash(value)
+
+
+def blake2b_hex(value: Any) -> str:
+    return _blake2b.hash(value)
+
+
+def sha256_hex(value: Any) -> str:
+    return _sha256.hash(value)
+
+
+# Direkt gebunden: get_hasher() baut pro Aufruf einen Schlüssel und nimmt einen Lock
+_md5 = get_hasher("md5")
+_blake2b = get_hasher("blake2b")
+_sha256 = get_hasher("sha256")
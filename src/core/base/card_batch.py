@@ -0,0 +1,296 @@
+# src/core/base/card_batch.py
+
+import socket
+import sys
+from array import array
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple
+
+from core.base.core_context_manager import AbstractCard
+
+# Spaltenarten eines CardBatch und ihre Array-Typecodes
+IPV4 = "ipv4" # Dotted-Quad, gespeichert als uint32
+UINT16 = "uint16" # z.B. Ports
+UINT32 = "uint32"
+INT = "int"
+FLOAT = "float"
+ENUM = "enum" # Wenige wiederkehrende Werte (z.B. severity), gespeichert als uint8-Code
+OBJECT = "object" # Alles andere, als normale Python-Liste
+
+_TYPECODES = {IPV4: 'L', UINT16: 'H', UINT32: 'L', INT: 'q', FLOAT: 'd', ENUM: 'B'}
+_MAX_ENUM_LABELS = 256
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_ipv4(value: Any) -> bool:
+    if not isinstance(value, str) or value.count(".") != 3:
+        return False
+    try:
+        socket.inet_aton(value)
+    except OSError:
+        return False
+    return True
+
+
+class _Column:
+    """Eine typisierte Spalte mit Präsenzmaske (fehlende Felder bzw. None)."""
+    __slots__ = ("kind", "values", "present", "labels", "codes")
+
+    def __init__(self, kind: str):
+        if kind not in _TYPECODES and kind != OBJECT:
+            raise ValueError(f"Unbekannte Spaltenart: '{kind}'")
+        self.kind = kind
+        self.values = array(_TYPECODES[kind]) if kind in _TYPECODES else []
+        self.present = bytearray()
+        self.labels: List[Any] = [] # Nur ENUM: Code -> Wert
+        self.codes: Dict[Any, int] = {} # Nur ENUM: Wert -> Code
+
+    def encode(self, value: Any) -> Any:
+        if self.kind == IPV4:
+            try:
+                return int.from_bytes(socket.inet_aton(value), 'big')
+            except (OSError, TypeError):
+                raise ValueError(f"Keine IPv4-Adresse: {value!r}")
+        if self.kind == ENUM:
+            code = self.codes.get(value)
+            if code is None:
+                if len(self.labels) >= _MAX_ENUM_LABELS:
+                    raise ValueError(f"Enum-Spalte hat bereits {_MAX_ENUM_LABELS} verschiedene Werte.")
+                code = self.codes[value] = len(self.labels)
+                self.labels.append(value)
+            return code
+        if self.kind in (UINT16, UINT32, INT) and not _is_int(value):
+            raise ValueError(f"Keine Ganzzahl: {value!r}")
+        return value
+
+    def decode(self, raw: Any) -> Any:
+        if self.kind == IPV4:
+            return socket.inet_ntoa(raw.to_bytes(4, 'big'))
+        if self.kind == ENUM:
+            return self.labels[raw]
+        return raw
+
+    def _empty(self) -> Any:
+        return None if self.kind == OBJECT else 0
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.values.append(self._empty())
+            self.present.append(0)
+            return
+        try:
+            self.values.append(self.encode(value))
+        except OverflowError:
+            raise ValueError(f"Wert {value!r} passt nicht in eine {self.kind}-Spalte.")
+        self.present.append(1)
+
+    def set(self, row: int, value: Any) -> None:
+        if value is None:
+            self.values[row] = self._empty()
+            self.present[row] = 0
+            return
+        try:
+            self.values[row] = self.encode(value)
+        except OverflowError:
+            raise ValueError(f"Wert {value!r} passt nicht in eine {self.kind}-Spalte.")
+        self.present[row] = 1
+
+    def get(self, row: int) -> Any:
+        return self.decode(self.values[row]) if self.present[row] else None
+
+    def nbytes(self) -> int:
+        if self.kind == OBJECT:
+            return sys.getsizeof(self.values) + len(self.present)
+        return self.values.itemsize * len(self.values) + len(self.present)
+
+
+def infer_schema(datas: Iterable[Dict[str, Any]]) -> Dict[str, str]:
+    """Leitet aus Beispiel-Daten die kompakteste Spaltenart pro Feld ab."""
+    values: Dict[str, List[Any]] = {}
+    for data in datas:
+        for field, value in data.items():
+            if value is not None:
+                values.setdefault(field, []).append(value)
+    schema = {}
+    for field, field_values in values.items():
+        if all(_is_ipv4(value) for value in field_values):
+            schema[field] = IPV4
+        elif all(_is_int(value) for value in field_values):
+            low, high = min(field_values), max(field_values)
+            if low >= 0 and high <= 0xFFFF:
+                schema[field] = UINT16
+            elif low >= 0 and high <= 0xFFFFFFFF:
+                schema[field] = UINT32
+            elif -2 ** 63 <= low and high < 2 ** 63:
+                schema[field] = INT
+            else:
+                schema[field] = OBJECT
+        elif all(_is_int(value) or isinstance(value, float) for value in field_values):
+            schema[field] = FLOAT
+        elif (all(isinstance(value, (str, bool)) for value in field_values)
+              and len(set(field_values)) <= min(_MAX_ENUM_LABELS, max(1, len(field_values) // 2))):
+            schema[field] = ENUM
+        else:
+            schema[field] = OBJECT
+    return schema
+
+
+class CardView(AbstractCard):
+    """
+    Leichtgewichtige Sicht auf eine Zeile eines CardBatch.
+    Verhält sich wie eine AbstractCard (to_dict, update, get_graph_data), 'data' wird jedoch bei jedem
+    Zugriff aus den Spalten materialisiert: Änderungen müssen über update() erfolgen.
+    """
+    __slots__ = ("_batch", "_row")
+
+    def __init__(self, batch: "CardBatch", row: int):
+        self._batch = batch
+        self._row = row
+        self._registry = None
+
+    @property
+    def card_id(self) -> str:
+        return self._batch.card_ids[self._row]
+
+    @property
+    def card_type(self) -> str:
+        return self._batch.card_type
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        return self._batch.row_data(self._row)
+
+    @property
+    def _graph_data_ready(self) -> bool:
+        return bool(self._batch.graph_ready[self._row])
+
+    @_graph_data_ready.setter
+    def _graph_data_ready(self, value: bool):
+        self._batch.graph_ready[self._row] = 1 if value else 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"card_id": self.card_id, "card_type": self.card_type, "data": self.data}
+
+    def update(self, new_data: Dict[str, Any]):
+        self._batch.update_row(self._row, new_data)
+
+    def __repr__(self) -> str:
+        return f"<CardView {self.card_type} {self.card_id} (Zeile {self._row})>"
+
+
+class CardBatch:
+    """
+    Spaltenorientierter Container für viele Karten desselben card_type.
+    Felder aus dem Schema liegen als typisierte Arrays vor (IPs als uint32, Ports als uint16,
+    Enums als uint8-Codes), sonstige Felder in einer dünn besetzten Zusatz-Tabelle.
+    Karten werden erst beim Zugriff als CardView materialisiert.
+    """
+
+    def __init__(self, card_type: str, schema: Dict[str, str]):
+        self.card_type = card_type
+        self.card_ids: List[str] = []
+        self.graph_ready = bytearray()
+        self._columns: Dict[str, _Column] = {field: _Column(kind) for field, kind in schema.items()}
+        self._extra: Dict[int, Dict[str, Any]] = {} # Zeile -> Felder außerhalb des Schemas
+        self._rows_by_id: Optional[Dict[str, int]] = None # Wird erst bei Suche nach ID aufgebaut
+
+    @classmethod
+    def from_cards(cls, cards: Iterable[Any], card_type: Optional[str] = None,
+                   schema: Optional[Dict[str, str]] = None) -> "CardBatch":
+        """Baut einen Batch aus vorhandenen Karten; ohne Schema wird es aus den Daten abgeleitet."""
+        cards = list(cards)
+        if card_type is None:
+            if not cards:
+                raise ValueError("Ohne Karten muss card_type angegeben werden.")
+            card_type = cards[0].card_type
+        batch = cls(card_type, schema if schema is not None else infer_schema(card.data for card in cards))
+        batch.extend((card.card_id, card.data) for card in cards)
+        return batch
+
+    @property
+    def schema(self) -> Dict[str, str]:
+        return {field: column.kind for field, column in self._columns.items()}
+
+    # --- Schreiben ---
+
+    def append(self, card_id: str, data: Dict[str, Any]) -> int:
+        """Hängt eine Karte an und gibt ihre Zeilennummer zurück."""
+        row = len(self.card_ids)
+        for field, column in self._columns.items():
+            column.append(data.get(field))
+        extra = {field: value for field, value in data.items() if field not in self._columns}
+        if extra:
+            self._extra[row] = extra
+        self.card_ids.append(card_id)
+        self.graph_ready.append(0)
+        if self._rows_by_id is not None:
+            self._rows_by_id[card_id] = row
+        return row
+
+    def extend(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        for card_id, data in items:
+            self.append(card_id, data)
+
+    def update_row(self, row: int, new_data: Dict[str, Any]) -> None:
+        """Überschreibt einzelne Felder einer Zeile (Semantik wie dict.update)."""
+        for field, value in new_data.items():
+            column = self._columns.get(field)
+            if column is not None:
+                column.set(row, value)
+            else:
+                self._extra.setdefault(row, {})[field] = value
+
+    # --- Lesen ---
+
+    def row_data(self, row: int) -> Dict[str, Any]:
+        data = {}
+        for field, column in self._columns.items():
+            if column.present[row]:
+                data[field] = column.decode(column.values[row])
+        extra = self._extra.get(row)
+        if extra:
+            data.update(extra)
+        return data
+
+    def column(self, field: str) -> Iterator[Any]:
+        """Iteriert die (dekodierten) Werte einer Schema-Spalte, None für fehlende Werte."""
+        column = self._columns[field]
+        return (column.decode(raw) if present else None for raw, present in zip(column.values, column.present))
+
+    def raw_column(self, field: str) -> Any:
+        """Das zugrundeliegende Array einer Spalte (z.B. IPs als uint32) für Massenoperationen."""
+        return self._columns[field].values
+
+    def row_of(self, card_id: str) -> Optional[int]:
+        if self._rows_by_id is None:
+            self._rows_by_id = {card_id: row for row, card_id in enumerate(self.card_ids)}
+        return self._rows_by_id.get(card_id)
+
+    def get(self, card_id: str) -> Optional[CardView]:
+        row = self.row_of(card_id)
+        return CardView(self, row) if row is not None else None
+
+    def __getitem__(self, row: int) -> CardView:
+        if row < 0:
+            row += len(self.card_ids)
+        if not 0 <= row < len(self.card_ids):
+            raise IndexError("Zeile außerhalb des Batches.")
+        return CardView(self, row)
+
+    def __iter__(self) -> Iterator[CardView]:
+        return (CardView(self, row) for row in range(len(self.card_ids)))
+
+    def __len__(self) -> int:
+        return len(self.card_ids)
+
+    def to_dicts(self) -> Iterator[Dict[str, Any]]:
+        return (view.to_dict() for view in self)
+
+    def nbytes(self) -> int:
+        """Grobe Größe der Spalten in Bytes (ohne die Karten-IDs und Zusatzfelder)."""
+        return sum(column.nbytes() for column in self._columns.values()) + len(self.graph_ready)
+
+    def __repr__(self) -> str:
+        return f"<CardBatch {self.card_type}: {len(self)} Karten, Spalten {self.schema}>"
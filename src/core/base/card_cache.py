@@ -0,0 +1,233 @@
+# src/core/base/card_cache.py
+
+import collections
+import sys
+import threading
+import time
+from typing import Dict, Any, List, Optional, Callable, Set
+
+
+def approximate_size(obj: Any, _seen: Optional[Set[int]] = None) -> int:
+    """Grobe Speichergröße eines Objekts inklusive enthaltener Container (Dicts, Listen, Tupel, Mengen)."""
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(approximate_size(key, seen) + approximate_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(approximate_size(item, seen) for item in obj)
+    return size
+
+
+def card_size(card: Any) -> int:
+    """Geschätzter Speicherbedarf einer Karte: Objekt, Kennung, Typ und Nutzdaten."""
+    seen: Set[int] = set()
+    return (sys.getsizeof(card) + approximate_size(card.card_id, seen)
+            + approximate_size(card.card_type, seen) + approximate_size(card.data, seen))
+
+
+class _CacheEntry:
+    __slots__ = ("card", "size", "stored_at")
+
+    def __init__(self, card: Any, size: int, stored_at: float):
+        self.card = card
+        self.size = size
+        self.stored_at = stored_at
+
+
+class CardCache:
+    """
+    Größenbegrenzter Karten-Cache mit LRU- und optionaler TTL-Verdrängung.
+    Der Speicherbedarf wird pro Karte geschätzt (card_size); übersteigt die Summe 'max_bytes',
+    werden die am längsten nicht genutzten Karten verdrängt. Angeheftete Karten (pin) werden
+    weder verdrängt noch laufen sie ab. Verdrängte Karten werden über 'on_evict' gemeldet,
+    damit der Aufrufer sie aus dem Arbeitsspeicher entfernen kann. Kann er das nicht (die Karte
+    ließe sich nicht wiederherstellen), übergibt er sie an retain(): solche residenten Karten
+    zählen weiter gegen 'max_bytes' und werden in den Statistiken getrennt ausgewiesen.
+    Abgelaufene Einträge werden beim Zugriff und spätestens alle 'ttl' Sekunden aus put() entfernt.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, ttl: Optional[float] = None,
+                 on_evict: Optional[Callable[[Any], None]] = None,
+                 size_function: Callable[[Any], int] = card_size):
+        """
+        :param max_bytes: Obergrenze für die geschätzte Größe aller nicht angehefteten Karten.
+        :param ttl: Optionale Lebensdauer eines Eintrags in Sekunden seit dem letzten Schreiben.
+        :param on_evict: Callback mit der verdrängten Karte (wird außerhalb der Cache-Sperre aufgerufen).
+        :param size_function: Schätzfunktion für die Größe einer Karte in Bytes.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._on_evict = on_evict
+        self._size_function = size_function
+        self._lock = threading.RLock()
+        # Nicht angeheftete Einträge in LRU-Reihenfolge (älteste Nutzung zuerst); angeheftete separat,
+        # damit die Verdrängung immer vorne abräumen kann, ohne an Pins vorbeizulaufen
+        self._entries: "collections.OrderedDict[str, _CacheEntry]" = collections.OrderedDict()
+        self._pinned_entries: Dict[str, _CacheEntry] = {}
+        self._pins: Dict[str, int] = {} # card_id -> Anzahl Pins (auch für noch nicht geladene Karten)
+        self._resident_entries: Dict[str, _CacheEntry] = {} # Nicht verdrängbar, siehe retain()
+        self._bytes = 0
+        self._pinned_bytes = 0
+        self._resident_bytes = 0
+        self._next_purge = time.monotonic() + ttl if ttl is not None else None
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def get(self, card_id: str) -> Optional[Any]:
+        """Liefert die Karte und markiert sie als zuletzt genutzt; abgelaufene Einträge zählen als Fehlschlag."""
+        evicted = []
+        with self._lock:
+            entry = self._pinned_entries.get(card_id) or self._resident_entries.get(card_id)
+            if entry is None:
+                entry = self._entries.get(card_id)
+                if entry is not None and self._expired(entry, time.monotonic()):
+                    evicted.append(self._drop(card_id))
+                    self._stats["expirations"] += 1
+                    entry = None
+                elif entry is not None:
+                    self._entries.move_to_end(card_id)
+            self._stats["hits" if entry is not None else "misses"] += 1
+        self._notify(evicted)
+        return entry.card if entry is not None else None
+
+    def put(self, card: Any) -> None:
+        """Legt eine Karte ab bzw. aktualisiert Größe und Alter nach einer Änderung."""
+        size = self._size_function(card)
+        with self._lock:
+            resident = card.card_id in self._resident_entries
+            self._drop(card.card_id)
+            entry = _CacheEntry(card, size, time.monotonic())
+            if resident:
+                self._resident_entries[card.card_id] = entry
+                self._resident_bytes += size
+            elif card.card_id in self._pins:
+                self._pinned_entries[card.card_id] = entry
+                self._pinned_bytes += size
+            else:
+                self._entries[card.card_id] = entry
+                self._bytes += size
+            evicted = self._shrink()
+            purge = self._next_purge is not None and entry.stored_at >= self._next_purge
+        self._notify(evicted)
+        if purge:
+            self.purge_expired()
+
+    def retain(self, card: Any) -> None:
+        """
+        Hält eine Karte dauerhaft, weil der Aufrufer sie nach der Verdrängung nicht aus dem Speicher
+        entfernen kann. Sie läuft nicht ab, belegt aber weiter Budget, sodass beim nächsten put()
+        andere Karten weichen (nicht schon hier, sonst rekursiert on_evict -> retain -> on_evict).
+        """
+        size = self._size_function(card)
+        with self._lock:
+            self._drop(card.card_id)
+            self._resident_entries[card.card_id] = _CacheEntry(card, size, time.monotonic())
+            self._resident_bytes += size
+
+    def discard(self, card_id: str) -> None:
+        """Entfernt eine Karte ohne on_evict (z.B. weil sie gelöscht wurde)."""
+        with self._lock:
+            self._drop(card_id)
+
+    def pin(self, card_id: str) -> None:
+        """Heftet eine Karte an (z.B. solange die UI sie anzeigt). Pins werden gezählt."""
+        with self._lock:
+            self._pins[card_id] = self._pins.get(card_id, 0) + 1
+            entry = self._entries.pop(card_id, None)
+            if entry is not None:
+                self._bytes -= entry.size
+                self._pinned_entries[card_id] = entry
+                self._pinned_bytes += entry.size
+
+    def unpin(self, card_id: str) -> None:
+        evicted = []
+        with self._lock:
+            count = self._pins.get(card_id)
+            if count is None:
+                return
+            if count > 1:
+                self._pins[card_id] = count - 1
+                return
+            del self._pins[card_id]
+            entry = self._pinned_entries.pop(card_id, None)
+            if entry is not None:
+                self._pinned_bytes -= entry.size
+                entry.stored_at = time.monotonic() # TTL beginnt nach dem Lösen neu
+                self._entries[card_id] = entry
+                self._bytes += entry.size
+                evicted = self._shrink()
+        self._notify(evicted)
+
+    def is_pinned(self, card_id: str) -> bool:
+        return card_id in self._pins
+
+    def purge_expired(self) -> int:
+        """Entfernt alle abgelaufenen Einträge und gibt ihre Anzahl zurück."""
+        if self.ttl is None:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            self._next_purge = now + self.ttl
+            expired = [card_id for card_id, entry in self._entries.items() if self._expired(entry, now)]
+            evicted = [self._drop(card_id) for card_id in expired]
+            self._stats["expirations"] += len(evicted)
+        self._notify(evicted)
+        return len(evicted)
+
+    def _expired(self, entry: _CacheEntry, now: float) -> bool:
+        return self.ttl is not None and now - entry.stored_at > self.ttl
+
+    def _drop(self, card_id: str) -> Optional[Any]:
+        entry = self._entries.pop(card_id, None)
+        if entry is not None:
+            self._bytes -= entry.size
+            return entry.card
+        entry = self._pinned_entries.pop(card_id, None)
+        if entry is not None:
+            self._pinned_bytes -= entry.size
+            return entry.card
+        entry = self._resident_entries.pop(card_id, None)
+        if entry is not None:
+            self._resident_bytes -= entry.size
+            return entry.card
+        return None
+
+    def _shrink(self) -> List[Any]:
+        """
+        Verdrängt LRU-Einträge, bis das Budget (inklusive residenter Karten) eingehalten ist.
+        Muss unter self._lock aufgerufen werden.
+        """
+        evicted = []
+        while self._bytes + self._resident_bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            evicted.append(entry.card)
+        self._stats["evictions"] += len(evicted)
+        return evicted
+
+    def _notify(self, evicted: List[Any]) -> None:
+        if self._on_evict is not None:
+            for card in evicted:
+                self._on_evict(card)
+
+    def __contains__(self, card_id: object) -> bool:
+        return card_id in self._entries or card_id in self._pinned_entries or card_id in self._resident_entries
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pinned_entries) + len(self._resident_entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return dict(self._stats,
+                        hit_rate=(self._stats["hits"] / lookups) if lookups else 0.0,
+                        entries=len(self),
+                        pinned=len(self._pins),
+                        bytes=self._bytes,
+                        pinned_bytes=self._pinned_bytes,
+                        resident=len(self._resident_entries),
+                        resident_bytes=self._resident_bytes,
+                        max_bytes=self.max_bytes,
+                        ttl=self.ttl)
@@ -0,0 +1,208 @@
+# src/core/base/card_graph.py
+
+import collections
+import threading
+from typing import Dict, Any, List, Optional, Set, Tuple, Deque
+
+EdgeKey = Tuple[str, str, str] # (source, target, type)
+Fragment = Tuple[Dict[str, Dict[str, Any]], Dict[EdgeKey, Dict[str, Any]]] # (Knoten, Kanten) einer Karte
+
+# Operationen im Änderungsprotokoll
+ADD = "add"
+UPDATE = "update"
+REMOVE = "remove"
+NODE = "node"
+EDGE = "edge"
+
+
+def _edge_key(edge: Dict[str, Any]) -> EdgeKey:
+    return str(edge["source"]), str(edge["target"]), str(edge.get("type", ""))
+
+
+class CardGraph:
+    """
+    Inkrementell gepflegter Gesamtgraph über alle Karten.
+    Jede Karte trägt einen Knoten für sich selbst bei, plus das Fragment aus get_graph_data()
+    ({"nodes": [{"id": ...}], "edges": [{"source": ..., "target": ..., "type": ...}]}).
+    Bei einer Änderung wird nur das Fragment der Karte (reine Dicts, keine Referenz auf die Karte)
+    vorgemerkt, damit verdrängte Karten nicht bis zum nächsten Lesen im Speicher bleiben; beim Lesen
+    wird es mit dem memoisierten Fragment verglichen und nur die Differenz angewendet.
+    Jede Änderung erhöht die Versionsnummer, sodass Clients per diff(since) nur Änderungen abholen.
+    """
+
+    def __init__(self, max_changes: int = 100000):
+        """:param max_changes: Länge des Änderungsprotokolls; ältere Versionen erhalten einen Snapshot."""
+        self._lock = threading.RLock()
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._edges: Dict[EdgeKey, Dict[str, Any]] = {}
+        self._node_owners: Dict[str, Set[str]] = {} # Knoten -> beitragende card_ids
+        self._edge_owners: Dict[EdgeKey, Set[str]] = {}
+        self._adjacency: Dict[str, Set[EdgeKey]] = {} # Knoten -> ein- und ausgehende Kanten
+        self._fragments: Dict[str, Fragment] = {}
+        self._dirty: Dict[str, Fragment] = {} # card_id -> neues, noch nicht angewendetes Fragment
+        self._changes: Deque[Tuple[int, str, str, Any, Optional[Dict[str, Any]]]] = collections.deque(maxlen=max_changes)
+        self._version = 0
+
+    # --- Benachrichtigungen ---
+
+    def mark_dirty(self, card: Any) -> None:
+        """Vermerkt das aktuelle Fragment einer neuen oder geänderten Karte; angewendet wird beim nächsten Lesen."""
+        fragment = self._fragment(card) # Außerhalb der Sperre: get_graph_data() kann teuer sein
+        with self._lock:
+            self._dirty[card.card_id] = fragment
+
+    # --- Lesen ---
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            self._apply_dirty()
+            return self._version
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Der vollständige Graph mit aktueller Versionsnummer."""
+        with self._lock:
+            self._apply_dirty()
+            return {
+                "version": self._version,
+                "nodes": [dict(attrs, id=node_id) for node_id, attrs in self._nodes.items()],
+                "edges": [dict(attrs, source=key[0], target=key[1], type=key[2]) for key, attrs in self._edges.items()],
+            }
+
+    def diff(self, since: int) -> Dict[str, Any]:
+        """
+        Änderungen seit Version 'since' als Netto-Differenz (ein Knoten, der hinzugefügt und wieder
+        entfernt wurde, taucht nicht auf). Reicht das Protokoll nicht weit genug zurück, wird ein
+        vollständiger Snapshot mit "reset": True geliefert.
+        """
+        with self._lock:
+            self._apply_dirty()
+            oldest = self._changes[0][0] if self._changes else self._version + 1
+            if since > self._version or (since < oldest - 1 and since < self._version):
+                return dict(self.snapshot(), reset=True, since=since)
+            net: Dict[Tuple[str, Any], Tuple[str, Optional[Dict[str, Any]]]] = {}
+            for version, operation, kind, key, attrs in self._changes:
+                if version <= since:
+                    continue
+                previous = net.get((kind, key))
+                if previous is None:
+                    net[(kind, key)] = (operation, attrs)
+                elif previous[0] == ADD and operation == REMOVE:
+                    del net[(kind, key)] # Innerhalb des Fensters entstanden und wieder verschwunden
+                elif previous[0] == ADD:
+                    net[(kind, key)] = (ADD, attrs)
+                elif previous[0] == REMOVE and operation == ADD:
+                    net[(kind, key)] = (UPDATE, attrs)
+                else:
+                    net[(kind, key)] = (operation, attrs)
+            result: Dict[str, Any] = {"version": self._version, "since": since, "reset": False,
+                                      "added_nodes": [], "updated_nodes": [], "removed_nodes": [],
+                                      "added_edges": [], "updated_edges": [], "removed_edges": []}
+            for (kind, key), (operation, attrs) in net.items():
+                if kind == NODE:
+                    item = {"id": key} if operation == REMOVE else dict(attrs, id=key)
+                else:
+                    item = dict({} if operation == REMOVE else attrs, source=key[0], target=key[1], type=key[2])
+                target = {ADD: "added", UPDATE: "updated", REMOVE: "removed"}[operation]
+                result[f"{target}_{kind}s"].append(item)
+            return result
+
+    def neighbors(self, node_id: str) -> List[str]:
+        with self._lock:
+            self._apply_dirty()
+            return sorted({key[1] if key[0] == node_id else key[0] for key in self._adjacency.get(node_id, ())})
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"version": self._version, "nodes": len(self._nodes), "edges": len(self._edges),
+                    "dirty": len(self._dirty), "retained_changes": len(self._changes)}
+
+    # --- Inkrementelle Pflege ---
+
+    def _apply_dirty(self) -> None:
+        while self._dirty:
+            card_id, (new_nodes, new_edges) = self._dirty.popitem()
+            old_nodes, old_edges = self._fragments.get(card_id, ({}, {}))
+            self._fragments[card_id] = (new_nodes, new_edges)
+            # Erst Kanten abbauen, dann Knoten, damit keine Kante auf einen entfernten Knoten zeigt
+            for key in old_edges.keys() - new_edges.keys():
+                self._release_edge(key, card_id)
+            for node_id in old_nodes.keys() - new_nodes.keys():
+                self._release_node(node_id, card_id)
+            for node_id, attrs in new_nodes.items():
+                if old_nodes.get(node_id) != attrs or node_id not in self._nodes:
+                    self._claim_node(node_id, attrs, card_id)
+            for key, attrs in new_edges.items():
+                if old_edges.get(key) != attrs or key not in self._edges:
+                    self._claim_edge(key, attrs, card_id)
+
+    @staticmethod
+    def _fragment(card: Any) -> Fragment:
+        nodes = {card.card_id: {"type": card.card_type, "card_id": card.card_id}}
+        edges: Dict[EdgeKey, Dict[str, Any]] = {}
+        fragment = card.get_graph_data() or {}
+        for node in fragment.get("nodes", ()):
+            node_id = str(node["id"])
+            nodes[node_id] = dict(nodes.get(node_id, {}), **{key: value for key, value in node.items() if key != "id"})
+        for edge in fragment.get("edges", ()):
+            key = _edge_key(edge)
+            edges[key] = {name: value for name, value in edge.items() if name not in ("source", "target", "type")}
+            for endpoint in key[:2]:
+                nodes.setdefault(endpoint, {}) # Endpunkte existieren mindestens als nackte Knoten
+        return nodes, edges
+
+    def _log(self, operation: str, kind: str, key: Any, attrs: Optional[Dict[str, Any]]) -> None:
+        self._version += 1
+        self._changes.append((self._version, operation, kind, key, attrs))
+
+    def _claim_node(self, node_id: str, attrs: Dict[str, Any], card_id: str) -> None:
+        owners = self._node_owners.setdefault(node_id, set())
+        owners.add(card_id)
+        current = self._nodes.get(node_id)
+        if current is None:
+            self._nodes[node_id] = dict(attrs)
+            self._log(ADD, NODE, node_id, self._nodes[node_id])
+        elif attrs:
+            merged = dict(current, **attrs)
+            if merged != current:
+                self._nodes[node_id] = merged
+                self._log(UPDATE, NODE, node_id, merged)
+
+    def _release_node(self, node_id: str, card_id: str) -> None:
+        owners = self._node_owners.get(node_id)
+        if owners is None:
+            return
+        owners.discard(card_id)
+        if not owners:
+            del self._node_owners[node_id]
+            del self._nodes[node_id]
+            self._adjacency.pop(node_id, None)
+            self._log(REMOVE, NODE, node_id, None)
+
+    def _claim_edge(self, key: EdgeKey, attrs: Dict[str, Any], card_id: str) -> None:
+        self._edge_owners.setdefault(key, set()).add(card_id)
+        current = self._edges.get(key)
+        if current is None:
+            self._edges[key] = dict(attrs)
+            self._adjacency.setdefault(key[0], set()).add(key)
+            self._adjacency.setdefault(key[1], set()).add(key)
+            self._log(ADD, EDGE, key, self._edges[key])
+        elif attrs and dict(current, **attrs) != current:
+            self._edges[key] = dict(current, **attrs)
+            self._log(UPDATE, EDGE, key, self._edges[key])
+
+    def _release_edge(self, key: EdgeKey, card_id: str) -> None:
+        owners = self._edge_owners.get(key)
+        if owners is None:
+            return
+        owners.discard(card_id)
+        if not owners:
+            del self._edge_owners[key]
+            del self._edges[key]
+            for endpoint in key[:2]:
+                edges = self._adjacency.get(endpoint)
+                if edges is not None:
+                    edges.discard(key)
+                    if not edges:
+                        del self._adjacency[endpoint]
+            self._log(REMOVE, EDGE, key, None)
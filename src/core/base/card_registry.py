@@ -0,0 +1,321 @@
+# src/core/base/card_registry.py
+
+import bisect
+import threading
+from typing import Dict, Any, List, Optional, Callable, Iterator, Iterable, Set, Tuple
+
+_MISSING = object() # Feld in card.data nicht vorhanden
+
+
+def _index_keys(value: Any) -> Tuple[Any, ...]:
+    """Schlüssel eines Feldwerts für einen Hash-Index. Listen/Mengen werden elementweise indiziert."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(item for item in value if item.__hash__ is not None)
+    if value is _MISSING or value.__hash__ is None:
+        return ()
+    return (value,)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class CardRegistry:
+    """
+    Indiziertes Karten-Register für den CoreContextManager.
+    Verhält sich lesend wie ein Dict card_id -> AbstractCard und pflegt zusätzlich:
+      - einen Hash-Index auf card_type,
+      - Hash-Indizes auf deklarierte Felder in card.data (add_index),
+      - sortierte Bereichs-Indizes auf numerische Felder in card.data (add_range_index).
+    Die Indizes werden inkrementell gepflegt: beim Hinzufügen/Entfernen und nach AbstractCard.update(),
+    das über reindex() zurückmeldet. Pro Karte wird der zuletzt indizierte Stand gemerkt, damit
+    beim Reindizieren nur die geänderten Einträge angefasst werden.
+    """
+
+    def __init__(self, index_fields: Iterable[str] = (), range_fields: Iterable[str] = (),
+                 on_change: Optional[Callable[[Any], None]] = None,
+                 on_graph_change: Optional[Callable[[Any], None]] = None):
+        """
+        :param index_fields: Felder in card.data mit Hash-Index.
+        :param range_fields: Numerische Felder in card.data mit Bereichs-Index.
+        :param on_change: Optionaler Callback nach add() bzw. reindex(), z.B. zum Persistieren.
+        :param on_graph_change: Optionaler Callback, wenn sich nur die Graphen-Daten einer Karte ändern.
+        """
+        self._on_change = on_change
+        self._on_graph_change = on_graph_change
+        self._lock = threading.RLock()
+        self._cards: Dict[str, Any] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._hash_indexes: Dict[str, Dict[Any, Set[str]]] = {}
+        self._range_indexes: Dict[str, Tuple[List[float], List[str]]] = {} # Parallele Listen, sortiert nach Wert
+        self._indexed_state: Dict[str, Tuple[str, Dict[str, Any]]] = {} # card_id -> (card_type, Feldwerte)
+        for field in index_fields:
+            self.add_index(field)
+        for field in range_fields:
+            self.add_range_index(field)
+
+    # --- Index-Deklaration ---
+
+    def add_index(self, field: str) -> None:
+        """Deklariert einen Hash-Index auf card.data[field] und baut ihn für alle vorhandenen Karten auf."""
+        with self._lock:
+            if field in self._hash_indexes:
+                return
+            index: Dict[Any, Set[str]] = {}
+            self._hash_indexes[field] = index
+            for card_id, card in self._cards.items():
+                value = card.data.get(field, _MISSING)
+                self._indexed_state[card_id][1][field] = self._freeze(value)
+                for key in _index_keys(value):
+                    index.setdefault(key, set()).add(card_id)
+
+    def add_range_index(self, field: str) -> None:
+        """Deklariert einen Bereichs-Index auf das numerische Feld card.data[field]."""
+        with self._lock:
+            if field in self._range_indexes:
+                return
+            entries = []
+            for card_id, card in self._cards.items():
+                value = card.data.get(field, _MISSING)
+                self._indexed_state[card_id][1][field] = self._freeze(value)
+                if _is_number(value):
+                    entries.append((value, card_id))
+            entries.sort(key=lambda entry: entry[0])
+            self._range_indexes[field] = ([value for value, _ in entries], [card_id for _, card_id in entries])
+
+    @property
+    def indexed_fields(self) -> Dict[str, List[str]]:
+        return {"hash": list(self._hash_indexes), "range": list(self._range_indexes)}
+
+    # --- Pflege ---
+
+    def add(self, card: Any, notify: bool = True) -> bool:
+        """
+        Fügt eine Karte hinzu oder ersetzt sie. Gibt True zurück, wenn eine Karte ersetzt wurde.
+        notify=False unterdrückt on_change, z.B. für Karten, die gerade aus Durga 2 geladen wurden.
+        """
+        with self._lock:
+            replaced = card.card_id in self._cards
+            if replaced:
+                self._unindex(card.card_id)
+            self._cards[card.card_id] = card
+            self._index(card)
+        card.attach_registry(self)
+        if notify and self._on_change is not None:
+            self._on_change(card)
+        return replaced
+
+    def remove(self, card_id: str, detach: bool = True) -> Optional[Any]:
+        """
+        Entfernt eine Karte aus Register und Indizes.
+        detach=False lässt die Karte am Register hängen (z.B. nach Cache-Verdrängung), damit spätere
+        update()-Aufrufe auf noch gehaltenen Referenzen weiterhin über on_change persistiert werden.
+        """
+        with self._lock:
+            card = self._cards.pop(card_id, None)
+            if card is not None:
+                self._unindex(card_id)
+        if card is not None and detach:
+            card.attach_registry(None)
+        return card
+
+    def reindex(self, card: Any) -> None:
+        """Gleicht die Indizes einer (geänderten) Karte mit ihrem aktuellen Zustand ab."""
+        with self._lock:
+            if self._cards.get(card.card_id) is card:
+                self._reindex_locked(card)
+        # Auch nicht (mehr) registrierte Karten, z.B. nach Verdrängung, melden ihre Änderung weiter
+        if self._on_change is not None:
+            self._on_change(card)
+
+    def graph_changed(self, card: Any) -> None:
+        """Meldet geänderte Graphen-Daten (z.B. nach mark_graph_data_ready) ohne Reindizierung."""
+        if self._on_graph_change is not None:
+            self._on_graph_change(card)
+
+    def _reindex_locked(self, card: Any) -> None:
+        old_type, old_values = self._indexed_state[card.card_id]
+        if old_type != card.card_type:
+            self._discard(self._by_type, old_type, card.card_id)
+            self._by_type.setdefault(card.card_type, set()).add(card.card_id)
+        new_values = self._snapshot(card)
+        for field, index in self._hash_indexes.items():
+            old, new = old_values.get(field, _MISSING), new_values[field]
+            if old is new or old == new:
+                continue
+            for key in _index_keys(old):
+                self._discard(index, key, card.card_id)
+            for key in _index_keys(new):
+                index.setdefault(key, set()).add(card.card_id)
+        for field, entries in self._range_indexes.items():
+            old, new = old_values.get(field, _MISSING), new_values[field]
+            if old == new:
+                continue
+            if _is_number(old):
+                self._remove_range_entry(entries, old, card.card_id)
+            if _is_number(new):
+                self._insert_range_entry(entries, new, card.card_id)
+        self._indexed_state[card.card_id] = (card.card_type, new_values)
+
+    def clear(self) -> None:
+        with self._lock:
+            cards = list(self._cards.values())
+            self._cards.clear()
+            self._by_type.clear()
+            self._indexed_state.clear()
+            for index in self._hash_indexes.values():
+                index.clear()
+            for values, ids in self._range_indexes.values():
+                values.clear()
+                ids.clear()
+        for card in cards:
+            card.attach_registry(None)
+
+    def _snapshot(self, card: Any) -> Dict[str, Any]:
+        fields = set(self._hash_indexes) | set(self._range_indexes)
+        # Kopien von Listen, damit spätere In-Place-Änderungen am Kartenwert erkannt werden
+        return {field: self._freeze(card.data.get(field, _MISSING)) for field in fields}
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        return tuple(value) if isinstance(value, (list, set)) else value
+
+    def _index(self, card: Any) -> None:
+        self._by_type.setdefault(card.card_type, set()).add(card.card_id)
+        values = self._snapshot(card)
+        for field, index in self._hash_indexes.items():
+            for key in _index_keys(values[field]):
+                index.setdefault(key, set()).add(card.card_id)
+        for field, entries in self._range_indexes.items():
+            if _is_number(values[field]):
+                self._insert_range_entry(entries, values[field], card.card_id)
+        self._indexed_state[card.card_id] = (card.card_type, values)
+
+    def _unindex(self, card_id: str) -> None:
+        card_type, values = self._indexed_state.pop(card_id)
+        self._discard(self._by_type, card_type, card_id)
+        for field, index in self._hash_indexes.items():
+            for key in _index_keys(values.get(field, _MISSING)):
+                self._discard(index, key, card_id)
+        for field, entries in self._range_indexes.items():
+            value = values.get(field, _MISSING)
+            if _is_number(value):
+                self._remove_range_entry(entries, value, card_id)
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[str]], key: Any, card_id: str) -> None:
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(card_id)
+            if not bucket:
+                del index[key]
+
+    @staticmethod
+    def _insert_range_entry(entries: Tuple[List[float], List[str]], value: float, card_id: str) -> None:
+        values, ids = entries
+        position = bisect.bisect_right(values, value)
+        values.insert(position, value)
+        ids.insert(position, card_id)
+
+    @staticmethod
+    def _remove_range_entry(entries: Tuple[List[float], List[str]], value: float, card_id: str) -> None:
+        values, ids = entries
+        position = bisect.bisect_left(values, value)
+        end = bisect.bisect_right(values, value, position)
+        for index in range(position, end):
+            if ids[index] == card_id:
+                del values[index]
+                del ids[index]
+                return
+
+    # --- Abfragen ---
+
+    def query(self, card_type: Optional[str] = None, where: Optional[Dict[str, Any]] = None,
+              ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+              limit: Optional[int] = None) -> List[Any]:
+        """
+        Sucht Karten über die Indizes.
+        :param card_type: Nur Karten dieses Typs.
+        :param where: Gleichheitsbedingungen auf card.data. Indizierte Felder werden über den Hash-Index
+                      aufgelöst; bei Listenwerten genügt es, wenn der Wert enthalten ist. Nicht indizierte
+                      Felder werden auf der bereits eingegrenzten Kandidatenmenge geprüft.
+        :param ranges: Bereichsbedingungen {Feld: (min, max)} inklusive; None steht für offen.
+                       Das Feld muss per add_range_index deklariert sein.
+        :param limit: Maximale Anzahl Ergebnisse.
+        """
+        where = dict(where or {})
+        with self._lock:
+            candidate_sets: List[Set[str]] = []
+            if card_type is not None:
+                candidate_sets.append(self._by_type.get(card_type, set()))
+            for field in [field for field in where if field in self._hash_indexes]:
+                value = where.pop(field)
+                candidate_sets.append(self._hash_indexes[field].get(value, set()) if value.__hash__ else set())
+            for field, (low, high) in (ranges or {}).items():
+                if field not in self._range_indexes:
+                    raise KeyError(f"Kein Bereichs-Index für Feld '{field}' deklariert.")
+                candidate_sets.append(self._range_ids(self._range_indexes[field], low, high))
+
+            if candidate_sets:
+                candidate_sets.sort(key=len) # Kleinste Menge zuerst, dann schneiden
+                ids: Iterable[str] = candidate_sets[0].intersection(*candidate_sets[1:])
+                cards = (self._cards[card_id] for card_id in ids)
+            else:
+                cards = iter(self._cards.values())
+
+            results = []
+            for card in cards:
+                if where and not all(self._matches(card.data.get(field, _MISSING), value)
+                                     for field, value in where.items()):
+                    continue
+                results.append(card)
+                if limit is not None and len(results) >= limit:
+                    break
+            return results
+
+    @staticmethod
+    def _range_ids(entries: Tuple[List[float], List[str]], low: Optional[float], high: Optional[float]) -> Set[str]:
+        values, ids = entries
+        start = 0 if low is None else bisect.bisect_left(values, low)
+        end = len(values) if high is None else bisect.bisect_right(values, high)
+        return set(ids[start:end])
+
+    @staticmethod
+    def _matches(actual: Any, expected: Any) -> bool:
+        if isinstance(actual, (list, tuple, set, frozenset)):
+            return expected in actual
+        return actual == expected
+
+    def by_type(self, card_type: str) -> List[Any]:
+        with self._lock:
+            return [self._cards[card_id] for card_id in self._by_type.get(card_type, ())]
+
+    def type_counts(self) -> Dict[str, int]:
+        with self._lock:
+            return {card_type: len(ids) for card_type, ids in self._by_type.items()}
+
+    # --- Dict-Schnittstelle (lesend), kompatibel zum bisherigen self.cards ---
+
+    def get(self, card_id: str, default: Any = None) -> Any:
+        return self._cards.get(card_id, default)
+
+    def __getitem__(self, card_id: str) -> Any:
+        return self._cards[card_id]
+
+    def __contains__(self, card_id: object) -> bool:
+        return card_id in self._cards
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._cards))
+
+    def keys(self) -> List[str]:
+        return list(self._cards)
+
+    def values(self) -> List[Any]:
+        return list(self._cards.values())
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return list(self._cards.items())
@@ -0,0 +1,194 @@
+# src/core/base/command_batch.py
+
+import collections
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from core.base.log_store import format_timestamp
+from core.base.serialization import dumps
+
+# Ergebnisstatus eines Batch-Eintrags, zusätzlich zu den Statuswerten der Befehle selbst
+SKIPPED = "skipped"
+
+Execute = Callable[[str, Optional[Dict[str, Any]]], Dict[str, Any]]
+
+
+class BatchCommand:
+    """Ein Befehl eines Batches mit ID und den IDs der Befehle, die vorher erfolgreich sein müssen."""
+    __slots__ = ("command_id", "index", "command", "params", "depends_on")
+
+    def __init__(self, command_id: str, index: int, command: str, params: Optional[Dict[str, Any]] = None,
+                 depends_on: Optional[List[str]] = None):
+        self.command_id = command_id
+        self.index = index
+        self.command = command
+        self.params = params
+        self.depends_on = list(depends_on or [])
+
+
+def parse_batch(items: List[Any]) -> List[BatchCommand]:
+    """
+    Liest einen Batch: Einträge sind Befehls-Strings oder Dicts
+    {"id": ..., "command": ..., "params": {...}, "depends_on": [...]} ("command_type" wie bei
+    /api/modules/execute ist ebenfalls erlaubt). Ohne 'id' gilt die Position als ID.
+    Unbekannte Abhängigkeiten und Zyklen werden vor der Ausführung mit ValueError abgewiesen.
+    """
+    if not isinstance(items, list) or not items:
+        raise ValueError("Ein Batch ist eine nicht-leere Liste von Befehlen.")
+    commands: List[BatchCommand] = []
+    for index, item in enumerate(items):
+        if isinstance(item, str):
+            item = {"command": item}
+        if not isinstance(item, dict):
+            raise ValueError(f"Eintrag {index}: Befehl als String oder Objekt erwartet.")
+        command = item.get("command", item.get("command_type"))
+        if not isinstance(command, str) or not command.strip():
+            raise ValueError(f"Eintrag {index}: 'command' fehlt.")
+        depends_on = item.get("depends_on") or []
+        if isinstance(depends_on, (str, int)):
+            depends_on = [depends_on]
+        commands.append(BatchCommand(str(item.get("id", index)), index, command.strip(), item.get("params"),
+                                     [str(dependency) for dependency in depends_on]))
+
+    by_id: Dict[str, BatchCommand] = {}
+    for command in commands:
+        if command.command_id in by_id:
+            raise ValueError(f"Doppelte Befehls-ID '{command.command_id}'.")
+        by_id[command.command_id] = command
+    for command in commands:
+        for dependency in command.depends_on:
+            if dependency not in by_id:
+                raise ValueError(f"Befehl '{command.command_id}' hängt von unbekannter ID '{dependency}' ab.")
+            if dependency == command.command_id:
+                raise ValueError(f"Befehl '{command.command_id}' hängt von sich selbst ab.")
+
+    # Zyklenprüfung (Kahn): lässt sich nicht jeder Befehl einplanen, gibt es einen Zyklus
+    pending = {command.command_id: len(set(command.depends_on)) for command in commands}
+    dependents = _dependents(commands)
+    ready = [command_id for command_id, count in pending.items() if count == 0]
+    planned = 0
+    while ready:
+        command_id = ready.pop()
+        planned += 1
+        for dependent in dependents[command_id]:
+            pending[dependent] -= 1
+            if pending[dependent] == 0:
+                ready.append(dependent)
+    if planned != len(commands):
+        cyclic = sorted(command_id for command_id, count in pending.items() if count > 0)
+        raise ValueError(f"Zyklische Abhängigkeiten zwischen: {', '.join(cyclic)}")
+    return commands
+
+
+def check_max_parallel(max_parallel: Any) -> Optional[int]:
+    """Prüft die Parallelitätsgrenze eines Batches: None (unbegrenzt) oder eine Ganzzahl >= 1, sonst ValueError."""
+    if max_parallel is None:
+        return None
+    if isinstance(max_parallel, bool) or not isinstance(max_parallel, int) or max_parallel < 1:
+        raise ValueError(f"'max_parallel' muss eine Ganzzahl >= 1 sein, nicht {max_parallel!r}.")
+    return max_parallel
+
+
+def _dependents(commands: List[BatchCommand]) -> Dict[str, List[str]]:
+    dependents: Dict[str, List[str]] = {command.command_id: [] for command in commands}
+    for command in commands:
+        for dependency in set(command.depends_on):
+            dependents[dependency].append(command.command_id)
+    return dependents
+
+
+def run_batch(commands: List[BatchCommand], execute: Execute, executor: Executor,
+              max_parallel: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Führt einen (mit parse_batch geprüften) Batch aus und liefert die Ergebnisse in Abschlussreihenfolge.
+    Unabhängige Befehle laufen gleichzeitig auf 'executor', höchstens 'max_parallel' davon zugleich.
+    Ein Befehl startet erst, wenn alle seine Abhängigkeiten erfolgreich waren; schlägt eine fehl,
+    werden die abhängigen Befehle als 'skipped' gemeldet. Wird der Generator vorzeitig geschlossen
+    (Client getrennt), werden noch nicht gestartete Befehle verworfen.
+    'max_parallel' vorher mit check_max_parallel prüfen: der Generator meldet Fehler erst beim ersten next().
+    """
+    check_max_parallel(max_parallel)
+    by_id = {command.command_id: command for command in commands}
+    dependents = _dependents(commands)
+    pending = {command.command_id: len(set(command.depends_on)) for command in commands}
+    ready: Deque[BatchCommand] = collections.deque(command for command in commands if pending[command.command_id] == 0)
+    running: Dict[Future, BatchCommand] = {}
+    limit = max_parallel or len(commands)
+    try:
+        while ready or running:
+            while ready and len(running) < limit:
+                command = ready.popleft()
+                running[executor.submit(_execute_timed, execute, command)] = command
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: running[f].index):
+                command = running.pop(future)
+                entry = future.result()
+                yield entry
+                if entry["status"] == "success":
+                    for dependent in dependents[command.command_id]:
+                        if dependent not in pending:
+                            continue # Wegen einer anderen, fehlgeschlagenen Abhängigkeit übersprungen
+                        pending[dependent] -= 1
+                        if pending[dependent] == 0:
+                            ready.append(by_id[dependent])
+                else:
+                    yield from _skip_dependents(command, dependents, by_id, pending)
+    finally:
+        for future in running:
+            future.cancel()
+
+
+def _skip_dependents(failed: BatchCommand, dependents: Dict[str, List[str]], by_id: Dict[str, BatchCommand],
+                     pending: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    stack = [(failed.command_id, dependent) for dependent in dependents[failed.command_id]]
+    while stack:
+        cause, command_id = stack.pop()
+        if pending.pop(command_id, None) is None:
+            continue # Bereits übersprungen
+        command = by_id[command_id]
+        yield _entry(command, SKIPPED, {"status": SKIPPED, "message": f"Abhängigkeit '{cause}' nicht erfolgreich."},
+                     None, 0.0)
+        stack.extend((command_id, dependent) for dependent in dependents[command_id])
+
+
+def _execute_timed(execute: Execute, command: BatchCommand) -> Dict[str, Any]:
+    started = time.time()
+    start = time.perf_counter()
+    try:
+        result = execute(command.command, command.params)
+    except Exception as e: # Ein Befehl darf den Batch nicht abbrechen
+        result = {"status": "error", "message": str(e), "data_type": "error", "payload": {}}
+    duration = time.perf_counter() - start
+    return _entry(command, result.get("status", "error") if isinstance(result, dict) else "error", result, started, duration)
+
+
+def _entry(command: BatchCommand, status: str, result: Any, started: Optional[float], duration: float) -> Dict[str, Any]:
+    return {"id": command.command_id, "index": command.index, "command": command.command, "status": status,
+            "started": format_timestamp(started) if started is not None else None,
+            "duration_ms": round(duration * 1000, 3), "result": result}
+
+
+def summarize(entries: List[Dict[str, Any]], duration: float) -> Dict[str, Any]:
+    """Zusammenfassung eines abgeschlossenen Batches (Anzahl je Status und Gesamtdauer)."""
+    counts = collections.Counter(entry["status"] for entry in entries)
+    return {"total": len(entries), "succeeded": counts.get("success", 0), "skipped": counts.get(SKIPPED, 0),
+            "failed": len(entries) - counts.get("success", 0) - counts.get(SKIPPED, 0),
+            "duration_ms": round(duration * 1000, 3)}
+
+
+def stream_ndjson(results: Iterator[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    NDJSON-Generator über den Ergebnissen eines Befehls-Batches (eine Zeile pro Eintrag in
+    Abschlussreihenfolge), abgeschlossen mit {"summary": ...}. Wird der Generator vorzeitig
+    geschlossen (Client getrennt), werden noch nicht gestartete Befehle über results.close() verworfen.
+    """
+    start = time.perf_counter()
+    entries = []
+    try:
+        for entry in results:
+            entries.append(entry)
+            yield dumps(entry) + b"\n"
+        yield dumps({"summary": summarize(entries, time.perf_counter() - start)}) + b"\n"
+    finally:
+        results.close()
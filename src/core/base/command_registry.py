@@ -0,0 +1,191 @@
+# src/core/base/command_registry.py
+
+import functools
+import threading
+from typing import Dict, Any, List, Optional, Callable, Tuple, NamedTuple
+
+CommandHandler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+_MISSING = object() # Platzhalter für Pflichtargumente, die (noch) nicht angegeben wurden
+
+
+class CommandError(ValueError):
+    """Wird ausgelöst, wenn ein Befehl nicht zu seinem Argument-Schema passt."""
+    pass
+
+
+class CommandArgument:
+    """
+    Beschreibt ein Argument eines registrierten Befehls.
+    Positionale Argumente werden in Registrierungsreihenfolge aus der Befehlszeile gelesen;
+    ein 'greedy'-Argument nimmt den gesamten Rest der Zeile auf.
+    """
+    __slots__ = ("name", "arg_type", "required", "greedy", "default", "metavar")
+
+    def __init__(self, name: str, arg_type: Callable[[str], Any] = str, required: bool = True,
+                 greedy: bool = False, default: Any = None, metavar: Optional[str] = None):
+        self.name = name
+        self.arg_type = arg_type
+        self.required = required
+        self.greedy = greedy
+        self.default = default
+        self.metavar = metavar or name
+
+    def convert(self, raw: str) -> Any:
+        try:
+            return self.arg_type(raw)
+        except (TypeError, ValueError) as e:
+            raise CommandError(f"Ungültiger Wert für '{self.name}': '{raw}' ({e})")
+
+
+class Command:
+    """Ein registrierter Befehl: Verb (ein oder mehrere Wörter), Handler und Argument-Schema."""
+    __slots__ = ("verb", "handler", "arguments", "help_text")
+
+    def __init__(self, verb: str, handler: CommandHandler, arguments: Optional[List[CommandArgument]] = None,
+                 help_text: str = ""):
+        self.verb = verb
+        self.handler = handler
+        self.arguments = arguments or []
+        self.help_text = help_text
+
+    @property
+    def usage(self) -> str:
+        parts = [self.verb]
+        for argument in self.arguments:
+            parts.append(f"<{argument.metavar}>" if argument.required else f"[{argument.metavar}]")
+        return " ".join(parts)
+
+    def parse_arguments(self, tokens: List[str]) -> Tuple[Tuple[str, Any], ...]:
+        """Wandelt die Rest-Tokens der Befehlszeile gemäß Schema in (Name, Wert)-Paare um."""
+        values = []
+        position = 0
+        for argument in self.arguments:
+            if argument.greedy:
+                raw = " ".join(tokens[position:]) if position < len(tokens) else None
+                position = len(tokens)
+            else:
+                raw = tokens[position] if position < len(tokens) else None
+                position += 1
+            if raw is None:
+                # Fehlende Pflichtargumente können noch über 'params' nachgereicht werden
+                values.append((argument.name, _MISSING if argument.required else argument.default))
+            else:
+                values.append((argument.name, argument.convert(raw)))
+        if position < len(tokens):
+            raise CommandError(f"Zu viele Argumente. Verwendung: {self.usage}")
+        return tuple(values)
+
+    def check_complete(self, arguments: Dict[str, Any]) -> None:
+        """Prüft, ob alle Pflichtargumente einen Wert haben."""
+        for argument in self.arguments:
+            if arguments.get(argument.name, _MISSING) is _MISSING:
+                raise CommandError(f"Fehlendes Argument '{argument.metavar}'. Verwendung: {self.usage}")
+
+
+class ParsedCommand(NamedTuple):
+    command: Command
+    arguments: Tuple[Tuple[str, Any], ...] # Unveränderlich, damit der Parse-Cache sicher geteilt werden kann
+
+
+class _TrieNode:
+    __slots__ = ("children", "command")
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.command: Optional[Command] = None
+
+
+class CommandRegistry:
+    """
+    Tabellengesteuerter Befehls-Dispatcher.
+    Verben werden wortweise in einem Präfix-Trie abgelegt; die Auflösung einer Befehlszeile
+    läuft über den längsten passenden Präfix und kostet damit O(Wörter im Verb), unabhängig
+    von der Anzahl registrierter Befehle. Geparste Zeilen werden in einem LRU-Cache gehalten.
+    """
+    parse_cache_size = 4096
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._commands: Dict[str, Command] = {} # Verb -> Command, in Registrierungsreihenfolge
+        self._lock = threading.Lock()
+        self._cached_resolve = functools.lru_cache(maxsize=self.parse_cache_size)(self._resolve_uncached)
+
+    def register(self, verb: str, handler: CommandHandler, arguments: Optional[List[CommandArgument]] = None,
+                 help_text: str = "") -> Command:
+        """Registriert (oder ersetzt) einen Befehl. Das Verb wird ohne Beachtung der Groß-/Kleinschreibung verglichen."""
+        tokens = verb.lower().split()
+        if not tokens:
+            raise ValueError("Ein Befehl benötigt ein nicht-leeres Verb.")
+        command = Command(" ".join(tokens), handler, arguments, help_text)
+        with self._lock:
+            node = self._root
+            for token in tokens:
+                node = node.children.setdefault(token, _TrieNode())
+            node.command = command
+            self._commands[command.verb] = command
+            self._cached_resolve.cache_clear()
+        return command
+
+    def unregister(self, verb: str) -> bool:
+        """Entfernt einen Befehl. Gibt False zurück, wenn das Verb nicht registriert war."""
+        tokens = verb.lower().split()
+        with self._lock:
+            node = self._root
+            for token in tokens:
+                node = node.children.get(token)
+                if node is None:
+                    return False
+            if node.command is None:
+                return False
+            node.command = None
+            del self._commands[" ".join(tokens)]
+            self._cached_resolve.cache_clear()
+            return True
+
+    def commands(self) -> List[Command]:
+        """Alle registrierten Befehle in Registrierungsreihenfolge."""
+        return list(self._commands.values())
+
+    def resolve(self, command_line: str) -> Optional[ParsedCommand]:
+        """
+        Löst eine Befehlszeile auf. Gibt None zurück, wenn kein Verb passt.
+        Löst CommandError aus, wenn die Argumente nicht zum Schema passen; fehlende
+        Pflichtargumente werden erst in dispatch() geprüft.
+        """
+        return self._cached_resolve(command_line)
+
+    def _resolve_uncached(self, command_line: str) -> Optional[ParsedCommand]:
+        tokens = command_line.split()
+        lowered = command_line.lower().split()
+        node = self._root
+        match: Optional[Command] = None
+        match_length = 0
+        for depth, token in enumerate(lowered):
+            node = node.children.get(token)
+            if node is None:
+                break
+            if node.command is not None:
+                match, match_length = node.command, depth + 1
+        if match is None:
+            return None
+        return ParsedCommand(match, match.parse_arguments(tokens[match_length:]))
+
+    def dispatch(self, command_line: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Löst die Befehlszeile auf und ruft den Handler auf.
+        'params' (z.B. aus /api/modules/execute) ergänzen bzw. überschreiben die geparsten Argumente.
+        Gibt None zurück, wenn der Befehl unbekannt ist.
+        """
+        parsed = self.resolve(command_line)
+        if parsed is None:
+            return None
+        arguments = dict(parsed.arguments)
+        if params:
+            arguments.update(params)
+        parsed.command.check_complete(arguments)
+        return parsed.command.handler(arguments)
+
+    def help_lines(self) -> List[str]:
+        """Erzeugt die Hilfe-Ausgabe aus den registrierten Befehlen."""
+        return [f"  {command.usage:<15} - {command.help_text}" for command in self._commands.values()]
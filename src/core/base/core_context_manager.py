@@ -1,8 +1,29 @@
 import abc
+import bisect
+import functools
+import itertools
+import os
+import sys
 import threading
 import time
 import json
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+
+from core.base.canonical_hash import blake2b_hex
+from core.base.card_cache import CardCache
+from core.base.card_graph import CardGraph
+from core.base.card_registry import CardRegistry
+from core.base.command_batch import check_max_parallel, parse_batch, run_batch
+from core.base.command_registry import CommandRegistry, CommandArgument, CommandError
+from core.base.durga_store import DurgaStore
+from core.base.event_bus import EventBus
+from core.base.event_journal import EventJournal
+from core.base.log_pipeline import CallbackSink, ConsoleSink, LogPipeline, default_pipeline, level_number
+from core.base.log_store import LogStore, format_timestamp
+from core.base.plugin_runner import EXECUTION_MODES, INLINE, PROCESS, PluginExecutionError, PluginRunner, PluginTask
+from core.base.scan_jobs import ScanJobEngine, ScanJob
+from core.base.target_set import TargetSet
 
 # --- Basisklasse für alle zentralen Systemkomponenten (ZNSBase / SystemSphereBase) ---
 class SystemSphereBase(abc.ABC):
@@ -73,31 +94,51 @@ class SystemSphereBase(abc.ABC):
     def report_status(self, status_message: str, level: str = "INFO") -> None:
         """
         Meldet den Status der Komponente an das System (z.B. an einen zentralen Logger).
-        In einer realen Implementierung würde dies an einen zentralen Logger gesendet,
-        der auch von Azure Monitor erfasst werden könnte.
-        """
-        formatted_message = f"[{self._component_name}][{level.upper()}]: {status_message}"
-        color = "OKBLUE"
-        if level.upper() == "WARNING":
-            color = "WARNING"
-        elif level.upper() == "FAIL" or level.upper() == "ERROR":
-            color = "FAIL"
-        elif level.upper() == "SUCCESS":
-            color = "OKGREEN"
-        self._colored_print(formatted_message, color=color)
-        # Hier könnte auch eine Log-Nachricht an eine interne Log-Liste oder Datenbank gesendet werden
+        Die Meldung wird nur in die Log-Pipeline eingereiht; Formatierung, Färbung und Ausgabe
+        übernimmt deren Hintergrund-Thread, damit Request-Threads nicht an stdout warten.
+        """
+        self._status_pipeline().emit(self._component_name, status_message, level)
+
+    def _status_pipeline(self) -> LogPipeline:
+        """Pipeline für report_status; Unterklassen mit eigenen Senken überschreiben dies."""
+        return default_pipeline()
 
 # --- Definition der AbstractCard (jedes Datenobjekt in deinem Metaverse) ---
 class AbstractCard(abc.ABC):
     """
     Basisklasse für alle Datenobjekte im NEET_network_engeneering_exploration_toolkit.
     "Alles ist ein Objekt für sich."
+    Slots statt __dict__: Unterklassen sollten ebenfalls __slots__ deklarieren, um kompakt zu bleiben.
     """
+    __slots__ = ("card_id", "card_type", "data", "_graph_data_ready", "_registry", "__weakref__")
+
     def __init__(self, card_id: str, card_type: str, data: Dict[str, Any]):
         self.card_id = card_id  # Eindeutige ID der Karte
         self.card_type = card_type # Typ der Karte (z.B. "Host", "Port", "DNS_Record", "Website")
         self.data = data # Die eigentlichen Daten der Karte
         self._graph_data_ready = False # Initialer Zustand für den Graphen-Getter
+        self._registry: Optional[CardRegistry] = None # Register, dessen Indizes diese Karte führen
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Umhüllt update() jeder Unterklasse, damit das Karten-Register seine Indizes
+        nach einer Änderung inkrementell nachziehen kann.
+        """
+        super().__init_subclass__(**kwargs)
+        update = cls.__dict__.get("update")
+        if update is not None and not getattr(update, "_reindexes_card", False):
+            @functools.wraps(update)
+            def indexed_update(self, new_data: Dict[str, Any]):
+                result = update(self, new_data)
+                if self._registry is not None:
+                    self._registry.reindex(self)
+                return result
+            indexed_update._reindexes_card = True
+            cls.update = indexed_update
+
+    def attach_registry(self, registry: Optional[CardRegistry]):
+        """Wird vom CardRegistry beim Hinzufügen bzw. Entfernen der Karte gesetzt."""
+        self._registry = registry
 
     @abc.abstractmethod
     def to_dict(self) -> Dict[str, Any]:
@@ -135,17 +176,89 @@ class AbstractCard(abc.ABC):
     def mark_graph_data_ready(self):
         """Setzt ein Flag, das anzeigt, dass Graphen-Daten für diese Karte bereit sind."""
         self._graph_data_ready = True
+        if self._registry is not None:
+            self._registry.graph_changed(self)
+
+    @classmethod
+    def from_stored(cls, card_id: str, card_type: str, data: Dict[str, Any]) -> "AbstractCard":
+        """
+        Baut eine Karte dieser Klasse aus Durga 2 wieder auf (Read-Through nach einer Verdrängung).
+        Standard: ohne den Konstruktor der Unterklasse, nur aus card_id, card_type und data.
+        Unterklassen mit weiterem Zustand überschreiben dies, sonst bleiben ihre Karten resident.
+        """
+        card = cls.__new__(cls)
+        AbstractCard.__init__(card, card_id, card_type, data)
+        return card
+
+    @classmethod
+    def restorable(cls) -> bool:
+        """True, wenn from_stored() Karten dieser Klasse vollständig wiederherstellt."""
+        if getattr(cls, "__abstractmethods__", None):
+            return False
+        if cls.from_stored.__func__ is not AbstractCard.from_stored.__func__:
+            return True
+        # Ohne eigenes from_stored nur, wenn die Unterklassen keinen Zustand über AbstractCard hinaus haben
+        for klass in cls.__mro__[:cls.__mro__.index(AbstractCard)]:
+            if vars(klass).get("__slots__", None) != ():
+                return False
+        return True
+
+    @classmethod
+    def class_path(cls) -> str:
+        """'modul:qualname' der Klasse; wird mit der Karte in Durga 2 gespeichert."""
+        return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def resolve_card_class(class_path: Optional[str]) -> type:
+    """
+    Klasse zu einem in Durga 2 gespeicherten 'modul:qualname'. Es werden nur bereits importierte
+    Module durchsucht (aus der Datenbank wird nichts importiert); ist die Klasse nicht auffindbar
+    oder nicht wiederherstellbar, wird StoredCard verwendet.
+    """
+    if class_path:
+        module_name, _, qualname = class_path.partition(":")
+        target: Any = sys.modules.get(module_name)
+        for name in qualname.split("."):
+            target = getattr(target, name, None)
+        if isinstance(target, type) and issubclass(target, AbstractCard) and target.restorable():
+            return target
+    return StoredCard
+
+
+class StoredCard(AbstractCard):
+    """Karte, die aus Durga 2 geladen wurde und deren ursprüngliche Klasse nicht bekannt ist."""
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"card_id": self.card_id, "card_type": self.card_type, "data": self.data}
+
+    def update(self, new_data: Dict[str, Any]):
+        self.data.update(new_data)
 
 # --- Definition der AbstractPlugin (jede ausführbare Komponente) ---
 class AbstractPlugin(abc.ABC):
     """
     Basisklasse für alle ausführbaren Plugins im NEET_network_engeneering_exploration_toolkit.
     """
+    # Argument-Schema für den gleichnamigen Befehl; None = ein optionales Freitext-Argument 'input'
+    command_arguments: Optional[List[CommandArgument]] = None
+    # Ausführung durch den PluginRunner: INLINE im Thread des Aufrufers (mit Zugriff auf core_context)
+    # oder PROCESS im Worker-Pool für CPU-lastige Plugins (picklebar, ohne core_context im Worker)
+    execution_mode: str = INLINE
+    max_concurrency: Optional[int] = None # Gleichzeitige Aufrufe dieses Plugins; None = unbegrenzt
+    timeout: Optional[float] = None # Zeitlimit pro Aufruf in Sekunden; None = keins
+
     def __init__(self, plugin_name: str, description: str):
         self.plugin_name = plugin_name
         self.description = description
         self.core_context = None # Wird vom CoreContextManager gesetzt
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Der CoreContextManager bleibt im Hauptprozess; im Worker-Prozess ist core_context None
+        state = self.__dict__.copy()
+        state["core_context"] = None
+        return state
+
     def set_core_context(self, core_context: 'CoreContextManager'):
         """Setzt den CoreContextManager für das Plugin."""
         self.core_context = core_context
@@ -166,6 +279,25 @@ class CoreContextManager(SystemSphereBase): # Erbt jetzt von SystemSphereBase
     _component_name = "CoreContextManager"
     _component_type = "ZNSCore"
     _component_version = "0.2.1" # Version aktualisiert
+    _log_capacity = 10000 # Maximale Anzahl gehaltener Log-Einträge (Ringpuffer)
+    _scan_workers = 8 # Größe des Worker-Pools der ScanJobEngine
+    _scan_per_target_limit = 1 # Gleichzeitige Scans pro Ziel
+    _command_workers = 8 # Worker-Pool für Befehls-Batches (execute_command_batch)
+    _plugin_processes = 2 # Prozess-Pool für Plugins mit execution_mode PROCESS
+    _card_index_fields = ("ip", "target_ip", "hostname", "cve_id") # Hash-Indizes auf card.data
+    _card_range_fields = ("port", "value") # Bereichs-Indizes auf numerische Felder in card.data
+    _card_cache_max_bytes = 256 * 1024 * 1024 # Budget für im Speicher gehaltene Karten (geschätzt)
+    _card_cache_ttl: Optional[float] = None # Optionale Lebensdauer von Karten im Cache in Sekunden
+    _journal_file = "journal.bin" # Ereignis-Journal, liegt im Verzeichnis der Durga-2-Datenbank
+    _journal_checkpoint_interval = 1024 # Sätze zwischen zwei Checkpoints des Journals
+    # Level-Filter der Senken von report_status: Konsole, LogStore (+ Durga 2) und Journal
+    _status_console_level = "DEBUG"
+    _status_log_level = "WARNING" # Eigene Meldungen des Kerns
+    _component_log_level = "DEBUG" # Meldungen der übrigen Komponenten (SystemSphereBase), wie bisher alle Level
+    _status_journal_level = "ERROR"
+    _status_event_level = "INFO" # Ab diesem Level erscheinen Statusmeldungen im Live-Feed (EventBus)
+    _event_history = 4096 # Ereignisse, ab denen Live-Feed-Clients nach einem Reconnect wieder aufsetzen können
+    _event_queue_size = 1024 # Warteschlange pro Live-Feed-Client (älteste werden verworfen)
 
     def __new__(cls):
         """
@@ -185,25 +317,56 @@ class CoreContextManager(SystemSphereBase): # Erbt jetzt von SystemSphereBase
         if not self._initialized:
             super().__init__() # Initialisiere die SystemSphereBase
             self.core_context: Dict[str, Any] = {} # Das zentrale Daten-Dictionary
-            self.cards: Dict[str, AbstractCard] = {} # Alle AbstractCard-Instanzen nach ID
+            # Arbeitsmenge der Karten: der Cache begrenzt, was resident bleibt, das Register indiziert es
+            self.card_cache = CardCache(self._card_cache_max_bytes, ttl=self._card_cache_ttl,
+                                        on_evict=self._on_card_evicted)
+            self.graph = CardGraph() # Gesamtgraph über alle Karten, inkrementell gepflegt
+            self.cards = CardRegistry(self._card_index_fields, self._card_range_fields,
+                                      on_change=self._on_card_changed,
+                                      on_graph_change=self._on_card_graph_changed) # Residente AbstractCard-Instanzen nach ID, indiziert
             self.plugins: Dict[str, AbstractPlugin] = {} # Alle AbstractPlugin-Instanzen nach Name
+            self.plugin_runner = PluginRunner(processes=self._plugin_processes) # Führt AbstractPlugin.run aus
+            self.commands = CommandRegistry() # Verben des Kerns und der Plugins
+            self._command_pool = ThreadPoolExecutor(max_workers=self._command_workers, thread_name_prefix="command-worker")
+            self._register_core_commands()
             self.active_frontend_type: Optional[str] = None # "pywebview" oder "tkinter"
-            self.db_connection: Optional[Any] = None # Verbindung zu Durga 2 (SQLAlchemy ORM)
+            self.db_connection: Optional[DurgaStore] = None # Verbindung zu Durga 2 (SQLite, Write-Behind)
+            self.journal: Optional[EventJournal] = None # Hashverkettetes Ereignis-Journal (neben Durga 2)
             self._initialized = True # Markiert die Initialisierung als abgeschlossen
-            self.report_status(f"CoreContextManager (Jan) initialisiert als {self._component_type}.", "INFO")
             
-            self._system_status = {"initialized": False, "running": False, "message": "System not initialized."}
-            self._logs: List[Dict[str, Any]] = [] # Einfache In-Memory-Logs
+            self._system_status = {"initialized": False, "running": False, "message": "System not initialized.",
+                                   "storage_error": None} # Letzter Schreibfehler von Durga 2, solange er anhält
+            # Versionszähler je Sammlung (aus einer gemeinsamen, monotonen Folge): Grundlage für ETags
+            # und den Antwort-Cache der API; jede Änderung einer Sammlung vergibt ihr eine neue Nummer
+            self._version_counter = itertools.count(1)
+            self._versions: Dict[str, int] = {"system": 0, "logs": 0, "scan_results": 0, "journal": 0, "cards": 0}
+            self._logs = LogStore(capacity=self._log_capacity) # Begrenzter, indizierter In-Memory-Log
+            # Live-Feed für Frontends: Logs, Scan-Jobs, Karten und Status als inkrementelle Ereignisse
+            self.events = EventBus(history=self._event_history, max_queue=self._event_queue_size)
+            # report_status reiht nur ein; ein Hintergrund-Thread verteilt an Konsole, LogStore, Journal und Live-Feed
+            self.status_pipeline = LogPipeline([
+                ConsoleSink(self._status_console_level),
+                # Eine Senke für beide Log-Level, damit die Reihenfolge im Log der Meldereihenfolge entspricht
+                CallbackSink(self._log_status_record, min(self._status_log_level, self._component_log_level, key=level_number)),
+                CallbackSink(self._journal_status_record, self._status_journal_level),
+                CallbackSink(self._publish_status_record, self._status_event_level),
+            ], name="ccm-status-pipeline")
+            self.report_status(f"CoreContextManager (Jan) initialisiert als {self._component_type}.", "INFO")
             self._devices: List[Dict[str, Any]] = [] # Simulierte Geräte
             self._scan_results: List[Dict[str, Any]] = [] # Simulierte Scan-Ergebnisse
+            self._scan_timestamps: List[float] = [] # Parallel zu _scan_results, für die 'since'-Suche
+            self._scan_lock = threading.Lock() # Scan-Ergebnisse werden aus den Scan-Workern geschrieben
+            self.scan_jobs = ScanJobEngine(self._run_scan_job, max_workers=self._scan_workers,
+                                           per_target_limit=self._scan_per_target_limit,
+                                           on_update=self._publish_scan_job)
             self._initialize_dummy_data() # Dummy-Daten laden
 
     def _initialize_dummy_data(self):
         """Initialisiert simulierte Daten für Demonstrationszwecke."""
-        self._logs.append({"timestamp": time.time(), "level": "INFO", "message": "NEET-OS Core gestartet."})
+        self.log_system_event(self._component_name, "NEET-OS Core gestartet.", "INFO")
         self._devices.append({"id": "dev_001", "name": "Simulated Router", "ip": "192.168.1.1", "os": "OpenWrt"})
         self._devices.append({"id": "dev_002", "name": "Simulated Server", "ip": "192.168.1.10", "os": "Ubuntu"})
-        self._scan_results.append({
+        self._add_scan_result({
             "id": "scan_001",
             "scan_type": "network",
             "target": "192.168.1.0/24",
@@ -226,6 +389,7 @@ class CoreContextManager(SystemSphereBase): # Erbt jetzt von SystemSphereBase
             self.add_plugin(self._DummyWebFetcher("DummyWebFetcher", "Simulierter Web Fetcher"))
             self.add_plugin(self._DummyDOMParser("DummyDOMParser", "Simulierter DOM Parser"))
             # ... weitere Module laden und hinzufügen ...
+            self._warm_plugin_runner()
 
             # Verbinde zu Durga 2 (ORM-Anbindung)
             self.connect_to_durga2()
@@ -233,10 +397,12 @@ class CoreContextManager(SystemSphereBase): # Erbt jetzt von SystemSphereBase
             self._system_status["initialized"] = True
             self._system_status["running"] = True
             self._system_status["message"] = "NEET-OS Core initialisiert und läuft."
+            self._touch("system")
             self.report_status("NEET-OS Core erfolgreich initialisiert.", "SUCCESS")
             return True
         except Exception as e:
             self._system_status["message"] = f"Initialisierungsfehler: {e}"
+            self._touch("system")
             self.report_status(f"Fehler bei der Systeminitialisierung: {e}", "FAIL")
             return False
 
@@ -250,43 +416,170 @@ class CoreContextManager(SystemSphereBase): # Erbt jetzt von SystemSphereBase
             # Annahme: Plugins haben keine shutdown_component, aber könnten sie haben
             self.report_status(f"Plugin '{name}' heruntergefahren.", "INFO")
         
+        self.scan_jobs.shutdown(wait=True) # Laufende Scans abschließen, keine neuen annehmen
+        self._command_pool.shutdown(wait=True)
+        self.plugin_runner.shutdown(wait=True)
+        self.status_pipeline.flush(timeout=5.0) # Ausstehende Meldungen noch ins Journal schreiben
         self.close_db_connection() # Datenbankverbindung schließen
 
         self._system_status["running"] = False
         self._system_status["message"] = "NEET-OS Core heruntergefahren."
+        self._touch("system")
         self.report_status("NEET-OS Core erfolgreich heruntergefahren.", "SUCCESS")
+        self.status_pipeline.flush(timeout=5.0)
         return True
 
+    def _status_pipeline(self) -> LogPipeline:
+        return self.status_pipeline
+
+    def _log_status_record(self, record: tuple):
+        """
+        Senke der Status-Pipeline: übernimmt Statusmeldungen in den System-Log (und Durga 2).
+        Eigene Meldungen ab _status_log_level, die anderer Komponenten ab _component_log_level.
+        """
+        timestamp, level, component, message = record
+        min_level = self._status_log_level if component == self._component_name else self._component_log_level
+        if level_number(level) >= level_number(min_level):
+            self._append_log(component, message, level, timestamp)
+
+    def _journal_status_record(self, record: tuple):
+        timestamp, level, component, message = record
+        self.record_event("status", {"level": level.upper(), "message": message, "reported_at": timestamp}, component)
+
+    def _publish_status_record(self, record: tuple):
+        timestamp, level, component, message = record
+        self.events.publish("status", {"level": level.upper(), "component": component, "message": message,
+                                       "time": format_timestamp(timestamp)})
+
+    def _publish_scan_job(self, job: ScanJob):
+        """Fortschritt eines Scan-Jobs für den Live-Feed (ohne das vollständige Ergebnis)."""
+        self.events.publish("scan_job", {"job_id": job.job_id, "batch_id": job.batch_id, "target": job.target,
+                                         "scan_type": job.scan_type, "status": job.status,
+                                         "progress": job.progress, "error": job.error})
+
     def add_card(self, card: AbstractCard):
         """Fügt eine AbstractCard zum globalen Kontext hinzu und speichert sie in Durga 2."""
         if card.card_id in self.cards:
             self.report_status(f"Warnung: Karte mit ID '{card.card_id}' existiert bereits. Wird überschrieben.", "WARNING")
-        self.cards[card.card_id] = card
-        # Hier würde die Logik zum Speichern der Karte in Durga 2 (ORM) hinkommen
-        # z.B. self.db_connection.session.add(card.to_orm_model())
+        self.cards.add(card) # Pflegt Indizes, persistiert und cached über _on_card_changed
         self.report_status(f"Karte '{card.card_type}' mit ID '{card.card_id}' hinzugefügt.", "INFO")
 
     def get_card(self, card_id: str) -> Optional[AbstractCard]:
         """Ruft eine AbstractCard anhand ihrer ID ab (aus dem Kontext oder Durga 2)."""
+        card = self.card_cache.get(card_id)
+        if card is not None:
+            return card
         card = self.cards.get(card_id)
+        if not card and self.db_connection is not None:
+            # Read-Through: Karte aus Durga 2 laden und wieder in den Kontext aufnehmen
+            stored = self.db_connection.load_card(card_id)
+            if stored is not None:
+                card_class = resolve_card_class(stored["card_class"])
+                card = card_class.from_stored(stored["card_id"], stored["card_type"], stored["data"])
+                card._graph_data_ready = stored["graph_ready"]
+                self.cards.add(card, notify=False)
         if not card:
-            # Hier würde die Logik zum Abrufen der Karte aus Durga 2 (ORM) hinkommen
-            # z.B. card = self.db_connection.session.query(CardModel).filter_by(id=card_id).first()
-            self.report_status(f"Karte mit ID '{card_id}' nicht im In-Memory-Kontext gefunden. (Würde aus DB geladen)", "INFO")
+            self.report_status(f"Karte mit ID '{card_id}' weder im Kontext noch in Durga 2 gefunden.", "INFO")
+            return None
+        self.card_cache.put(card)
         return card
 
+    def pin_card(self, card_id: str) -> Optional[AbstractCard]:
+        """Hält eine Karte resident (z.B. solange die UI sie anzeigt), bis unpin_card aufgerufen wird."""
+        self.card_cache.pin(card_id)
+        return self.get_card(card_id)
+
+    def unpin_card(self, card_id: str):
+        self.card_cache.unpin(card_id)
+
+    def _on_card_changed(self, card: AbstractCard):
+        """Write-Through: neue oder geänderte Karten nach Durga 2 einreihen und im Cache auffrischen."""
+        if self.db_connection is not None:
+            self.db_connection.save_card(card.card_id, card.card_type, card.data, type(card).class_path(),
+                                         card._graph_data_ready)
+        data_hash = blake2b_hex(card.data)
+        self.record_event("card_changed", {"card_id": card.card_id, "card_type": card.card_type, "data_hash": data_hash})
+        self.events.publish("card", {"card_id": card.card_id, "card_type": card.card_type, "data_hash": data_hash})
+        if self.cards.get(card.card_id) is card:
+            self.card_cache.put(card)
+        self.graph.mark_dirty(card)
+        self._touch("cards")
+
+    def _on_card_graph_changed(self, card: AbstractCard):
+        """Graphen-Daten einer Karte wurden bereit: Graph nachziehen und das Flag in Durga 2 festhalten."""
+        if self.db_connection is not None:
+            self.db_connection.save_card(card.card_id, card.card_type, card.data, type(card).class_path(),
+                                         card._graph_data_ready)
+        self.graph.mark_dirty(card)
+
+    def get_graph(self, since: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Gibt den Kartengraphen zurück: ohne 'since' vollständig, sonst nur die Änderungen
+        seit dieser Version (added/updated/removed für Knoten und Kanten).
+        """
+        return self.graph.snapshot() if since is None else self.graph.diff(since)
+
+    def _on_card_evicted(self, card: AbstractCard):
+        """
+        Verdrängte Karten verlassen den Arbeitsspeicher, sofern Durga 2 sie nachladen kann. Karten,
+        deren Klasse sich daraus nicht vollständig wiederherstellen lässt (oder ohne Durga 2), bleiben
+        im Register und werden dem Cache als resident zurückgegeben, damit sie gegen sein Budget zählen.
+        """
+        if self.db_connection is not None and type(card).restorable():
+            self.cards.remove(card.card_id, detach=False)
+        elif self.cards.get(card.card_id) is card:
+            self.card_cache.retain(card)
+
+    def find_cards(self, card_type: Optional[str] = None, where: Optional[Dict[str, Any]] = None,
+                   ranges: Optional[Dict[str, tuple]] = None, limit: Optional[int] = None) -> List[AbstractCard]:
+        """
+        Sucht Karten über die Indizes des Karten-Registers, z.B.
+        find_cards("OSI_Security", where={"target_ip": "10.0.0.5"}) oder find_cards(ranges={"port": (1, 1024)}).
+        Durchsucht die residente Arbeitsmenge; aus dem Cache verdrängte Karten liegen nur noch in Durga 2.
+        """
+        return self.cards.query(card_type=card_type, where=where, ranges=ranges, limit=limit)
+
     def add_plugin(self, plugin: AbstractPlugin):
         """Fügt ein AbstractPlugin zum Manager hinzu und setzt seinen Kontext."""
+        if plugin.execution_mode not in EXECUTION_MODES:
+            raise ValueError(f"Plugin '{plugin.plugin_name}': unbekannter Ausführungsmodus '{plugin.execution_mode}' "
+                             f"(erlaubt: {', '.join(EXECUTION_MODES)}).")
         if plugin.plugin_name in self.plugins:
             self.report_status(f"Warnung: Plugin '{plugin.plugin_name}' existiert bereits. Wird überschrieben.", "WARNING")
         plugin.set_core_context(self) # Übergibt den CoreContextManager an das Plugin
         self.plugins[plugin.plugin_name] = plugin
-        self.report_status(f"Plugin '{plugin.plugin_name}' hinzugefügt.", "INFO")
+        self._register_plugin_command(plugin)
+        self.report_status(f"Plugin '{plugin.plugin_name}' hinzugefügt ({plugin.execution_mode}).", "INFO")
 
     def get_plugin(self, plugin_name: str) -> Optional[AbstractPlugin]:
         """Ruft ein AbstractPlugin anhand seines Namens ab."""
         return self.plugins.get(plugin_name)
 
+    def run_plugin(self, plugin_name: str, arguments: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Führt ein Plugin über den PluginRunner in seinem Ausführungsmodus aus und gibt das Ergebnis zurück.
+        Löst KeyError für unbekannte Plugins und PluginExecutionError bei Fehlern im Worker, Timeout oder Abbruch aus.
+        """
+        return self.plugin_runner.run(self.plugins[plugin_name], arguments, timeout)
+
+    def submit_plugin(self, plugin_name: str, arguments: Dict[str, Any], timeout: Optional[float] = None) -> PluginTask:
+        """Wie run_plugin, aber asynchron; der PluginTask liefert das Ergebnis und kann abgebrochen werden."""
+        return self.plugin_runner.submit(self.plugins[plugin_name], arguments, timeout)
+
+    def _warm_plugin_runner(self):
+        """Startet den Prozess-Pool vorab, wenn Plugins ihn brauchen, und lässt die Worker deren Module laden.
+        Ein Fehlschlag wird nur gemeldet: die Initialisierung läuft weiter."""
+        modules = sorted({type(plugin).__module__ for plugin in self.plugins.values() if plugin.execution_mode == PROCESS})
+        if not modules:
+            return
+        try:
+            self.plugin_runner.start(preload=modules)
+        except PluginExecutionError as e: # INLINE-Plugins und Durga 2 sind davon nicht betroffen
+            self.report_status(f"Plugin-Prozess-Pool konnte nicht vorab gestartet werden: {e} "
+                               f"(PROCESS-Plugins versuchen es beim nächsten Aufruf erneut).", "WARNING")
+            return
+        self.report_status(f"Plugin-Prozess-Pool gestartet ({self._plugin_processes} Worker).", "INFO")
+
     def set_active_frontend(self, frontend_type: str):
         """Setzt den Typ des aktuell aktiven Frontends."""
         if frontend_type not in ["pywebview", "tkinter", "flask_json_canvas"]: # "flask_json_canvas" hinzugefügt
@@ -296,87 +589,311 @@ class CoreContextManager(SystemSphereBase): # Erbt jetzt von SystemSphereBase
 
     def connect_to_durga2(self, db_path: str = "db/durga2.sqlite"):
         """
-        Stellt eine Verbindung zu Durga 2 her (SQLAlchemy ORM-Anbindung).
-        (Platzhalter-Implementierung, später durch deine echte SQLAlchemy-Logik ersetzen)
+        Stellt eine Verbindung zu Durga 2 her: SQLite im WAL-Modus mit Verbindungs-Pool.
+        Karten, Logs und Scan-Ergebnisse werden über eine Write-Behind-Queue in Batches geschrieben.
         """
+        if self.db_connection is not None:
+            return
         try:
-            # Hier würde die SQLAlchemy-Engine und Session-Setup hinkommen
-            # import sqlalchemy
-            # from sqlalchemy.orm import sessionmaker
-            # self.db_engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
-            # self.Session = sessionmaker(bind=self.db_engine)
-            # self.db_connection = self.Session() # Dies wäre die Session
-            self.db_connection = f"Simulierte SQLAlchemy-Verbindung zu {db_path}" # Dummy-Verbindung
-            self.report_status(f"Verbunden mit Durga 2 Datenbank (simuliert): {db_path}", "OKGREEN")
+            self.db_connection = DurgaStore(db_path, on_error=self._on_durga_write_error)
+            self.report_status(f"Verbunden mit Durga 2 Datenbank: {db_path}", "OKGREEN")
         except Exception as e:
             self.report_status(f"Fehler beim Verbinden mit Durga 2: {e}", "FAIL")
+            return
+        journal_path = os.path.join(os.path.dirname(db_path), self._journal_file)
+        try:
+            self.journal = EventJournal(journal_path, checkpoint_interval=self._journal_checkpoint_interval)
+            self.record_event("journal_opened", {"db_path": db_path}, self._component_name)
+        except (OSError, ValueError) as e:
+            self.report_status(f"Fehler beim Öffnen des Journals '{journal_path}': {e}", "FAIL")
 
     def close_db_connection(self):
         """Schließt die Verbindung zu Durga 2."""
         if self.db_connection:
-            # if hasattr(self.db_connection, 'close'): self.db_connection.close()
-            self.db_connection = None
-            self.report_status("Verbindung zu Durga 2 geschlossen (simuliert).", "INFO")
+            store, self.db_connection = self.db_connection, None
+            store.close() # Schreibt ausstehende Batches vor dem Schließen
+            self.report_status("Verbindung zu Durga 2 geschlossen.", "INFO")
+        if self.journal is not None:
+            journal, self.journal = self.journal, None
+            journal.checkpoint() # Beim nächsten Start verifiziert verify() nur noch neue Sätze
+            journal.close()
+
+    def _on_durga_write_error(self, error: Optional[str]) -> None:
+        """Vom Writer-Thread von Durga 2: Schreibfehler beginnen (Meldung) oder sind behoben (None)."""
+        self._system_status["storage_error"] = error
+        self._touch("system")
+        if error is None:
+            self.report_status("Durga 2 schreibt wieder.", "SUCCESS")
+        else:
+            self.report_status(f"Durga 2 kann nicht schreiben (Karten werden wiederholt, Logs verworfen): {error}", "ERROR")
+
+    def record_event(self, event_type: str, data: Any = None, component: Optional[str] = None) -> Optional[int]:
+        """Schreibt ein Ereignis ins hashverkettete Journal; gibt die Sequenznummer zurück (None ohne Journal)."""
+        if self.journal is None:
+            return None
+        seq = self.journal.append(event_type, data, component=component or self._component_name)
+        self._touch("journal")
+        return seq
 
-    def get_system_status(self) -> Dict[str, Any]:
-        """Gibt den aktuellen Systemstatus zurück."""
-        return self._system_status
+    def _touch(self, collection: str) -> None:
+        """Markiert eine Sammlung als geändert (next() auf itertools.count ist unter dem GIL atomar)."""
+        self._versions[collection] = next(self._version_counter)
 
-    def get_system_logs(self) -> List[Dict[str, Any]]:
-        """Gibt die gesammelten System-Logs zurück."""
-        # In einer realen App würden Logs aus einer DB oder einem zentralen Log-System kommen
-        return self._logs
+    def get_versions(self) -> Dict[str, int]:
+        """
+        Aktuelle Versionen der Sammlungen (system, logs, scan_results, journal, cards).
+        'status' deckt get_system_status(include_runtime_stats=False) ab, also Status und Journal.
+        """
+        versions = dict(self._versions)
+        versions["status"] = max(versions["system"], versions["journal"])
+        return versions
+
+    def get_blockchain_data(self, limit: int = 100, since_seq: Optional[int] = None,
+                            since: Optional[float] = None, verify: bool = False) -> Dict[str, Any]:
+        """
+        Gibt die Einträge des hashverketteten Journals zurück (älteste zuerst): ohne Filter die letzten
+        'limit', sonst ab Sequenznummer 'since_seq' bzw. UTC-Zeitstempel 'since'.
+        Mit verify=True wird die Kette ab dem letzten Checkpoint nachgerechnet.
+        """
+        if self.journal is None:
+            return {"head": None, "blocks": [], "verification": None}
+        if since_seq is None and since is None:
+            blocks = self.journal.tail(limit)
+        else:
+            blocks = self.journal.read(since_seq or 0, limit=limit, since=since)
+        return {"head": self.journal.head, "blocks": blocks,
+                "verification": self.journal.verify() if verify else None}
+
+    def get_system_status(self, include_runtime_stats: bool = True) -> Dict[str, Any]:
+        """
+        Gibt den aktuellen Systemstatus zurück.
+        Mit include_runtime_stats=False nur die versionierten Teile (Status und Journal), deren Änderungen
+        get_versions()["status"] erfasst; nur diese Form darf unter einem starken ETag gecacht werden.
+        """
+        status = dict(self._system_status)
+        status["journal"] = self.journal.get_stats() if self.journal is not None else None
+        if include_runtime_stats:
+            status.update(self.get_runtime_stats())
+        return status
+
+    def get_runtime_stats(self) -> Dict[str, Any]:
+        """Laufzeit-Statistiken der Komponenten; sie ändern sich ohne _touch (Zähler, Warteschlangen) und werden nie gecacht."""
+        return {
+            "durga2": self.db_connection.get_stats() if self.db_connection is not None else None,
+            "card_cache": self.card_cache.get_stats(),
+            "graph": self.graph.get_stats(),
+            "status_pipeline": self.status_pipeline.get_stats(),
+            "events": self.events.get_stats(),
+            "plugin_runner": self.plugin_runner.get_stats(),
+        }
+
+    def log_system_event(self, component: str, message: str, level: str = "INFO") -> int:
+        """Schreibt einen Eintrag in den System-Log und gibt seine Sequenznummer zurück."""
+        return self._append_log(component, message, level)
+
+    def _append_log(self, component: str, message: str, level: str, timestamp: Optional[float] = None) -> int:
+        if timestamp is None:
+            timestamp = time.time()
+        seq = self._logs.append(level, message, component=component, timestamp=timestamp)
+        if self.db_connection is not None:
+            self.db_connection.save_log(seq, timestamp, level.upper(), component, message)
+        self._touch("logs")
+        self.events.publish("log", {"seq": seq, "timestamp": timestamp, "time": format_timestamp(timestamp),
+                                    "level": level.upper(), "component": component, "message": message})
+        return seq
+
+    def get_system_logs(self, since: Optional[float] = None, until: Optional[float] = None, level: Optional[str] = None,
+                        limit: Optional[int] = None, cursor: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Gibt die gesammelten System-Logs zurück (älteste zuerst).
+        Alle Filter sind optional; 'cursor' ist die Sequenznummer ('seq'), ab der gelesen wird.
+        """
+        entries, _ = self._logs.query(since=since, until=until, level=level, limit=limit, cursor=cursor)
+        return entries
+
+    def query_system_logs(self, since: Optional[float] = None, until: Optional[float] = None, level: Optional[str] = None,
+                          limit: Optional[int] = None, cursor: Optional[int] = None,
+                          tail: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Wie get_system_logs, liefert aber zusätzlich den Cursor für die nächste Seite (auch bei leeren,
+        nach Level gefilterten Seiten korrekt). Mit 'tail' kommt die neueste statt der ältesten Seite.
+        """
+        return self._logs.query(since=since, until=until, level=level, limit=limit, cursor=cursor, tail=tail)
 
     def get_devices(self) -> List[Dict[str, Any]]:
         """Gibt simulierte Netzwerkgeräte zurück."""
         return self._devices
 
-    def get_scan_results(self) -> List[Dict[str, Any]]:
-        """Gibt simulierte Scan-Ergebnisse zurück."""
-        return self._scan_results
-
-    def execute_system_command(self, command: str) -> Dict[str, Any]:
+    def _add_scan_result(self, scan: Dict[str, Any]) -> None:
+        """Speichert ein Scan-Ergebnis; Zeitstempel werden einmalig beim Schreiben formatiert."""
+        with self._scan_lock:
+            timestamp = scan.setdefault("timestamp", time.time())
+            if self._scan_timestamps and timestamp < self._scan_timestamps[-1]:
+                timestamp = scan["timestamp"] = self._scan_timestamps[-1] # Monoton halten für die Bisektion
+            scan["time"] = format_timestamp(timestamp)
+            scan["seq"] = len(self._scan_results) # Position in der Liste, dient als Cursor
+            self._scan_results.append(scan)
+            self._scan_timestamps.append(timestamp)
+            self._touch("scan_results")
+        if self.db_connection is not None:
+            self.db_connection.save_scan_result(scan)
+        self.record_event("scan_result", {"id": scan.get("id"), "seq": scan["seq"], "status": scan.get("status"),
+                                          "data_hash": blake2b_hex(scan)})
+
+    def get_scan_results(self, since: Optional[float] = None, offset: int = 0,
+                         limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Gibt simulierte Scan-Ergebnisse zurück (älteste zuerst).
+        'offset' ist die Position ('seq') in der Ergebnisliste und dient als Cursor für die nächste Seite.
+        """
+        start = max(offset, 0)
+        if since is not None:
+            start = max(start, bisect.bisect_left(self._scan_timestamps, since))
+        stop = len(self._scan_results) if limit is None else start + limit
+        return self._scan_results[start:stop]
+
+    def execute_system_command(self, command: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Verarbeitet einen Befehl, der vom Frontend oder anderen Quellen kommt.
-        Dies ist die "Chainmodule"-Logik.
+        Dies ist die "Chainmodule"-Logik; die Auflösung übernimmt die CommandRegistry.
+        :param params: Optionale, bereits strukturierte Argumente (z.B. aus /api/modules/execute).
         """
         self.report_status(f"Empfange Befehl: '{command}'", "OKBLUE")
-        self._logs.append({"timestamp": time.time(), "level": "COMMAND", "message": f"Executing: {command}"})
-
-        if command.lower() == "list devices":
-            return {"status": "success", "message": "Simulierte Geräte gelistet.", "data_type": "devices", "payload": self.get_devices()}
-        elif command.lower() == "show logs":
-            return {"status": "success", "message": "System-Logs angezeigt.", "data_type": "logs", "payload": self.get_system_logs()}
-        elif command.lower().startswith("scan "):
-            target = command.split(" ", 1)[1]
-            # Simulierte Scan-Logik
-            new_scan = {
-                "id": f"scan_{int(time.time())}",
-                "scan_type": "quick_scan",
-                "target": target,
-                "status": "completed",
-                "results": [f"Simulierter Port 80 offen auf {target}", f"Simulierter Ping zu {target} erfolgreich"]
-            }
-            self._scan_results.append(new_scan)
-            self._logs.append({"timestamp": time.time(), "level": "INFO", "message": f"Simulierter Scan auf {target} abgeschlossen."})
-            return {"status": "success", "message": f"Scan auf {target} abgeschlossen.", "data_type": "scan_results", "payload": new_scan}
-        elif command.lower() == "clear logs":
-            self._logs = [{"timestamp": time.time(), "level": "INFO", "message": "Logs durch Benutzer gelöscht."}]
-            return {"status": "success", "message": "Logs gelöscht.", "data_type": "logs", "payload": self.get_system_logs()}
-        elif command.lower() == "help":
-            help_message = [
-                "Verfügbare Befehle:",
-                "  list devices    - Zeigt simulierte Netzwerkgeräte.",
-                "  show logs       - Zeigt System-Logs.",
-                "  scan <Ziel>     - Startet einen simulierten Netzwerk-Scan (z.B. 'scan 192.168.1.1').",
-                "  clear logs      - Löscht die System-Logs.",
-                "  help            - Zeigt diese Hilfe an."
-            ]
-            self._logs.extend([{"timestamp": time.time(), "level": "INFO", "message": msg} for msg in help_message])
-            return {"status": "success", "message": "Hilfe angezeigt.", "data_type": "logs", "payload": self.get_system_logs()}
+        self.log_system_event(self._component_name, f"Executing: {command}", "COMMAND")
+
+        try:
+            result = self.commands.dispatch(command, params)
+        except CommandError as e:
+            self.log_system_event(self._component_name, f"Ungültiger Befehl '{command}': {e}", "ERROR")
+            result = {"status": "error", "message": str(e), "data_type": "error", "payload": {}}
+        if result is None:
+            self.log_system_event(self._component_name, f"Unbekannter Befehl: '{command}'", "ERROR")
+            result = {"status": "error", "message": f"Unbekannter Befehl: '{command}'.", "data_type": "error", "payload": {}}
+        # Jede Manipulation wird belegbar festgehalten: Befehl, Argumente und Ergebnisstatus
+        self.record_event("command", {"command": command, "params": params, "status": result.get("status")})
+        return result
+
+    def execute_command_batch(self, commands: List[Any], max_parallel: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Führt mehrere Befehle aus, optional mit Abhängigkeiten ('depends_on'); siehe command_batch.parse_batch.
+        Der Batch wird sofort geprüft (ValueError bei unbekannten IDs, Zyklen oder ungültigem 'max_parallel'), die Ergebnisse
+        kommen danach in Abschlussreihenfolge, jeweils mit Startzeit und Dauer.
+        """
+        batch = parse_batch(commands)
+        check_max_parallel(max_parallel)
+        return run_batch(batch, self.execute_system_command, self._command_pool, max_parallel)
+
+    def _register_core_commands(self):
+        """Registriert die eingebauten Verben des Kerns in der CommandRegistry."""
+        self.commands.register("list devices", self._cmd_list_devices, help_text="Zeigt simulierte Netzwerkgeräte.")
+        self.commands.register("show logs", self._cmd_show_logs, help_text="Zeigt System-Logs.")
+        self.commands.register("scan", self._cmd_scan,
+                               [CommandArgument("target", greedy=True, metavar="Ziel")],
+                               help_text="Reiht einen simulierten Netzwerk-Scan ein (z.B. 'scan 192.168.1.1').")
+        self.commands.register("scan bulk", self._cmd_scan_bulk,
+                               [CommandArgument("targets", greedy=True, metavar="Ziele")],
+                               help_text="Reiht einen Scan pro Host ein (z.B. 'scan bulk 10.0.0.0/16 !10.0.5.0/24').")
+        self.commands.register("scan status", self._cmd_scan_status,
+                               [CommandArgument("job_id", metavar="Job-/Batch-ID")],
+                               help_text="Zeigt Status und Fortschritt eines Scan-Jobs oder Batches.")
+        self.commands.register("scan jobs", self._cmd_scan_jobs, help_text="Listet aktive und zuletzt beendete Scan-Jobs.")
+        self.commands.register("clear logs", self._cmd_clear_logs, help_text="Löscht die System-Logs.")
+        self.commands.register("help", self._cmd_help, help_text="Zeigt diese Hilfe an.")
+
+    def _cmd_list_devices(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "success", "message": "Simulierte Geräte gelistet.", "data_type": "devices", "payload": self.get_devices()}
+
+    def _cmd_show_logs(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "success", "message": "System-Logs angezeigt.", "data_type": "logs", "payload": self.get_system_logs()}
+
+    def _cmd_scan(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        target_set = self._parse_targets(arguments["target"])
+        if len(target_set) != 1:
+            # Netze, Bereiche und Listen werden dedupliziert und als Job pro Host eingereiht
+            return self._cmd_scan_bulk({"targets": target_set})
+        target = next(iter(target_set))
+        job_id = self.scan_jobs.submit(target)
+        return {"status": "success", "message": f"Scan auf {target} eingereiht (Job {job_id}).",
+                "data_type": "scan_job", "payload": self.scan_jobs.get_job(job_id)}
+
+    def _cmd_scan_bulk(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        targets = arguments["targets"]
+        if not isinstance(targets, TargetSet):
+            targets = self._parse_targets(targets)
+        batch_id = self.scan_jobs.submit_many(targets, per_host=True)
+        batch = self.scan_jobs.get_batch(batch_id)
+        return {"status": "success", "message": f"Sammel-Scan über {batch['total']} Ziel(e) eingereiht (Batch {batch_id}).",
+                "data_type": "scan_batch", "payload": batch}
+
+    @staticmethod
+    def _parse_targets(specs: Union[str, List[str]]) -> TargetSet:
+        """Wertet Ziel-Specs (Adressen, Netze, Bereiche, '!'-Ausschlüsse) als TargetSet aus."""
+        try:
+            return TargetSet.from_specs([specs] if isinstance(specs, str) else specs)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+    def _cmd_scan_status(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = arguments["job_id"]
+        if job_id.startswith("batch_"):
+            info, data_type = self.scan_jobs.get_batch(job_id), "scan_batch"
         else:
-            self._logs.append({"timestamp": time.time(), "level": "ERROR", "message": f"Unbekannter Befehl: '{command}'"})
-            return {"status": "error", "message": f"Unbekannter Befehl: '{command}'.", "data_type": "error", "payload": {}}
+            info, data_type = self.scan_jobs.get_job(job_id), "scan_job"
+        if info is None:
+            return {"status": "error", "message": f"Unbekannter Scan-Job '{job_id}'.", "data_type": "error", "payload": {}}
+        return {"status": "success", "message": f"Status von {job_id}: {info['status']}.", "data_type": data_type, "payload": info}
+
+    def _cmd_scan_jobs(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "success", "message": "Scan-Jobs gelistet.", "data_type": "scan_jobs",
+                "payload": {"stats": self.scan_jobs.get_stats(), "jobs": self.scan_jobs.list_jobs()}}
+
+    def _run_scan_job(self, job: ScanJob, report_progress) -> Dict[str, Any]:
+        """Führt einen (simulierten) Scan in einem Worker der ScanJobEngine aus."""
+        target = job.target
+        # Simulierte Scan-Logik
+        results = []
+        checks = [f"Simulierter Port 80 offen auf {target}", f"Simulierter Ping zu {target} erfolgreich"]
+        for step, check in enumerate(checks, start=1):
+            results.append(check)
+            report_progress(step / len(checks))
+        new_scan = {
+            "id": f"scan_{job.job_id}",
+            "job_id": job.job_id,
+            "scan_type": job.scan_type,
+            "target": target,
+            "status": "completed",
+            "results": results
+        }
+        self._add_scan_result(new_scan)
+        self.log_system_event(self._component_name, f"Simulierter Scan auf {target} abgeschlossen.", "INFO")
+        return new_scan
+
+    def _cmd_clear_logs(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        self._logs.clear()
+        self._touch("logs")
+        self.log_system_event(self._component_name, "Logs durch Benutzer gelöscht.", "INFO")
+        return {"status": "success", "message": "Logs gelöscht.", "data_type": "logs", "payload": self.get_system_logs()}
+
+    def _cmd_help(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        help_message = ["Verfügbare Befehle:"] + self.commands.help_lines()
+        for msg in help_message:
+            self.log_system_event(self._component_name, msg, "INFO")
+        return {"status": "success", "message": "Hilfe angezeigt.", "data_type": "logs", "payload": self.get_system_logs()}
+
+    def _register_plugin_command(self, plugin: AbstractPlugin):
+        """Macht ein Plugin über seinen Namen als Befehl aufrufbar (z.B. 'dummywebfetcher <Eingabe>')."""
+        def run_plugin(arguments: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                result = self.plugin_runner.run(plugin, arguments)
+            except PluginExecutionError as e:
+                self.log_system_event(plugin.plugin_name, str(e), "ERROR")
+                return {"status": "error", "message": str(e), "data_type": "error", "payload": {}}
+            status = result.get("status", "success") if isinstance(result, dict) else "success"
+            return {"status": status, "message": f"Plugin '{plugin.plugin_name}' ausgeführt.", "data_type": "plugin", "payload": result}
+        arguments = plugin.command_arguments
+        if arguments is None:
+            arguments = [CommandArgument("input", required=False, greedy=True, metavar="Eingabe")]
+        self.commands.register(plugin.plugin_name, run_plugin, arguments, help_text=plugin.description)
 
     # --- Dummy-Module für die Simulation des dynamischen Ladens (als Plugins) ---
     # Diese würden später echte Implementierungen von AbstractPlugin sein
@@ -388,9 +905,13 @@ class CoreContextManager(SystemSphereBase): # Erbt jetzt von SystemSphereBase
             return {"status": "success", "message": f"{self.plugin_name} processed request."}
     
     class _DummyDOMParser(AbstractPlugin):
+        execution_mode = PROCESS # DOM-Parsing ist CPU-lastig und soll den Server nicht blockieren
+        max_concurrency = 2
+        timeout = 30.0
         def __init__(self, name, description):
             super().__init__(name, description)
         def run(self, arguments: Dict[str, Any]) -> Any:
-            self.core_context.report_status(f"[{self.plugin_name}] Führe run-Methode aus mit {arguments}", "OKCYAN")
+            if self.core_context is not None: # Im Worker-Prozess gibt es keinen CoreContextManager
+                self.core_context.report_status(f"[{self.plugin_name}] Führe run-Methode aus mit {arguments}", "OKCYAN")
             return {"status": "success", "message": f"{self.plugin_name} processed request."}
 
@@ -0,0 +1,220 @@
+# src/core/base/core_ipc.py
+
+import os
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.managers import BaseManager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from core.base.command_batch import check_max_parallel, parse_batch, run_batch
+from core.base.event_bus import EventBus, EventBusMirror
+
+# Methoden, die Worker-Prozesse über die IPC-Grenze aufrufen dürfen. Alles, was hinübergeht,
+# muss picklebar sein; Karten-Objekte, Plugins oder Locks bleiben im Hauptprozess.
+CORE_CONTEXT_METHODS = (
+    "get_system_status", "get_system_logs", "query_system_logs", "get_scan_results", "get_devices", "get_graph",
+    "get_blockchain_data", "execute_system_command", "report_status", "log_system_event",
+    "scan_submit", "scan_submit_many", "scan_get_job", "scan_get_batch", "scan_list_jobs", "scan_get_stats",
+    "events_wait", "get_versions", "get_runtime_stats",
+)
+
+
+class CoreContextService:
+    """
+    Die IPC-Schnittstelle des Kerns: flache, picklebare Methoden über dem CoreContextManager.
+    Läuft im Hauptprozess; Worker-Prozesse des Produktionsservers sprechen sie über einen
+    CoreContextClient an, statt eine eigene (auseinanderlaufende) Kopie des Singletons zu halten.
+    """
+
+    def __init__(self, context_manager: Any):
+        self._context = context_manager
+
+    def get_system_status(self, include_runtime_stats: bool = True) -> Dict[str, Any]:
+        return self._context.get_system_status(include_runtime_stats)
+
+    def get_runtime_stats(self) -> Dict[str, Any]:
+        return self._context.get_runtime_stats()
+
+    def get_versions(self) -> Dict[str, int]:
+        return self._context.get_versions()
+
+    def get_system_logs(self, **filters: Any) -> List[Dict[str, Any]]:
+        return self._context.get_system_logs(**filters)
+
+    def query_system_logs(self, **filters: Any) -> Tuple[List[Dict[str, Any]], int]:
+        return self._context.query_system_logs(**filters)
+
+    def get_scan_results(self, **filters: Any) -> List[Dict[str, Any]]:
+        return self._context.get_scan_results(**filters)
+
+    def get_devices(self) -> List[Dict[str, Any]]:
+        return self._context.get_devices()
+
+    def get_graph(self, since: Optional[int] = None) -> Dict[str, Any]:
+        return self._context.get_graph(since=since)
+
+    def get_blockchain_data(self, **options: Any) -> Dict[str, Any]:
+        return self._context.get_blockchain_data(**options)
+
+    def execute_system_command(self, command: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self._context.execute_system_command(command, params)
+
+    def report_status(self, status_message: str, level: str = "INFO") -> None:
+        self._context.report_status(status_message, level)
+
+    def log_system_event(self, component: str, message: str, level: str = "INFO") -> int:
+        return self._context.log_system_event(component, message, level)
+
+    def scan_submit(self, target: str, scan_type: str = "quick_scan") -> str:
+        return self._context.scan_jobs.submit(target, scan_type=scan_type)
+
+    def scan_submit_many(self, targets: Any, scan_type: str = "quick_scan", per_host: bool = True) -> str:
+        return self._context.scan_jobs.submit_many(targets, scan_type=scan_type, per_host=per_host)
+
+    def scan_get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._context.scan_jobs.get_job(job_id)
+
+    def scan_get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        return self._context.scan_jobs.get_batch(batch_id)
+
+    def scan_list_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        return self._context.scan_jobs.list_jobs(status=status, limit=limit)
+
+    def scan_get_stats(self) -> Dict[str, Any]:
+        return self._context.scan_jobs.get_stats()
+
+    def events_wait(self, since: int, timeout: float = 15.0, limit: int = 1000) -> Tuple[List[Dict[str, Any]], bool]:
+        return self._context.events.wait_events(since, timeout=timeout, limit=limit)
+
+
+class _CoreContextManagerIPC(BaseManager):
+    pass
+
+
+class CoreContextIPCServer:
+    """
+    Stellt den CoreContextService des Hauptprozesses per multiprocessing.managers bereit.
+    Der Server läuft in einem Daemon-Thread des Hauptprozesses (kein eigener Prozess), damit er
+    direkt auf dem echten Singleton arbeitet. Verbindungen sind per 'authkey' authentifiziert.
+    """
+
+    def __init__(self, context_manager: Any, address: Tuple[str, int] = ("127.0.0.1", 0),
+                 authkey: Optional[bytes] = None):
+        """
+        :param address: Lauschadresse; Port 0 wählt einen freien Port (siehe self.address).
+        :param authkey: Gemeinsames Geheimnis für die Worker; ohne Angabe wird eines erzeugt.
+        """
+        self.authkey = authkey or secrets.token_bytes(32)
+        service = CoreContextService(context_manager)
+        registry = type("_CoreContextRegistry", (_CoreContextManagerIPC,), {})
+        registry.register("core_context", callable=lambda: service, exposed=CORE_CONTEXT_METHODS)
+        self._server = registry(address=address, authkey=self.authkey).get_server()
+        self.address: Tuple[str, int] = self._server.address
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "CoreContextIPCServer":
+        # serve_forever() beendet sich über stop_event (und sys.exit, das nur diesen Thread beendet)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="core-ipc", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        stop_event = getattr(self._server, "stop_event", None)
+        if stop_event is not None:
+            stop_event.set()
+        self._server.listener.close()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+
+
+class _ScanJobsClient:
+    """Bildet die ScanJobEngine-Methoden, die die API nutzt, auf den Service ab."""
+
+    def __init__(self, client: "CoreContextClient"):
+        self._client = client
+
+    def submit(self, target: str, scan_type: str = "quick_scan") -> str:
+        return self._client._proxy().scan_submit(target, scan_type)
+
+    def submit_many(self, targets: Any, scan_type: str = "quick_scan", per_host: bool = True) -> str:
+        return self._client._proxy().scan_submit_many(targets, scan_type, per_host)
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._client._proxy().scan_get_job(job_id)
+
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        return self._client._proxy().scan_get_batch(batch_id)
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        return self._client._proxy().scan_list_jobs(status, limit)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return self._client._proxy().scan_get_stats()
+
+
+class CoreContextClient:
+    """
+    Stellvertreter des CoreContextManager in Worker-Prozessen.
+    Bietet dieselben Methoden, die die API-Server aufrufen (inklusive 'scan_jobs'), und leitet sie
+    über die IPC-Grenze weiter. Die Verbindung wird pro Prozess aufgebaut, also auch nach einem
+    fork() neu; Proxys von multiprocessing verwenden je Thread eine eigene Verbindung.
+    'events' ist ein lokaler Spiegel des EventBus im Hauptprozess (gleiche Sequenznummern).
+    Befehls-Batches werden im Worker geplant; jeder Befehl geht einzeln über die IPC-Grenze, sodass
+    die Ergebnisse auch hier in Abschlussreihenfolge gestreamt werden können.
+    """
+    command_workers = 8
+
+    def __init__(self, address: Tuple[str, int], authkey: bytes):
+        self.address = address
+        self.authkey = authkey
+        self._pid: Optional[int] = None
+        self._service: Any = None
+        self._lock = threading.Lock()
+        self._mirror: Optional[EventBusMirror] = None
+        self._mirror_pid: Optional[int] = None
+        self._command_pool: Optional[ThreadPoolExecutor] = None
+        self._command_pool_pid: Optional[int] = None
+        self.scan_jobs = _ScanJobsClient(self)
+
+    @property
+    def events(self) -> EventBus:
+        if self._mirror_pid != os.getpid():
+            with self._lock:
+                if self._mirror_pid != os.getpid():
+                    self._mirror = EventBusMirror(lambda since, timeout: self._proxy().events_wait(since, timeout))
+                    self._mirror_pid = os.getpid()
+        return self._mirror.bus
+
+    def _proxy(self) -> Any:
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    registry = type("_CoreContextRegistry", (_CoreContextManagerIPC,), {})
+                    registry.register("core_context")
+                    manager = registry(address=self.address, authkey=self.authkey)
+                    manager.connect()
+                    self._service = manager.core_context()
+                    self._pid = os.getpid()
+        return self._service
+
+    def execute_command_batch(self, commands: List[Any], max_parallel: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        batch = parse_batch(commands)
+        check_max_parallel(max_parallel)
+        if self._command_pool_pid != os.getpid():
+            with self._lock:
+                if self._command_pool_pid != os.getpid():
+                    self._command_pool = ThreadPoolExecutor(max_workers=self.command_workers,
+                                                            thread_name_prefix="command-worker")
+                    self._command_pool_pid = os.getpid()
+        return run_batch(batch, self.execute_system_command, self._command_pool, max_parallel)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in CORE_CONTEXT_METHODS:
+            return getattr(self._proxy(), name)
+        raise AttributeError(name)
+
+
+def connect_core_context(address: Tuple[str, int], authkey: bytes) -> CoreContextClient:
+    """Client für einen CoreContextIPCServer; verbindet sich erst beim ersten Aufruf."""
+    return CoreContextClient(address, authkey)
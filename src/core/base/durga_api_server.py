@@ -1,14 +1,22 @@
 # Beispiel: src/core/base/durga_api_server.py
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from threading import Thread
+from core.base.command_batch import stream_ndjson
+from core.base.response_cache import ResponseCache, cached_response
+from core.base.serialization import dumps, get_serializer, negotiate
+from core.base.wsgi_serving import serve_production
 # from python_core.core_context_manager import CoreContextManager # Importiere deinen Manager
 
 class DurgaAPIServer:
-    def __init__(self, context_manager: CoreContextManager, host: str = '0.0.0.0', port: int = 5000):
+    default_page_size = 100 # Journal-Einträge, wenn kein 'limit' angegeben ist
+    max_page_size = 5000 # Obergrenze für 'limit'
+
+    def __init__(self, context_manager: 'CoreContextManager', host: str = '0.0.0.0', port: int = 5000):
         self.app = Flask(__name__)
         self.context_manager = context_manager
         self.host = host
         self.port = port
+        self.response_cache = ResponseCache()
         self._setup_routes()
         self.server_thread = None
         self.context_manager.report_status("DurgaAPI Server initialisiert.", "INFO")
@@ -16,8 +24,15 @@ class DurgaAPIServer:
     def _setup_routes(self):
         @self.app.route('/api/system/status', methods=['GET'])
         def get_status():
-            status = self.context_manager.get_system_status() # Annahme: Eine Methode in CoreContextManager
-            return jsonify(status)
+            return self._cached_response("status", lambda serializer: serializer.dumps(
+                self.context_manager.get_system_status(include_runtime_stats=False)))
+
+        @self.app.route('/api/system/stats', methods=['GET'])
+        def get_runtime_stats():
+            # Laufzeit-Statistiken ändern sich ohne Versionswechsel, daher ungecacht
+            serializer = get_serializer(negotiate(request.headers.get('Accept')))
+            return Response(serializer.dumps(self.context_manager.get_runtime_stats()), mimetype=serializer.mimetype,
+                            headers={"Vary": "Accept"})
 
         @self.app.route('/api/modules/execute', methods=['POST'])
         def execute_module_command():
@@ -26,14 +41,51 @@ class DurgaAPIServer:
             params = data.get('params', {})
             
             result = self.context_manager.execute_system_command(command_type, params)
-            return jsonify(result)
+            serializer = get_serializer(negotiate(request.headers.get('Accept')))
+            return Response(serializer.dumps(result), mimetype=serializer.mimetype, headers={"Vary": "Accept"})
+
+        # Batch-Variante: {"commands": [{"id", "command_type", "params", "depends_on"}, ...], "max_parallel": n}.
+        # Ergebnisse als NDJSON in Abschlussreihenfolge, zuletzt {"summary": {...}}
+        @self.app.route('/api/commands/batch', methods=['POST'])
+        def execute_command_batch():
+            data = request.json
+            commands = data.get('commands') if isinstance(data, dict) else data
+            max_parallel = data.get('max_parallel') if isinstance(data, dict) else None
+            try:
+                results = self.context_manager.execute_command_batch(commands, max_parallel=max_parallel)
+            except ValueError as e:
+                return Response(dumps({"status": "error", "message": str(e)}), status=400, mimetype='application/json')
+            return Response(stream_ndjson(results), mimetype='application/x-ndjson')
 
         # Beispiel für einen Endpunkt zum Abrufen von Blockchain-Daten
         @self.app.route('/api/blockchain/history', methods=['GET'])
         def get_blockchain_history():
-            # Annahme: context_manager hat Zugriff auf Blockchain-Datenbank
-            history = self.context_manager.get_blockchain_data(limit=100)
-            return jsonify(history)
+            # Die letzten Einträge des hashverketteten Ereignis-Journals, optional ab 'since_seq'
+            verify = request.args.get('verify', '').lower() in ('1', 'true', 'yes')
+
+            def build(serializer):
+                history = self.context_manager.get_blockchain_data(limit=self._page_limit(),
+                                                                   since_seq=request.args.get('since_seq', type=int),
+                                                                   verify=verify)
+                return serializer.dumps(history)
+            if verify:
+                # Die Kettenprüfung muss bei jeder Anfrage laufen, nie aus dem Cache oder per 304
+                serializer = get_serializer(negotiate(request.headers.get('Accept')))
+                return Response(build(serializer), mimetype=serializer.mimetype, headers={"Vary": "Accept"})
+            return self._cached_response("journal", build)
+
+    def _page_limit(self) -> int:
+        """Liest 'limit' aus der Anfrage und begrenzt es auf max_page_size."""
+        limit = request.args.get('limit', default=self.default_page_size, type=int)
+        return max(1, min(limit, self.max_page_size))
+
+    def _cached_response(self, collection: str, build):
+        """Gecachte Antwort mit ETag aus der Sammlungsversion (siehe response_cache.cached_response)."""
+        serializer = get_serializer(negotiate(request.headers.get('Accept')))
+        status, body, headers = cached_response(self.response_cache, collection, serializer, request.path,
+                                                request.query_string, request.headers.get('If-None-Match'),
+                                                lambda: self.context_manager.get_versions()[collection], build)
+        return Response(body, status=status, mimetype=serializer.mimetype, headers=headers)
 
     def run_server(self):
         self.app.run(host=self.host, port=self.port)
@@ -45,6 +97,15 @@ class DurgaAPIServer:
         self.server_thread.start()
         self.context_manager.report_status(f"DurgaAPI Server im Hintergrund gestartet auf {self.host}:{self.port}", "OKGREEN")
 
+    def serve_production(self, **options):
+        """
+        Blockierender Produktionsbetrieb (gunicorn bzw. waitress) statt des Flask-Entwicklungsservers.
+        Worker-Prozesse bauen ihre eigene App und erreichen den Kern über die IPC-Grenze (core_ipc).
+        """
+        def app_factory(context):
+            return self.app if context is self.context_manager else type(self)(context, self.host, self.port).app
+        return serve_production(app_factory, self.context_manager, host=self.host, port=self.port, **options)
+
 # In src/core/base/main.py (am Ende der main-Funktion, nach Initialisierung des context_manager):
 # if __name__ == "__main__":
 #     # ... (argparse, config_manager, context_manager.initialize_component)
@@ -0,0 +1,289 @@
+# src/core/base/durga_store.py
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, List, Optional, Iterator, Tuple
+
+CARDS = "cards"
+LOGS = "logs"
+SCANS = "scan_results"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    card_id    TEXT PRIMARY KEY,
+    card_type  TEXT NOT NULL,
+    data       TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    card_class TEXT, -- 'modul:qualname' der Python-Klasse, damit sie beim Nachladen wiederhergestellt werden kann
+    graph_ready INTEGER NOT NULL DEFAULT 0 -- Graphen-Daten der Karte bereit (mark_graph_data_ready)
+);
+CREATE INDEX IF NOT EXISTS idx_cards_type ON cards(card_type);
+CREATE TABLE IF NOT EXISTS logs (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    seq       INTEGER NOT NULL, -- Sequenznummer im LogStore (pro Prozesslauf)
+    timestamp REAL NOT NULL,
+    level     TEXT NOT NULL,
+    component TEXT NOT NULL,
+    message   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp);
+CREATE TABLE IF NOT EXISTS scan_results (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    scan_id   TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    data      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scan_results_timestamp ON scan_results(timestamp);
+"""
+
+_STATEMENTS = {
+    CARDS: ("INSERT OR REPLACE INTO cards (card_id, card_type, data, updated_at, card_class, graph_ready) "
+            "VALUES (?, ?, ?, ?, ?, ?)"),
+    LOGS: "INSERT INTO logs (seq, timestamp, level, component, message) VALUES (?, ?, ?, ?, ?)",
+    SCANS: "INSERT INTO scan_results (scan_id, timestamp, data) VALUES (?, ?, ?)",
+}
+
+_STOP = object() # Abschlussmarke für den Writer-Thread
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=str, separators=(",", ":"))
+
+
+class ConnectionPool:
+    """
+    Kleiner Pool von SQLite-Verbindungen für Durga 2.
+    Jede Verbindung wird exklusiv ausgeliehen, daher ist der Pool aus beliebigen Threads
+    (z.B. Flask-Request-Threads) nutzbar; WAL erlaubt parallele Leser neben dem Writer.
+    """
+
+    def __init__(self, db_path: str, size: int = 4, timeout: float = 30.0):
+        self.db_path = db_path
+        self._timeout = timeout
+        self._connections: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        for _ in range(size):
+            connection = self._connect()
+            self._all.append(connection)
+            self._connections.put(connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, timeout=self._timeout, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL") # In WAL ausreichend: kein fsync pro Commit
+        connection.execute(f"PRAGMA busy_timeout={int(self._timeout * 1000)}")
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connections.get(timeout=self._timeout)
+        try:
+            yield connection
+        finally:
+            self._connections.put(connection)
+
+    def close(self) -> None:
+        for connection in self._all:
+            connection.close()
+        self._all.clear()
+
+
+class DurgaStore:
+    """
+    SQLite-Persistenz für Durga 2 (Karten, Logs, Scan-Ergebnisse).
+    Schreibzugriffe landen in einer Write-Behind-Queue; ein Writer-Thread fasst sie zu
+    Batches zusammen und schreibt jeden Batch in einer einzigen Transaktion (executemany pro Tabelle).
+    Noch nicht geschriebene Karten bleiben über load_card() lesbar (Read-Your-Writes).
+    Die Queue ist begrenzt: Kommt die Datenbank nicht nach, blockieren die save_*-Aufrufe (Backpressure).
+    Scheitert ein Batch, werden seine Karten behalten und erneut geschrieben; Logs und Scan-Ergebnisse
+    dieses Batches gehen verloren (rows_dropped).
+    """
+
+    def __init__(self, db_path: str = "db/durga2.sqlite", pool_size: int = 4,
+                 batch_size: int = 1000, flush_interval: float = 0.2, max_queue: int = 100000,
+                 retry_interval: float = 1.0, on_error: Optional[Callable[[Optional[str]], None]] = None):
+        """
+        :param db_path: Pfad zur SQLite-Datei; das Verzeichnis wird bei Bedarf angelegt.
+        :param pool_size: Anzahl gepoolter Verbindungen für Leser und Writer.
+        :param batch_size: Maximale Anzahl Zeilen pro Transaktion.
+        :param flush_interval: Maximale Wartezeit in Sekunden, bevor ein unvollständiger Batch geschrieben wird.
+        :param max_queue: Maximale Anzahl wartender Schreibzugriffe (zusätzlich zum Batch im Writer);
+                          darüber blockieren save_card() usw.
+        :param retry_interval: Abstand in Sekunden, in dem fehlgeschlagene Karten ohne neue Einträge erneut geschrieben werden.
+        :param on_error: Wird vom Writer-Thread aufgerufen, wenn Schreibzugriffe zu scheitern beginnen
+                         (mit der Fehlermeldung) und wenn sie wieder gelingen (mit None).
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_interval = retry_interval
+        self.pool = ConnectionPool(db_path, size=pool_size)
+        with self.pool.connection() as connection:
+            connection.executescript(_SCHEMA)
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(cards)")}
+            # Datenbanken aus älteren Versionen nachrüsten
+            if "card_class" not in columns:
+                connection.execute("ALTER TABLE cards ADD COLUMN card_class TEXT")
+            if "graph_ready" not in columns:
+                connection.execute("ALTER TABLE cards ADD COLUMN graph_ready INTEGER NOT NULL DEFAULT 0")
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._pending_lock = threading.Lock()
+        self._pending_cards: Dict[str, Tuple[Any, ...]] = {} # card_id -> Zeile, bis sie committet ist
+        self._retry_cards: Dict[str, Tuple[Any, ...]] = {} # Nur im Writer-Thread: gescheiterte Kartenzeilen
+        self._stats = {"rows_written": 0, "batches_written": 0, "write_errors": 0, "rows_dropped": 0,
+                       "consecutive_errors": 0}
+        self.last_error: Optional[str] = None
+        self.on_error = on_error
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="durga2-writer", daemon=True)
+        self._writer.start()
+
+    # --- Schreiben (Write-Behind) ---
+
+    def save_card(self, card_id: str, card_type: str, data: Dict[str, Any], card_class: Optional[str] = None,
+                  graph_ready: bool = False) -> None:
+        row = (card_id, card_type, _dumps(data), time.time(), card_class, int(graph_ready))
+        with self._pending_lock:
+            self._pending_cards[card_id] = row
+        self._queue.put((CARDS, row))
+
+    def save_log(self, seq: int, timestamp: float, level: str, component: str, message: str) -> None:
+        self._queue.put((LOGS, (seq, timestamp, level, component, message)))
+
+    def save_scan_result(self, scan: Dict[str, Any]) -> None:
+        self._queue.put((SCANS, (str(scan.get("id", scan.get("seq"))), scan["timestamp"], _dumps(scan))))
+
+    def flush(self) -> None:
+        """
+        Blockiert, bis alle bisher eingereihten Schreibzugriffe verarbeitet sind. Karten, deren Batch
+        gescheitert ist, werden danach weiter im Hintergrund wiederholt (siehe get_stats()["cards_retrying"]).
+        """
+        self._queue.join()
+
+    def _write_loop(self) -> None:
+        """
+        Writer-Thread. Darf nie vorzeitig enden: jeder geholte Eintrag wird mit task_done() quittiert,
+        auch wenn das Schreiben scheitert, sonst blockieren flush() und close() für immer.
+        """
+        while True:
+            try:
+                # Mit ausstehenden Wiederholungen nicht unbegrenzt auf neue Einträge warten
+                item = self._queue.get(timeout=self.retry_interval) if self._retry_cards else self._queue.get()
+            except queue.Empty:
+                self._write_batch([])
+                continue
+            batch = [item]
+            try:
+                deadline = time.monotonic() + self.flush_interval
+                # Weitere Einträge einsammeln, bis der Batch voll ist oder das Intervall abläuft
+                while item is not _STOP and len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    batch.append(item)
+                rows = [entry for entry in batch if entry is not _STOP]
+                if rows or self._retry_cards:
+                    self._write_batch(rows)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is _STOP:
+                self._stats["rows_dropped"] += len(self._retry_cards) # Letzter Versuch beim Schließen gescheitert
+                return
+
+    def _write_batch(self, rows: List[Tuple[str, Tuple[Any, ...]]]) -> None:
+        # Zuerst die Wiederholungen, damit neuere Zeilen derselben Karte aus diesem Batch sie ersetzen
+        by_table: Dict[str, Dict[Any, Tuple[Any, ...]]] = {CARDS: dict(self._retry_cards), LOGS: {}, SCANS: {}}
+        self._retry_cards.clear()
+        error: Optional[str] = None
+        try:
+            for position, (table, row) in enumerate(rows):
+                # Karten: mehrfache Änderungen im selben Batch werden zusammengefasst (letzte gewinnt)
+                by_table[table][row[0] if table == CARDS else position] = row
+            with self.pool.connection() as connection:
+                with connection: # Eine Transaktion pro Batch
+                    for table, table_rows in by_table.items():
+                        if table_rows:
+                            connection.executemany(_STATEMENTS[table], table_rows.values())
+            self._stats["rows_written"] += sum(len(table_rows) for table_rows in by_table.values())
+            self._stats["batches_written"] += 1
+        except queue.Empty: # Keine Verbindung innerhalb des Pool-Timeouts frei
+            error = "Keine freie Datenbankverbindung im Pool (Timeout)."
+        except Exception as e: # Auch unerwartete Fehler dürfen den Writer-Thread nicht beenden
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            with self._pending_lock:
+                for card_id, row in by_table[CARDS].items():
+                    if self._pending_cards.get(card_id) is not row:
+                        continue # Neuere Zeile ist bereits eingereiht
+                    if error is None:
+                        del self._pending_cards[card_id]
+                    else:
+                        self._retry_cards[card_id] = row # Bleibt lesbar und wird erneut geschrieben
+        self._record_outcome(error, len(by_table[LOGS]) + len(by_table[SCANS]))
+
+    def _record_outcome(self, error: Optional[str], dropped_rows: int) -> None:
+        """Zählt Fehler; meldet den Wechsel zwischen gesund und fehlerhaft an on_error."""
+        failing_before = self._stats["consecutive_errors"] > 0
+        if error is None:
+            self._stats["consecutive_errors"] = 0
+        else:
+            self._stats["write_errors"] += 1
+            self._stats["consecutive_errors"] += 1
+            self._stats["rows_dropped"] += dropped_rows
+            self.last_error = error
+        if self.on_error is not None and failing_before != (error is not None):
+            try:
+                self.on_error(error)
+            except Exception:
+                pass # Ein fehlerhafter Beobachter darf den Writer nicht aufhalten
+
+    # --- Lesen ---
+
+    def load_card(self, card_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Liest eine Karte (card_id, card_type, data, card_class, graph_ready); noch ausstehende
+        Schreibzugriffe haben Vorrang.
+        """
+        with self._pending_lock:
+            row = self._pending_cards.get(card_id)
+        if row is None:
+            with self.pool.connection() as connection:
+                row = connection.execute("SELECT card_id, card_type, data, updated_at, card_class, graph_ready "
+                                         "FROM cards WHERE card_id = ?", (card_id,)).fetchone()
+        if row is None:
+            return None
+        return {"card_id": row[0], "card_type": row[1], "data": json.loads(row[2]), "card_class": row[4],
+                "graph_ready": bool(row[5])}
+
+    def count(self, table: str) -> int:
+        if table not in _STATEMENTS:
+            raise ValueError(f"Unbekannte Tabelle: '{table}'")
+        with self.pool.connection() as connection:
+            return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Zähler des Writers; 'status' ist "failing", solange die letzten Batches gescheitert sind."""
+        return dict(self._stats, db_path=self.db_path, queued=self._queue.qsize(), max_queue=self._queue.maxsize,
+                    cards_retrying=len(self._retry_cards), last_error=self.last_error,
+                    status="failing" if self._stats["consecutive_errors"] else "ok",
+                    writer_alive=self._writer.is_alive())
+
+    def close(self) -> None:
+        """Schreibt alle ausstehenden Einträge, beendet den Writer-Thread und schließt den Pool."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+        self.pool.close()
@@ -0,0 +1,210 @@
+# src/core/base/event_bus.py
+
+import collections
+import itertools
+import threading
+import time
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from core.base.serialization import dumps
+
+
+class BusEvent:
+    """Ein Ereignis mit globaler Sequenznummer; der SSE-Frame wird einmal gebaut und von allen Abonnenten geteilt."""
+    __slots__ = ("seq", "event_type", "timestamp", "data", "_frame")
+
+    def __init__(self, seq: int, event_type: str, timestamp: float, data: Any):
+        self.seq = seq
+        self.event_type = event_type
+        self.timestamp = timestamp
+        self.data = data
+        self._frame: Optional[bytes] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"seq": self.seq, "type": self.event_type, "timestamp": self.timestamp, "data": self.data}
+
+    def sse_frame(self) -> bytes:
+        if self._frame is None:
+            self._frame = f"id: {self.seq}\nevent: {self.event_type}\ndata: ".encode('utf-8') + dumps(self.to_dict()) + b"\n\n"
+        return self._frame
+
+
+class Subscription:
+    """
+    Begrenzte Warteschlange eines Abonnenten.
+    Ist sie voll, wird das älteste Ereignis verworfen (drop-oldest) und gezählt: ein langsamer Client
+    bremst weder den Publisher noch andere Clients und sieht über take_dropped(), dass ihm etwas fehlt.
+    """
+
+    def __init__(self, bus: "EventBus", max_queue: int, event_types: Optional[Iterable[str]] = None):
+        self._bus = bus
+        self._events: Deque[BusEvent] = collections.deque(maxlen=max_queue)
+        self._cond = threading.Condition(threading.Lock())
+        self.event_types = frozenset(event_types) if event_types else None
+        self.dropped = 0
+        self._unreported_drops = 0
+        self.closed = False
+        self.reset = False # Der gewünschte Wiederaufsetzpunkt lag nicht mehr im Verlauf
+
+    def _push(self, event: BusEvent) -> None:
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return
+        with self._cond:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+                self._unreported_drops += 1
+            self._events.append(event)
+            self._cond.notify()
+
+    def get(self, timeout: Optional[float] = None, max_events: int = 256) -> List[BusEvent]:
+        """Wartet bis zu 'timeout' Sekunden auf Ereignisse und liefert sie gebündelt (leer bei Timeout/close)."""
+        with self._cond:
+            if not self._events and not self.closed:
+                self._cond.wait(timeout)
+            batch = []
+            while self._events and len(batch) < max_events:
+                batch.append(self._events.popleft())
+            return batch
+
+    def take_dropped(self) -> int:
+        """Anzahl seit dem letzten Aufruf verworfener Ereignisse."""
+        with self._cond:
+            dropped, self._unreported_drops = self._unreported_drops, 0
+            return dropped
+
+    def pending(self) -> int:
+        return len(self._events)
+
+    def close(self) -> None:
+        self._bus._unsubscribe(self)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class EventBus:
+    """
+    Push-Kanal für inkrementelle Ereignisse (Logs, Scan-Jobs, Karten, Status).
+    Jedes Ereignis erhält eine fortlaufende Sequenznummer und bleibt in einem begrenzten Verlauf;
+    Abonnenten können damit ab einer bekannten Nummer wieder aufsetzen (z.B. SSE 'Last-Event-ID'),
+    statt nach einem Reconnect alles neu zu laden. publish() ist O(Abonnenten) und blockiert nie.
+    """
+
+    def __init__(self, history: int = 4096, max_queue: int = 1024):
+        """
+        :param history: Anzahl der letzten Ereignisse, ab denen wieder aufgesetzt werden kann.
+        :param max_queue: Standardgröße der Warteschlange pro Abonnent.
+        """
+        self.max_queue = max_queue
+        self._history: Deque[BusEvent] = collections.deque(maxlen=history)
+        self._subscribers: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._published = threading.Condition(self._lock) # Für wait_events() (Long-Polling über IPC)
+        self._seqs = itertools.count(1)
+        self._last_seq = 0
+        self._stats = {"published": 0, "subscribed": 0}
+
+    def publish(self, event_type: str, data: Any = None) -> int:
+        with self._lock:
+            event = BusEvent(next(self._seqs), event_type, time.time(), data)
+            self._append(event)
+        return event.seq
+
+    def publish_event(self, event: Dict[str, Any]) -> None:
+        """Übernimmt ein Ereignis samt Sequenznummer (z.B. aus dem Bus des Hauptprozesses)."""
+        with self._lock:
+            if event["seq"] <= self._last_seq:
+                return
+            self._seqs = itertools.count(event["seq"] + 1)
+            self._append(BusEvent(event["seq"], event["type"], event["timestamp"], event["data"]))
+
+    def _append(self, event: BusEvent) -> None:
+        # Unter self._lock: Verlauf und Zustellung bleiben so in derselben Reihenfolge wie die Nummern
+        self._history.append(event)
+        self._last_seq = event.seq
+        self._stats["published"] += 1
+        for subscription in self._subscribers:
+            subscription._push(event)
+        self._published.notify_all()
+
+    def subscribe(self, since: Optional[int] = None, event_types: Optional[Iterable[str]] = None,
+                  max_queue: Optional[int] = None) -> Subscription:
+        """
+        Neues Abonnement. Mit 'since' (letzte gesehene Sequenznummer) werden die verpassten Ereignisse
+        aus dem Verlauf vorab eingereiht; liegt 'since' vor dem Verlauf, ist subscription.reset gesetzt
+        und der Client muss einmal vollständig neu laden.
+        """
+        subscription = Subscription(self, max_queue or self.max_queue, event_types)
+        with self._lock:
+            if since is not None:
+                events, subscription.reset = self._events_after(since)
+                for event in events:
+                    subscription._push(event)
+            self._subscribers.append(subscription)
+            self._stats["subscribed"] += 1
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                # Kopieren statt entfernen: publish() iteriert unter dem Lock, Leser außerhalb sehen eine stabile Liste
+                self._subscribers = [s for s in self._subscribers if s is not subscription]
+
+    def _events_after(self, since: int) -> Tuple[List[BusEvent], bool]:
+        if since >= self._last_seq:
+            return [], False
+        oldest = self._history[0].seq if self._history else self._last_seq + 1
+        return [event for event in self._history if event.seq > since], since < oldest - 1
+
+    def wait_events(self, since: int, timeout: float = 15.0, limit: int = 1000) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Long-Polling: wartet bis zu 'timeout' Sekunden auf Ereignisse nach 'since'.
+        Liefert (Ereignisse als Dicts, Lücke im Verlauf) und eignet sich damit für die IPC-Grenze.
+        """
+        with self._published:
+            if since >= self._last_seq:
+                self._published.wait(timeout)
+            events, gap = self._events_after(since)
+        return [event.to_dict() for event in events[:limit]], gap
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            subscribers = list(self._subscribers)
+            return dict(self._stats, last_seq=self._last_seq, history=len(self._history),
+                        subscribers=len(subscribers), dropped=sum(s.dropped for s in subscribers))
+
+
+class EventBusMirror:
+    """
+    Spiegelt den EventBus des Hauptprozesses in einen lokalen Bus (z.B. in einem Server-Worker).
+    Ein Thread holt per Long-Polling über die IPC-Grenze nach und übernimmt die Sequenznummern,
+    sodass 'Last-Event-ID' prozessübergreifend gültig bleibt.
+    """
+
+    def __init__(self, wait_events: Any, history: int = 4096, max_queue: int = 1024, poll_timeout: float = 15.0):
+        """
+        :param wait_events: Aufrufbar wie EventBus.wait_events (z.B. die Proxy-Methode des CoreContextService).
+        """
+        self.bus = EventBus(history=history, max_queue=max_queue)
+        self._wait_events = wait_events
+        self._poll_timeout = poll_timeout
+        self.last_error: Optional[str] = None
+        self._thread = threading.Thread(target=self._run, name="event-bus-mirror", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        since = 0 # Zu Beginn den gesamten Verlauf übernehmen, damit Clients sofort wieder aufsetzen können
+        while True:
+            try:
+                events, _ = self._wait_events(since, self._poll_timeout)
+            except (EOFError, OSError) as e: # Hauptprozess beendet
+                self.last_error = str(e)
+                return
+            for event in events:
+                self.bus.publish_event(event)
+            if events:
+                since = events[-1]["seq"]
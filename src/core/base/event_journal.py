@@ -0,0 +1,328 @@
+# src/core/base/event_journal.py
+
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from typing import Dict, Any, List, Optional, Tuple
+
+from core.base.log_store import format_timestamp
+
+FILE_MAGIC = b"NEETJRN\x01" # Dateikopf: Kennung plus Formatversion
+DIGEST_SIZE = 32 # BLAKE2b-256
+
+# Satzkopf fester Größe: Sequenznummer, UTC-Zeitstempel, Länge der Nutzdaten, Hash des Satzes
+_HEADER = struct.Struct(">QdI32s")
+_CHAINED = struct.Struct(">QdI") # Der Teil des Kopfes, der in den Hash eingeht
+# Checkpoint-Datei: Sequenznummer, Datei-Offset und Hash des Satzes
+_CHECKPOINT = struct.Struct(">QQ32s")
+_GENESIS = bytes(DIGEST_SIZE) # Vorgänger-Hash des ersten Satzes
+
+
+def _chain_digest(previous: bytes, seq: int, timestamp: float, payload: bytes) -> bytes:
+    digest = hashlib.blake2b(previous, digest_size=DIGEST_SIZE)
+    digest.update(_CHAINED.pack(seq, timestamp, len(payload)))
+    digest.update(payload)
+    return digest.digest()
+
+
+class EventJournal:
+    """
+    Append-only Ereignis-Journal mit BLAKE2b-Hashkette (manipulationssichere Belegbarkeit).
+    Jeder Satz besteht aus einem Kopf fester Größe (seq, UTC-Zeitstempel, Länge, Hash) und
+    JSON-Nutzdaten; sein Hash deckt den Hash des Vorgängers mit ab, sodass jede nachträgliche
+    Änderung die Kette ab dieser Stelle bricht. Gelesen wird über mmap, ein dünn besetzter
+    Offset-Index (jeder 'index_interval'-te Satz) erlaubt O(log n)-Sprünge nach Sequenznummer
+    oder Zeitstempel. Checkpoints in '<path>.ckpt' halten regelmäßig Offset und Hash fest, damit
+    verify() nur ab dem letzten Checkpoint nachrechnen muss.
+    """
+
+    def __init__(self, path: str = "db/journal.bin", index_interval: int = 64, checkpoint_interval: int = 1024):
+        """
+        :param path: Pfad der Journal-Datei; das Verzeichnis wird bei Bedarf angelegt.
+        :param index_interval: Abstand der Einträge im Offset-Index (in Sätzen).
+        :param checkpoint_interval: Abstand der Checkpoints (in Sätzen).
+        """
+        if index_interval <= 0 or checkpoint_interval <= 0:
+            raise ValueError("index_interval und checkpoint_interval müssen größer als 0 sein.")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.checkpoint_path = path + ".ckpt"
+        self.index_interval = index_interval
+        self.checkpoint_interval = checkpoint_interval
+        self._lock = threading.RLock()
+        self._index_seqs = array('Q') # Sparse-Index: Sequenznummer -> Offset, plus Zeitstempel
+        self._index_timestamps = array('d')
+        self._index_offsets = array('Q')
+        self._checkpoints: List[Tuple[int, int, bytes]] = []
+        self._next_seq = 0
+        self._last_digest = _GENESIS
+        self._last_timestamp = 0.0
+        self._size = 0 # Logische Dateigröße inklusive noch gepufferter Sätze
+        self._flushed = True
+        self._map: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+        self._open()
+
+    # --- Öffnen und Wiederherstellen ---
+
+    def _open(self) -> None:
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            with open(self.path, "wb") as handle:
+                handle.write(FILE_MAGIC)
+        self._file = open(self.path, "r+b")
+        if self._file.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            self._file.close()
+            raise ValueError(f"'{self.path}' ist keine Journal-Datei.")
+        self._size = os.path.getsize(self.path)
+        self._remap()
+        end = self._scan_records()
+        if end < self._size:
+            # Unvollständiger letzter Satz (z.B. Absturz beim Schreiben): abschneiden
+            self._close_map()
+            self._file.truncate(end)
+            self._size = end
+            self._remap()
+        self._file.seek(self._size)
+        self._load_checkpoints()
+
+    def _scan_records(self) -> int:
+        """Liest nur die Satzköpfe, baut den Offset-Index auf und liefert das Ende des letzten vollständigen Satzes."""
+        offset = len(FILE_MAGIC)
+        while offset + _HEADER.size <= self._size:
+            seq, timestamp, length, digest = _HEADER.unpack_from(self._map, offset)
+            end = offset + _HEADER.size + length
+            if end > self._size:
+                break
+            if seq != self._next_seq:
+                raise ValueError(f"Journal '{self.path}' ist beschädigt: Satz {seq} an Stelle {self._next_seq}.")
+            self._index(seq, timestamp, offset)
+            self._next_seq = seq + 1
+            self._last_digest = digest
+            self._last_timestamp = timestamp
+            offset = end
+        return offset
+
+    def _load_checkpoints(self) -> None:
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, "rb") as handle:
+                data = handle.read()
+            for position in range(0, len(data) - _CHECKPOINT.size + 1, _CHECKPOINT.size):
+                checkpoint = _CHECKPOINT.unpack_from(data, position)
+                if checkpoint[0] < self._next_seq:
+                    self._checkpoints.append(checkpoint)
+        self._checkpoint_file = open(self.checkpoint_path, "ab")
+
+    # --- Schreiben ---
+
+    def append(self, event_type: str, data: Any = None, component: str = "System",
+               timestamp: Optional[float] = None) -> int:
+        """Hängt ein Ereignis an, verkettet es mit dem Vorgänger und gibt seine Sequenznummer zurück."""
+        payload = json.dumps({"event_type": event_type, "component": component, "data": data},
+                             sort_keys=True, separators=(",", ":"), default=str).encode('utf-8')
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            if self._file.closed:
+                raise ValueError("Das Journal ist geschlossen.")
+            # Zeitstempel werden monoton gehalten, damit die Zeitsuche per Bisektion funktioniert
+            timestamp = max(timestamp, self._last_timestamp)
+            seq = self._next_seq
+            digest = _chain_digest(self._last_digest, seq, timestamp, payload)
+            offset = self._size
+            self._file.write(_HEADER.pack(seq, timestamp, len(payload), digest))
+            self._file.write(payload)
+            self._size += _HEADER.size + len(payload)
+            self._flushed = False
+            self._index(seq, timestamp, offset)
+            self._next_seq = seq + 1
+            self._last_digest = digest
+            self._last_timestamp = timestamp
+            if (seq + 1) % self.checkpoint_interval == 0:
+                self._write_checkpoint(seq, offset, digest)
+            return seq
+
+    def checkpoint(self) -> Optional[int]:
+        """Setzt sofort einen Checkpoint auf den letzten Satz und gibt dessen Sequenznummer zurück."""
+        with self._lock:
+            if self._next_seq == 0:
+                return None
+            seq = self._next_seq - 1
+            if self._checkpoints and self._checkpoints[-1][0] == seq:
+                return seq
+            self._write_checkpoint(seq, self._offset_of(seq), self._last_digest)
+            return seq
+
+    def sync(self) -> None:
+        """Schreibt gepufferte Sätze und Checkpoints auf die Platte (inklusive fsync)."""
+        with self._lock:
+            self._flush()
+            os.fsync(self._file.fileno())
+            self._checkpoint_file.flush()
+            os.fsync(self._checkpoint_file.fileno())
+
+    def _write_checkpoint(self, seq: int, offset: int, digest: bytes) -> None:
+        self._flush() # Ein Checkpoint darf nie auf ungeschriebene Sätze zeigen
+        self._checkpoint_file.write(_CHECKPOINT.pack(seq, offset, digest))
+        self._checkpoint_file.flush()
+        self._checkpoints.append((seq, offset, digest))
+
+    def _index(self, seq: int, timestamp: float, offset: int) -> None:
+        if seq % self.index_interval == 0:
+            self._index_seqs.append(seq)
+            self._index_timestamps.append(timestamp)
+            self._index_offsets.append(offset)
+
+    def _flush(self) -> None:
+        if not self._flushed:
+            self._file.flush()
+            self._flushed = True
+
+    # --- Lesen (mmap) ---
+
+    def _remap(self) -> None:
+        """Bildet die aktuelle Dateigröße ab; muss unter self._lock aufgerufen werden."""
+        self._flush()
+        self._close_map()
+        if self._size > 0:
+            self._map = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+            self._mapped_size = self._size
+
+    def _close_map(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._mapped_size = 0
+
+    def _view(self) -> mmap.mmap:
+        if self._mapped_size < self._size:
+            self._remap()
+        return self._map
+
+    def _offset_of(self, seq: int) -> int:
+        """Offset eines Satzes: Sprung über den Sparse-Index, dann höchstens index_interval Köpfe weiter."""
+        position = bisect.bisect_right(self._index_seqs, seq) - 1
+        offset = self._index_offsets[position]
+        current = self._index_seqs[position]
+        view = self._view()
+        while current < seq:
+            offset += _HEADER.size + _HEADER.unpack_from(view, offset)[2]
+            current += 1
+        return offset
+
+    def _seq_at_or_after(self, timestamp: float) -> int:
+        """Erste Sequenznummer mit Zeitstempel >= timestamp (bzw. _next_seq, falls keine)."""
+        position = max(bisect.bisect_left(self._index_timestamps, timestamp) - 1, 0)
+        if not self._index_seqs:
+            return self._next_seq
+        seq = self._index_seqs[position]
+        offset = self._index_offsets[position]
+        view = self._view()
+        while seq < self._next_seq:
+            _, record_timestamp, length, _ = _HEADER.unpack_from(view, offset)
+            if record_timestamp >= timestamp:
+                break
+            offset += _HEADER.size + length
+            seq += 1
+        return seq
+
+    def _decode(self, view: mmap.mmap, offset: int, previous: bytes) -> Tuple[Dict[str, Any], int]:
+        seq, timestamp, length, digest = _HEADER.unpack_from(view, offset)
+        start = offset + _HEADER.size
+        payload = json.loads(view[start:start + length])
+        record = {"seq": seq, "timestamp": timestamp, "time": format_timestamp(timestamp),
+                  "event_type": payload.get("event_type"), "component": payload.get("component"),
+                  "data": payload.get("data"), "hash": digest.hex(), "prev_hash": previous.hex()}
+        return record, start + length
+
+    def read(self, start_seq: int = 0, limit: Optional[int] = None,
+             since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Liest Sätze ab 'start_seq' (älteste zuerst); mit 'since' erst ab diesem UTC-Zeitstempel.
+        Jeder Satz enthält seinen Hash und den Hash des Vorgängers ('prev_hash').
+        """
+        with self._lock:
+            start = max(start_seq, 0)
+            if since is not None:
+                start = max(start, self._seq_at_or_after(since))
+            stop = self._next_seq if limit is None else min(self._next_seq, start + max(limit, 0))
+            if start >= stop:
+                return []
+            view = self._view()
+            offset = self._offset_of(start)
+            previous = _GENESIS if start == 0 else _HEADER.unpack_from(view, self._offset_of(start - 1))[3]
+            records = []
+            for _ in range(start, stop):
+                record, offset = self._decode(view, offset, previous)
+                previous = bytes.fromhex(record["hash"])
+                records.append(record)
+            return records
+
+    def tail(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Die letzten 'limit' Sätze, älteste zuerst."""
+        with self._lock:
+            return self.read(max(self._next_seq - limit, 0), limit)
+
+    # --- Verifikation ---
+
+    def verify(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Prüft die Hashkette. Standardmäßig ab dem letzten Checkpoint: dessen Hash muss mit dem
+        gespeicherten Satz übereinstimmen, danach wird jeder Satz neu gehasht. Mit full=True wird
+        die gesamte Kette ab dem ersten Satz nachgerechnet und jeder Checkpoint abgeglichen.
+        """
+        with self._lock:
+            view = self._view()
+            seq, offset, previous = 0, len(FILE_MAGIC), _GENESIS
+            result = {"valid": True, "from_seq": 0, "checked": 0, "head_seq": self._next_seq - 1, "error": None}
+            if not full and self._checkpoints:
+                checkpoint_seq, checkpoint_offset, checkpoint_digest = self._checkpoints[-1]
+                stored = _HEADER.unpack_from(view, checkpoint_offset)
+                if stored[0] != checkpoint_seq or stored[3] != checkpoint_digest:
+                    return dict(result, valid=False, from_seq=checkpoint_seq, failed_seq=checkpoint_seq,
+                                error="Satz weicht vom Checkpoint ab.")
+                seq, offset, previous = checkpoint_seq + 1, checkpoint_offset + _HEADER.size + stored[2], stored[3]
+                result["from_seq"] = seq
+            checkpoints = {checkpoint[0]: checkpoint[2] for checkpoint in self._checkpoints} if full else {}
+            while seq < self._next_seq:
+                record_seq, timestamp, length, digest = _HEADER.unpack_from(view, offset)
+                start = offset + _HEADER.size
+                expected = _chain_digest(previous, record_seq, timestamp, view[start:start + length])
+                if record_seq != seq or digest != expected or checkpoints.get(seq, digest) != digest:
+                    return dict(result, valid=False, failed_seq=seq, error="Hashkette unterbrochen.")
+                previous, offset, seq = digest, start + length, seq + 1
+                result["checked"] += 1
+            return result
+
+    # --- Verwaltung ---
+
+    @property
+    def head(self) -> Dict[str, Any]:
+        """Sequenznummer und Hash des letzten Satzes (Spitze der Kette)."""
+        with self._lock:
+            return {"seq": self._next_seq - 1, "hash": self._last_digest.hex(), "timestamp": self._last_timestamp}
+
+    def __len__(self) -> int:
+        return self._next_seq
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"path": self.path, "records": self._next_seq, "bytes": self._size,
+                    "index_entries": len(self._index_seqs), "checkpoints": len(self._checkpoints),
+                    "head_hash": self._last_digest.hex()}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._flush()
+            self._close_map()
+            self._file.close()
+            self._checkpoint_file.close()
@@ -0,0 +1,209 @@
+# src/core/base/log_pipeline.py
+
+import abc
+import atexit
+import queue
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+# Rangfolge der Level für die Filter der Senken; unbekannte Level (z.B. Farbnamen wie "OKGREEN",
+# die als Level übergeben werden) zählen wie INFO
+LEVELS = {"DEBUG": 10, "INFO": 20, "COMMAND": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40, "FAIL": 40, "CRITICAL": 50}
+_DEFAULT_LEVEL = LEVELS["INFO"]
+
+COLORS = {
+    "HEADER": '\033[95m',
+    "OKBLUE": '\033[94m',
+    "OKCYAN": '\033[96m',
+    "OKGREEN": '\033[92m',
+    "WARNING": '\033[93m',
+    "FAIL": '\033[91m',
+    "ENDC": '\033[0m',
+}
+
+Record = Tuple[float, str, str, str] # (Zeitstempel, Level, Komponente, Nachricht)
+
+
+def level_number(level: str) -> int:
+    return LEVELS.get(level.upper(), _DEFAULT_LEVEL)
+
+
+def status_color(level: str) -> str:
+    """Farbe einer Statusmeldung, wie sie report_status bisher gewählt hat."""
+    level = level.upper()
+    if level == "WARNING":
+        return "WARNING"
+    if level in ("FAIL", "ERROR"):
+        return "FAIL"
+    if level == "SUCCESS":
+        return "OKGREEN"
+    return "OKBLUE"
+
+
+class LogSink(abc.ABC):
+    """Basisklasse einer Senke; 'min_level' filtert pro Senke."""
+
+    def __init__(self, min_level: str = "DEBUG"):
+        self.min_level = min_level
+
+    @property
+    def min_level(self) -> str:
+        return self._min_level
+
+    @min_level.setter
+    def min_level(self, value: str):
+        self._min_level = value.upper()
+        self._threshold = level_number(value)
+
+    def accepts(self, level: str) -> bool:
+        return level_number(level) >= self._threshold
+
+    @abc.abstractmethod
+    def write_batch(self, records: List[Record]) -> None:
+        """Schreibt einen Block von Einträgen, die den Level-Filter bereits passiert haben."""
+
+
+class ConsoleSink(LogSink):
+    """Formatiert und färbt Meldungen ('[Komponente][LEVEL]: Nachricht') und schreibt sie gebündelt."""
+
+    def __init__(self, min_level: str = "DEBUG", stream: Optional[TextIO] = None, colors: bool = True):
+        super().__init__(min_level)
+        self.stream = stream
+        self.colors = colors
+
+    def write_batch(self, records: List[Record]) -> None:
+        lines = []
+        for _, level, component, message in records:
+            line = f"[{component}][{level.upper()}]: {message}"
+            if self.colors:
+                line = f"{COLORS[status_color(level)]}{line}{COLORS['ENDC']}"
+            lines.append(line)
+        stream = self.stream or sys.stdout
+        stream.write("\n".join(lines) + "\n")
+        stream.flush()
+
+
+class CallbackSink(LogSink):
+    """Reicht jeden Eintrag an eine Funktion weiter (z.B. LogStore oder Journal)."""
+
+    def __init__(self, callback: Callable[[Record], Any], min_level: str = "DEBUG"):
+        super().__init__(min_level)
+        self.callback = callback
+
+    def write_batch(self, records: List[Record]) -> None:
+        for record in records:
+            self.callback(record)
+
+
+class _Marker:
+    """Steuer-Eintrag in der Queue: flush() wartet auf das Event, stop beendet den Thread."""
+    __slots__ = ("event", "stop")
+
+    def __init__(self, stop: bool = False):
+        self.event = threading.Event()
+        self.stop = stop
+
+
+class LogPipeline:
+    """
+    Nicht-blockierende Log-Pipeline.
+    Aufrufer legen nur ein kompaktes Tupel in eine queue.SimpleQueue (in C implementiert, ohne
+    Python-Lock); ein Hintergrund-Thread holt die Einträge gebündelt ab, formatiert sie und verteilt
+    sie an die Senken, jede mit eigenem Level-Filter. Fehler einer Senke werden gezählt und
+    beeinträchtigen die anderen nicht.
+    """
+    max_batch = 512 # Einträge, die der Hintergrund-Thread höchstens auf einmal verarbeitet
+
+    def __init__(self, sinks: Optional[List[LogSink]] = None, name: str = "log-pipeline"):
+        self.sinks: List[LogSink] = list(sinks or [])
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._stats = {"emitted": 0, "sink_errors": 0}
+        self.last_error: Optional[str] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def emit(self, component: str, message: str, level: str = "INFO") -> None:
+        """Der Hot Path: ein einziges Enqueue, Formatierung und Ausgabe folgen im Hintergrund."""
+        if self._closed:
+            self._dispatch([(time.time(), level, component, message)]) # Nach close() synchron
+            return
+        self._queue.put((time.time(), level, component, message))
+
+    def add_sink(self, sink: LogSink) -> LogSink:
+        # Kopieren statt anhängen: der Hintergrund-Thread iteriert ohne Lock über die Liste
+        self.sinks = self.sinks + [sink]
+        return sink
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wartet, bis alle bisher eingereihten Einträge an die Senken verteilt sind."""
+        if self._closed:
+            return True
+        marker = _Marker()
+        self._queue.put(marker)
+        return marker.event.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Verteilt ausstehende Einträge und beendet den Hintergrund-Thread."""
+        if self._closed:
+            return
+        marker = _Marker(stop=True)
+        self._queue.put(marker)
+        marker.event.wait(timeout)
+        self._closed = True
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < self.max_batch:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            records: List[Record] = []
+            for item in batch:
+                if isinstance(item, _Marker):
+                    self._dispatch(records)
+                    records = []
+                    item.event.set()
+                    if item.stop:
+                        return
+                else:
+                    records.append(item)
+            self._dispatch(records)
+
+    def _dispatch(self, records: List[Record]) -> None:
+        if not records:
+            return
+        self._stats["emitted"] += len(records)
+        for sink in self.sinks:
+            accepted = [record for record in records if sink.accepts(record[1])]
+            if not accepted:
+                continue
+            try:
+                sink.write_batch(accepted)
+            except Exception as e: # Eine defekte Senke darf die Pipeline nicht anhalten
+                self._stats["sink_errors"] += 1
+                self.last_error = f"{type(sink).__name__}: {e}"
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self._stats, pending=self._queue.qsize(), last_error=self.last_error,
+                    sinks=[{"sink": type(sink).__name__, "min_level": sink.min_level} for sink in self.sinks])
+
+
+_default_pipeline: Optional[LogPipeline] = None
+_default_lock = threading.Lock()
+
+
+def default_pipeline() -> LogPipeline:
+    """Geteilte Pipeline mit Konsolen-Senke für Komponenten ohne eigenen Kontext-Manager."""
+    global _default_pipeline
+    if _default_pipeline is None:
+        with _default_lock:
+            if _default_pipeline is None:
+                _default_pipeline = LogPipeline([ConsoleSink()], name="default-log-pipeline")
+                atexit.register(_default_pipeline.close)
+    return _default_pipeline
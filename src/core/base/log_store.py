@@ -0,0 +1,196 @@
+# src/core/base/log_store.py
+
+import bisect
+import threading
+import time
+from array import array
+from typing import Dict, Any, List, Optional, Tuple
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def format_timestamp(timestamp: float) -> str:
+    """Formatiert einen UNIX-Zeitstempel (UTC) für die Ausgabe in API und UI."""
+    return time.strftime(TIME_FORMAT, time.gmtime(timestamp))
+
+
+class LogStore:
+    """
+    Ringpuffer-basierter Log-Speicher mit fester Kapazität.
+    Die Einträge werden spaltenweise (Zeitstempel, Level, Komponente, Nachricht) abgelegt;
+    die formatierte Zeit wird einmalig beim Schreiben berechnet.
+    Jeder Eintrag erhält eine fortlaufende Sequenznummer, die auch als Cursor dient.
+    Speicherbedarf: O(Kapazität), Abfragen: O(log n + Ergebnisgröße).
+    """
+
+    def __init__(self, capacity: int = 10000):
+        if capacity <= 0:
+            raise ValueError("Die Kapazität des LogStore muss größer als 0 sein.")
+        self._capacity = capacity
+        self._timestamps = array('d', bytes(8 * capacity)) # Spalte: UNIX-Zeitstempel
+        self._times: List[Optional[str]] = [None] * capacity # Spalte: formatierte Zeit (UTC)
+        self._levels = array('H', bytes(2 * capacity)) # Spalte: Level-Codes
+        self._components: List[Optional[str]] = [None] * capacity # Spalte: Komponente
+        self._messages: List[Optional[str]] = [None] * capacity # Spalte: Nachricht
+        self._level_codes: Dict[str, int] = {} # Level-Name -> Code
+        self._level_names: List[str] = [] # Code -> Level-Name
+        # Pro Level eine aufsteigende Liste von Sequenznummern; verdrängte Einträge
+        # werden über einen Kopf-Offset übersprungen und gelegentlich kompaktiert.
+        self._level_index: List[List[int]] = []
+        self._level_heads: List[int] = []
+        self._next_seq = 0 # Sequenznummer des nächsten Eintrags
+        self._cleared_before = 0 # Alles vor dieser Sequenznummer wurde per clear() verworfen
+        self._lock = threading.Lock()
+
+    # --- Schreiben ---
+
+    def append(self, level: str, message: str, component: str = "System", timestamp: Optional[float] = None) -> int:
+        """
+        Hängt einen Eintrag an und gibt seine Sequenznummer zurück.
+        Ist der Puffer voll, wird der älteste Eintrag überschrieben.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        level = level.upper()
+        with self._lock:
+            seq = self._next_seq
+            slot = seq % self._capacity
+            if seq >= self._capacity:
+                self._evict(self._levels[slot])
+            # Zeitstempel werden monoton gehalten, damit die Zeitbereichs-Suche per Bisektion funktioniert
+            if seq > 0:
+                previous = self._timestamps[(seq - 1) % self._capacity]
+                if timestamp < previous:
+                    timestamp = previous
+            code = self._level_code(level)
+            self._timestamps[slot] = timestamp
+            self._times[slot] = format_timestamp(timestamp)
+            self._levels[slot] = code
+            self._components[slot] = component
+            self._messages[slot] = message
+            self._level_index[code].append(seq)
+            self._next_seq = seq + 1
+            return seq
+
+    def clear(self) -> None:
+        """Verwirft alle Einträge. Die Sequenznummern laufen weiter, damit Cursor gültig bleiben."""
+        with self._lock:
+            for code in range(len(self._level_index)):
+                self._level_index[code] = []
+                self._level_heads[code] = 0
+            self._times = [None] * self._capacity
+            self._components = [None] * self._capacity
+            self._messages = [None] * self._capacity
+            self._cleared_before = self._next_seq
+
+    def _level_code(self, level: str) -> int:
+        code = self._level_codes.get(level)
+        if code is None:
+            code = len(self._level_names)
+            self._level_codes[level] = code
+            self._level_names.append(level)
+            self._level_index.append([])
+            self._level_heads.append(0)
+        return code
+
+    def _evict(self, code: int) -> None:
+        """Entfernt den ältesten Eintrag aus dem Level-Index (er steht immer am Kopf)."""
+        entries = self._level_index[code]
+        head = self._level_heads[code]
+        if head < len(entries) and entries[head] == self._next_seq - self._capacity:
+            head += 1
+            if head > 1024 and head * 2 > len(entries):
+                del entries[:head]
+                head = 0
+            self._level_heads[code] = head
+
+    # --- Lesen ---
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def next_cursor(self) -> int:
+        """Sequenznummer, die der nächste geschriebene Eintrag erhalten wird."""
+        return self._next_seq
+
+    def _oldest_seq(self) -> int:
+        return max(self._next_seq - self._capacity, self._cleared_before)
+
+    def __len__(self) -> int:
+        return self._next_seq - self._oldest_seq()
+
+    def _bisect_time(self, lo: int, hi: int, ts: float) -> int:
+        """Binäre Suche über den Sequenzbereich [lo, hi) nach einem Zeitstempel."""
+        timestamps = self._timestamps
+        capacity = self._capacity
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = timestamps[mid % capacity]
+            if value < ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _entry(self, seq: int) -> Dict[str, Any]:
+        slot = seq % self._capacity
+        return {
+            "seq": seq,
+            "timestamp": self._timestamps[slot],
+            "time": self._times[slot],
+            "level": self._level_names[self._levels[slot]],
+            "component": self._components[slot],
+            "message": self._messages[slot],
+        }
+
+    def query(self, since: Optional[float] = None, until: Optional[float] = None, level: Optional[str] = None,
+              limit: Optional[int] = None, cursor: Optional[int] = None,
+              tail: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Liefert die passenden Einträge (älteste zuerst) und den Cursor für die nächste Seite.
+        :param since: Nur Einträge mit Zeitstempel >= since.
+        :param until: Nur Einträge mit Zeitstempel < until.
+        :param level: Nur Einträge dieses Levels (z.B. "ERROR").
+        :param limit: Maximale Anzahl der Einträge.
+        :param cursor: Nur Einträge mit Sequenznummer >= cursor.
+        :param tail: Die letzten 'limit' passenden Einträge statt der ersten (neueste Seite, z.B. für
+                     ein Dashboard ohne Cursor); der Cursor zeigt dann hinter den neuesten Eintrag.
+        """
+        with self._lock:
+            lo = self._oldest_seq()
+            hi = self._next_seq
+            if cursor is not None:
+                lo = max(lo, cursor)
+            if since is not None:
+                lo = self._bisect_time(lo, hi, since)
+            if until is not None:
+                hi = self._bisect_time(lo, hi, until)
+            if lo >= hi:
+                return [], max(lo, cursor or 0)
+
+            if level is None:
+                if tail:
+                    seqs = range(lo if limit is None else max(lo, hi - limit), hi)
+                    return [self._entry(seq) for seq in seqs], hi
+                stop = hi if limit is None else min(hi, lo + limit)
+                seqs = range(lo, stop)
+            else:
+                code = self._level_codes.get(level.upper())
+                if code is None:
+                    return [], hi
+                entries = self._level_index[code]
+                start = bisect.bisect_left(entries, lo, self._level_heads[code])
+                stop = bisect.bisect_left(entries, hi, start)
+                if tail:
+                    if limit is not None:
+                        start = max(start, stop - limit)
+                    return [self._entry(seq) for seq in entries[start:stop]], hi
+                if limit is not None:
+                    stop = min(stop, start + limit)
+                seqs = entries[start:stop]
+
+            result = [self._entry(seq) for seq in seqs]
+            next_cursor = result[-1]["seq"] + 1 if result and (limit is not None and len(result) >= limit) else hi
+            return result, next_cursor
@@ -0,0 +1,353 @@
+# src/core/base/plugin_runner.py
+
+import importlib
+import itertools
+import multiprocessing
+import pickle
+import queue
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Ausführungsmodi eines Plugins (AbstractPlugin.execution_mode)
+INLINE = "inline"   # Im Thread des Aufrufers: für billige Plugins und solche, die core_context brauchen
+PROCESS = "process" # In einem Worker-Prozess: für CPU-lastige Plugins, die sonst den GIL blockieren
+EXECUTION_MODES = (INLINE, PROCESS)
+
+
+class PluginExecutionError(RuntimeError):
+    """Ein Plugin konnte nicht ausgeführt werden oder ist im Worker-Prozess fehlgeschlagen."""
+
+    def __init__(self, message: str, remote_traceback: Optional[str] = None):
+        super().__init__(message)
+        self.remote_traceback = remote_traceback # Traceback aus dem Worker-Prozess, falls vorhanden
+
+
+class PluginTimeoutError(PluginExecutionError):
+    """Das Zeitlimit ist abgelaufen; ein laufender Worker-Prozess wurde beendet."""
+    pass
+
+
+class PluginCancelledError(PluginExecutionError):
+    """Der Aufruf wurde abgebrochen; ein laufender Worker-Prozess wurde beendet."""
+    pass
+
+
+def _worker_main(conn: Any, preload: Tuple[str, ...]) -> None:
+    """
+    Schleife eines Worker-Prozesses. Nachrichten sind gepickelte Tupel
+    ("ping",) oder ("run", plugin_key, plugin_bytes | None, arguments); ein Plugin wird nur beim
+    ersten Aufruf übertragen und bleibt danach im Worker (samt seinem Zustand) warm.
+    """
+    for module_name in preload:
+        importlib.import_module(module_name)
+    plugins: Dict[Any, Any] = {}
+    while True:
+        try:
+            message = pickle.loads(conn.recv_bytes())
+        except (EOFError, OSError): # Hauptprozess beendet oder Pool heruntergefahren
+            return
+        if message[0] == "ping":
+            conn.send_bytes(pickle.dumps(("ok", None)))
+            continue
+        _, plugin_key, plugin_bytes, arguments = message
+        try:
+            if plugin_bytes is not None:
+                plugins[plugin_key] = pickle.loads(plugin_bytes)
+            reply = ("ok", plugins[plugin_key].run(arguments))
+        except Exception as e:
+            reply = ("error", f"{type(e).__name__}: {e}", traceback.format_exc())
+        try:
+            data = pickle.dumps(reply, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e: # Ergebnis verletzt den Vertrag
+            data = pickle.dumps(("error", f"Ergebnis nicht picklebar: {type(e).__name__}: {e}", None))
+        conn.send_bytes(data)
+
+
+class _PluginWorker:
+    """Ein Worker-Prozess mit seiner Pipe und den Schlüsseln der Plugins, die er bereits kennt."""
+    __slots__ = ("process", "conn", "known")
+
+    def __init__(self, process: Any, conn: Any):
+        self.process = process
+        self.conn = conn
+        self.known: set = set()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.kill()
+        self.process.join(timeout)
+
+
+class PluginTask:
+    """Handle eines mit PluginRunner.submit() gestarteten Aufrufs."""
+    __slots__ = ("plugin_name", "future", "_cancel")
+
+    def __init__(self, plugin_name: str):
+        self.plugin_name = plugin_name
+        self.future: Optional[Future] = None
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Bricht den Aufruf ab: wartend wird er verworfen, im Worker-Prozess wird dieser beendet."""
+        self._cancel.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        return self.future.result(timeout)
+
+
+class PluginRunner:
+    """
+    Führt AbstractPlugin.run je nach execution_mode des Plugins aus: inline im Thread des Aufrufers
+    oder in einem warmen Pool von Worker-Prozessen, sodass CPU-lastige Plugins den Server nicht über
+    den GIL blockieren. Je Plugin begrenzt max_concurrency die gleichzeitigen Aufrufe, timeout die Dauer.
+
+    Vertrag für Prozess-Plugins: Plugin (ohne core_context, siehe AbstractPlugin.__getstate__), Argumente
+    und Ergebnis müssen picklebar sein, die Plugin-Klasse muss auf Modulebene importierbar sein.
+    Timeout und Abbruch beenden den betroffenen Worker-Prozess; der Pool ersetzt ihn sofort.
+    Inline-Aufrufe lassen sich nur vor dem Start abbrechen, ihr Timeout gilt nur für die Wartezeit.
+    """
+    poll_interval = 0.05 # Sekunden zwischen zwei Prüfungen auf Abbruch/Timeout während des Wartens
+
+    def __init__(self, processes: int = 2, start_method: str = "spawn", max_pending: int = 32):
+        """
+        :param processes: Größe des Prozess-Pools.
+        :param start_method: multiprocessing-Startmethode; "spawn" vermeidet fork() aus einem Prozess mit Threads.
+        :param max_pending: Threads für submit(), also gleichzeitig laufende oder wartende asynchrone Aufrufe.
+        """
+        self.processes = processes
+        self._context = multiprocessing.get_context(start_method)
+        self._preload: Tuple[str, ...] = ()
+        self._idle: "queue.Queue[_PluginWorker]" = queue.Queue()
+        self._workers: List[_PluginWorker] = []
+        self._started = False
+        self._closed = False
+        self._lock = threading.Lock()
+        self._limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._payloads: Dict[str, Tuple[Any, Tuple[str, int], bytes]] = {} # Name -> (Plugin, Schlüssel, Pickle)
+        self._payload_keys = itertools.count(1)
+        self._submit_pool = ThreadPoolExecutor(max_workers=max_pending, thread_name_prefix="plugin-runner")
+        self._stats = {"inline": 0, "process": 0, "errors": 0, "timeouts": 0, "cancelled": 0, "worker_restarts": 0}
+
+    # --- Pool ---
+
+    def start(self, preload: Optional[Iterable[str]] = None) -> None:
+        """
+        Startet den Prozess-Pool und wartet, bis jeder Worker antwortet (warm).
+        Schlägt das fehl, werden die gestarteten Worker beendet und PluginExecutionError ausgelöst;
+        der Runner bleibt für INLINE-Plugins nutzbar und der nächste PROCESS-Aufruf versucht es erneut.
+        :param preload: Module, die jeder Worker beim Start importiert (z.B. die der Prozess-Plugins);
+                        bleiben für spätere (Neu-)Starts gespeichert.
+        """
+        with self._lock:
+            if self._closed:
+                raise PluginExecutionError("PluginRunner ist heruntergefahren.")
+            if self._started:
+                return
+            if preload is not None:
+                self._preload = tuple(preload)
+            self._started = True
+            workers: List[_PluginWorker] = []
+            try:
+                for _ in range(self.processes):
+                    workers.append(self._spawn_worker())
+            except Exception as e:
+                self._abort_start(workers)
+                raise PluginExecutionError(f"Worker-Prozess konnte nicht gestartet werden: {e}") from e
+        ping = pickle.dumps(("ping",))
+        for worker in workers:
+            try:
+                worker.conn.send_bytes(ping)
+                worker.conn.recv_bytes()
+            except (EOFError, OSError) as e: # z.B. ein Modul aus 'preload' ist nicht importierbar
+                worker.process.join(1.0)
+                exitcode = worker.process.exitcode
+                with self._lock:
+                    self._abort_start(workers)
+                raise PluginExecutionError(f"Worker-Prozess konnte nicht starten (Exitcode {exitcode}).") from e
+        for worker in workers:
+            self._idle.put(worker)
+
+    def _abort_start(self, workers: List[_PluginWorker]) -> None:
+        # Unter self._lock: fehlgeschlagenen Start zurücknehmen, ohne den Runner zu schließen
+        for worker in workers:
+            worker.stop()
+        self._workers = [w for w in self._workers if w not in workers]
+        self._started = False
+
+    def _spawn_worker(self) -> _PluginWorker:
+        # Unter self._lock
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_worker_main, args=(child_conn, self._preload),
+                                        name="plugin-worker", daemon=True)
+        process.start()
+        child_conn.close()
+        worker = _PluginWorker(process, parent_conn)
+        self._workers.append(worker)
+        return worker
+
+    def _replace_worker(self, worker: _PluginWorker) -> None:
+        """Beendet einen Worker (Timeout, Abbruch, Absturz) und stellt sofort einen frischen in den Pool."""
+        worker.stop()
+        with self._lock:
+            self._workers = [w for w in self._workers if w is not worker]
+            self._stats["worker_restarts"] += 1
+            if self._closed:
+                return
+            replacement = self._spawn_worker()
+        self._idle.put(replacement)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Nimmt keine Aufrufe mehr an und beendet die Worker-Prozesse."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._submit_pool.shutdown(wait=wait)
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.stop()
+
+    # --- Ausführung ---
+
+    def submit(self, plugin: Any, arguments: Dict[str, Any], timeout: Optional[float] = None) -> PluginTask:
+        """Startet einen Aufruf asynchron; das Ergebnis liefert task.result(), abbrechen lässt er sich mit task.cancel()."""
+        task = PluginTask(plugin.plugin_name)
+        task.future = self._submit_pool.submit(self.run, plugin, arguments, timeout, task)
+        return task
+
+    def run(self, plugin: Any, arguments: Dict[str, Any], timeout: Optional[float] = None,
+            task: Optional[PluginTask] = None) -> Any:
+        """
+        Führt plugin.run(arguments) im Modus des Plugins aus und gibt das Ergebnis zurück.
+        'timeout' (sonst plugin.timeout) zählt ab dem Aufruf, inklusive Wartezeit auf freie Plätze.
+        Fehler im Worker-Prozess, Timeout und Abbruch lösen PluginExecutionError (bzw. Unterklassen) aus.
+        """
+        if self._closed:
+            raise PluginExecutionError("PluginRunner ist heruntergefahren.")
+        mode = getattr(plugin, "execution_mode", INLINE)
+        if mode not in EXECUTION_MODES:
+            raise PluginExecutionError(f"Plugin '{plugin.plugin_name}': unbekannter Ausführungsmodus '{mode}'.")
+        timeout = timeout if timeout is not None else getattr(plugin, "timeout", None)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        limit = self._limit(plugin)
+        if limit is not None:
+            self._wait(lambda wait: limit.acquire(timeout=wait), plugin.plugin_name, deadline, task)
+        try:
+            if mode == INLINE:
+                self._count("inline")
+                return plugin.run(arguments)
+            self._count("process")
+            return self._run_in_process(plugin, arguments, deadline, task)
+        finally:
+            if limit is not None:
+                limit.release()
+
+    def _limit(self, plugin: Any) -> Optional[threading.BoundedSemaphore]:
+        max_concurrency = getattr(plugin, "max_concurrency", None)
+        if not max_concurrency:
+            return None
+        with self._lock:
+            limit = self._limits.get(plugin.plugin_name)
+            if limit is None:
+                limit = self._limits[plugin.plugin_name] = threading.BoundedSemaphore(max_concurrency)
+            return limit
+
+    def _wait(self, attempt: Any, plugin_name: str, deadline: Optional[float], task: Optional[PluginTask]) -> Any:
+        """Wiederholt attempt(wartezeit) in kurzen Abschnitten, bis es etwas liefert, Abbruch oder Timeout."""
+        while True:
+            self._check(plugin_name, deadline, task)
+            wait = self.poll_interval if deadline is None else max(0.0, min(self.poll_interval, deadline - time.monotonic()))
+            result = attempt(wait)
+            if result:
+                return result
+
+    def _check(self, plugin_name: str, deadline: Optional[float], task: Optional[PluginTask]) -> None:
+        if task is not None and task.cancel_requested:
+            self._count("cancelled")
+            raise PluginCancelledError(f"Plugin '{plugin_name}' abgebrochen.")
+        if deadline is not None and time.monotonic() >= deadline:
+            self._count("timeouts")
+            raise PluginTimeoutError(f"Plugin '{plugin_name}': Zeitlimit überschritten.")
+
+    def _run_in_process(self, plugin: Any, arguments: Dict[str, Any], deadline: Optional[float],
+                        task: Optional[PluginTask]) -> Any:
+        if not self._started:
+            self.start()
+        plugin_key, plugin_bytes = self._payload(plugin)
+        try:
+            pickle.dumps(arguments, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            raise PluginExecutionError(f"Plugin '{plugin.plugin_name}': Argumente nicht picklebar: {e}") from e
+
+        worker = self._wait(lambda wait: self._take_worker(wait), plugin.plugin_name, deadline, task)
+        try:
+            message = ("run", plugin_key, None if plugin_key in worker.known else plugin_bytes, arguments)
+            worker.conn.send_bytes(pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL))
+            worker.known.add(plugin_key)
+            self._wait(worker.conn.poll, plugin.plugin_name, deadline, task)
+            reply = pickle.loads(worker.conn.recv_bytes())
+        except (EOFError, OSError) as e: # Worker abgestürzt (z.B. Segfault in einer C-Erweiterung)
+            self._replace_worker(worker)
+            self._count("errors")
+            raise PluginExecutionError(f"Plugin '{plugin.plugin_name}': Worker-Prozess beendet ({e}).") from e
+        except PluginExecutionError: # Timeout/Abbruch: der Worker rechnet noch, nur Beenden gibt ihn frei
+            self._replace_worker(worker)
+            raise
+        self._idle.put(worker)
+        if reply[0] == "error":
+            self._count("errors")
+            raise PluginExecutionError(f"Plugin '{plugin.plugin_name}': {reply[1]}", reply[2])
+        return reply[1]
+
+    def _take_worker(self, wait: float) -> Optional[_PluginWorker]:
+        if not self._started: # Start fehlgeschlagen, während dieser Aufruf auf einen Worker wartete
+            raise PluginExecutionError("Prozess-Pool ist nicht verfügbar.")
+        try:
+            return self._idle.get(timeout=wait) if wait > 0 else self._idle.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _payload(self, plugin: Any) -> Tuple[Tuple[str, int], bytes]:
+        """
+        Pickelt ein Prozess-Plugin einmal und vergibt ihm einen Schlüssel; die Worker behalten es danach.
+        Ein neu registriertes Plugin gleichen Namens erhält einen neuen Schlüssel.
+        """
+        with self._lock:
+            cached = self._payloads.get(plugin.plugin_name)
+            if cached is not None and cached[0] is plugin:
+                return cached[1], cached[2]
+        try:
+            plugin_bytes = pickle.dumps(plugin, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            raise PluginExecutionError(f"Plugin '{plugin.plugin_name}' ist nicht picklebar "
+                                       f"(Klasse auf Modulebene definieren): {e}") from e
+        with self._lock:
+            plugin_key = (plugin.plugin_name, next(self._payload_keys))
+            self._payloads[plugin.plugin_name] = (plugin, plugin_key, plugin_bytes)
+        return plugin_key, plugin_bytes
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, processes=len(self._workers), idle=self._idle.qsize(),
+                        started=self._started, closed=self._closed)
@@ -1,24 +1,255 @@
 # Dieser Code würde typischerweise in M4tth4ck333/jan_os/src/core/os/diagnostic.py liegen
 # und von M4tth4ck333/jan_schroeder aus aufgerufen werden.
 
+import collections
+import hashlib
+import json
 import subprocess
 import os
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+
+class CompiledBinaryCache:
+    """
+    Inhaltsadressierter Cache für kompilierte C-Programme.
+    Der Schlüssel ist ein BLAKE2b-Hash über Quelltext, Compiler-Pfad, Flags und Compiler-Version;
+    ein Treffer überspringt die Kompilierung vollständig. Die Binärdateien liegen unter
+    '<cache_dir>/<2 Zeichen>/<Schlüssel>' und werden nach LRU (Datei-mtime, wird bei Treffern
+    aufgefrischt) verdrängt, sobald 'max_bytes' überschritten ist. Wiederholte Anfragen mit
+    identischem Quelltext (und unveränderter Compiler-Datei) werden zusätzlich im Speicher aufgelöst,
+    ohne erneut zu hashen.
+    Da die Binärdateien ausgeführt werden, muss das Verzeichnis dem aktuellen Benutzer gehören und
+    darf für andere nicht beschreibbar sein; fremde oder für andere beschreibbare Einträge werden verworfen.
+    """
+    def __init__(self, cache_dir: str, max_bytes: int = 64 * 1024 * 1024):
+        """
+        :param cache_dir: Verzeichnis des Caches (wird bei Bedarf angelegt, überlebt Neustarts).
+        :param max_bytes: Obergrenze für die Summe aller gecachten Binärdateien.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "collections.OrderedDict[str, int]" = collections.OrderedDict() # Schlüssel -> Größe, LRU zuerst
+        self._bytes = 0
+        self._fast_path: Dict[Tuple[Any, ...], str] = {} # (Quelltext, Compiler, Flags, Compiler-Identität) -> Schlüssel
+        self._versions: Dict[Tuple[str, int, int, int], str] = {} # Compiler-Identität -> Versionsausgabe
+        self._building: Dict[str, threading.Event] = {} # Laufende Kompilierungen, damit parallele Checks nicht doppelt bauen
+        self._stats = {"hits": 0, "memory_hits": 0, "misses": 0, "evictions": 0, "compile_seconds": 0.0}
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        self._check_private_dir(cache_dir)
+        self._load()
+
+    @staticmethod
+    def _is_trusted(stat: os.stat_result) -> bool:
+        """Gehört dem aktuellen Benutzer und ist für Gruppe/andere nicht beschreibbar (ohne POSIX-UIDs: immer)."""
+        if not hasattr(os, "getuid"):
+            return True
+        return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+    def _check_private_dir(self, path: str) -> None:
+        """Stellt sicher, dass das Cache-Verzeichnis ein eigenes, privates Verzeichnis ist (kein Symlink)."""
+        stat = os.lstat(path)
+        if not os.path.isdir(path) or os.path.islink(path):
+            raise PermissionError(f"Cache-Verzeichnis '{path}' ist kein Verzeichnis.")
+        if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+            raise PermissionError(f"Cache-Verzeichnis '{path}' gehört nicht dem aktuellen Benutzer.")
+        if stat.st_mode & 0o077:
+            os.chmod(path, 0o700)
+
+    def _load(self) -> None:
+        """Übernimmt vorhandene, vertrauenswürdige Einträge, älteste Nutzung zuerst."""
+        found = []
+        for shard in os.listdir(self.cache_dir):
+            shard_path = os.path.join(self.cache_dir, shard)
+            shard_stat = os.lstat(shard_path)
+            if not os.path.isdir(shard_path) or os.path.islink(shard_path):
+                continue
+            if not self._is_trusted(shard_stat):
+                continue # Fremde Unterverzeichnisse werden nicht angefasst und nie benutzt
+            for name in os.listdir(shard_path):
+                path = os.path.join(shard_path, name)
+                if name.endswith(".tmp"):
+                    os.remove(path) # Reste abgebrochener Kompilierungen
+                    continue
+                stat = os.lstat(path)
+                if not os.path.isfile(path) or os.path.islink(path) or not self._is_trusted(stat) \
+                        or name[:2] != shard:
+                    os.remove(path) # Nicht von diesem Cache angelegt: nie ausführen
+                    continue
+                found.append((stat.st_mtime, name, stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._bytes += size
+        self._evict()
+
+    @staticmethod
+    def compiler_identity(compiler_path: str) -> Tuple[str, int, int, int]:
+        """(Pfad, mtime, Größe, Inode) der Compiler-Datei: ändert sich bei jedem Update, auch an Ort und Stelle."""
+        resolved = os.path.realpath(compiler_path)
+        try:
+            stat = os.stat(resolved)
+            return (resolved, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            return (resolved, 0, 0, 0)
+
+    def compiler_version(self, compiler_path: str) -> str:
+        """Versionsausgabe des Compilers (-v), gemerkt solange sich die Compiler-Datei nicht ändert."""
+        identity = self.compiler_identity(compiler_path)
+        version = self._versions.get(identity)
+        if version is None:
+            try:
+                result = subprocess.run([compiler_path, '-v'], capture_output=True, text=True, timeout=10)
+                version = (result.stdout + result.stderr).strip()
+            except (OSError, subprocess.SubprocessError) as e:
+                version = f"unknown ({e})"
+            self._versions[identity] = version
+        return version
+
+    def key_for(self, source: str, compiler_path: str, flags: Sequence[str] = ()) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        for part in (source, os.path.realpath(compiler_path), "\0".join(flags), self.compiler_version(compiler_path)):
+            digest.update(part.encode('utf-8'))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get_or_build(self, source: str, compiler_path: str, flags: Sequence[str],
+                     build: Callable[[str], bool]) -> Tuple[Optional[str], bool]:
+        """
+        Liefert den Pfad der Binärdatei für diesen Quelltext und ob sie aus dem Cache stammt.
+        Bei einem Fehlschlag wird 'build(output_path)' aufgerufen; liefert es False, ist der Pfad None.
+        """
+        flags = tuple(flags)
+        # Die Compiler-Identität (ein stat) gehört in den Schnellpfad: ein aktualisierter Compiler
+        # ergibt sonst bis zum Neustart weiter die alten Binärdateien
+        fast_key = (source, compiler_path, flags, self.compiler_identity(compiler_path))
+        with self._lock:
+            key = self._fast_path.get(fast_key)
+            if key is not None and key in self._entries and os.path.exists(self.path_for(key)):
+                self._touch(key)
+                self._stats["hits"] += 1
+                self._stats["memory_hits"] += 1
+                return self.path_for(key), True
+        key = self.key_for(source, compiler_path, flags)
+        path = self.path_for(key)
+        while True:
+            with self._lock:
+                self._fast_path[fast_key] = key
+                if key in self._entries and os.path.exists(path):
+                    self._touch(key)
+                    self._stats["hits"] += 1
+                    return path, True
+                in_flight = self._building.get(key)
+                if in_flight is None:
+                    self._building[key] = threading.Event()
+                    self._stats["misses"] += 1
+                    break
+            in_flight.wait() # Ein anderer Thread baut gerade denselben Schlüssel
+        try:
+            return self._build(key, path, build), False
+        finally:
+            with self._lock:
+                self._building.pop(key).set()
+
+    def _build(self, key: str, path: str, build: Callable[[str], bool]) -> Optional[str]:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        # In eine temporäre Datei kompilieren und atomar umbenennen: parallele Checks sehen nie halbe Binärdateien
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        started = time.perf_counter()
+        built = build(temp_path)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._stats["compile_seconds"] += elapsed
+            if not built or not os.path.exists(temp_path):
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                return None
+            os.replace(temp_path, path)
+            size = os.path.getsize(path)
+            self._bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._evict(keep=key)
+        return path
+
+    def _touch(self, key: str) -> None:
+        self._entries.move_to_end(key)
+        try:
+            os.utime(self.path_for(key)) # LRU-Reihenfolge über Neustarts hinweg erhalten
+        except OSError:
+            pass
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            key, size = next(iter(self._entries.items()))
+            if key == keep:
+                break # Der gerade gebaute Eintrag bleibt, auch wenn er allein das Budget sprengt
+            del self._entries[key]
+            self._bytes -= size
+            self._stats["evictions"] += 1
+            try:
+                os.remove(self.path_for(key))
+            except OSError:
+                pass
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return dict(self._stats, hit_rate=(self._stats["hits"] / lookups) if lookups else 0.0,
+                        entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
+
 
 class OsDiagnosticService:
     """
     Dienst zur Durchführung von OS-Basis-Checks mittels Tiny C Compiler.
+    Kompilierte Check-Programme werden in einem CompiledBinaryCache gehalten, sodass wiederholte
+    Diagnosen nur noch die Ausführung kosten. run_diagnostic_suite() führt viele Checks parallel aus,
+    bevorzugt per 'tcc -run' direkt aus dem Speicher.
     """
-    def __init__(self, tcc_path: str):
+    BASIS_CHECK_SOURCE = """
+        #include <stdio.h>
+        #include <stdlib.h> // Für EXIT_SUCCESS/EXIT_FAILURE
+
+        int main() {
+            printf("TCC_CHECK_OK\\n");
+            return EXIT_SUCCESS;
+        }
+        """
+    BASIS_CHECK_OUTPUT = "TCC_CHECK_OK"
+
+    # Ausführungsarten der Diagnose-Suite, in der Reihenfolge, in der sie probiert werden
+    RUN_STDIN = "run_stdin" # tcc -run - (Quelltext über stdin, keine Dateien)
+    RUN_FILE = "run_file" # tcc -run datei.c (für Compiler/Stand-ins ohne stdin-Unterstützung)
+    COMPILE = "compile" # Kompilieren (über den Binär-Cache) und Binärdatei ausführen
+
+    def __init__(self, tcc_path: str, cache_dir: Optional[str] = None, cache_max_bytes: int = 64 * 1024 * 1024,
+                 tcc_flags: Sequence[str] = ()):
         """
         Initialisiert den Diagnose-Dienst.
         :param tcc_path: Pfad zum ausführbaren Tiny C Compiler.
+        :param cache_dir: Verzeichnis des Binär-Caches (Standard: default_cache_dir(), pro Benutzer).
+        :param cache_max_bytes: Größenbudget des Binär-Caches.
+        :param tcc_flags: Zusätzliche Compiler-Flags; gehen in den Cache-Schlüssel ein.
         """
         if not os.path.exists(tcc_path):
             raise FileNotFoundError(f"Tiny C Compiler not found at: {tcc_path}")
         self.tcc_path = tcc_path
+        self.tcc_flags = tuple(tcc_flags)
+        self.binary_cache = CompiledBinaryCache(cache_dir or self.default_cache_dir(), max_bytes=cache_max_bytes)
+        self._run_mode: Optional[str] = None # Wird beim ersten Suite-Lauf ermittelt
         print(f"[OsDiagnosticService] Initialized with TCC at: {self.tcc_path}")
 
+    @staticmethod
+    def default_cache_dir() -> str:
+        """Privater Cache pro Benutzer ($XDG_CACHE_HOME/neet/tcc bzw. ~/.cache/neet/tcc), nie ein geteiltes Temp-Verzeichnis."""
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(base, "neet", "tcc")
+
     def _compile_c_code(self, c_code: str, output_path: str) -> bool:
         """
         Kompiliert den gegebenen C-Code mit Tiny C.
@@ -26,6 +257,7 @@ class OsDiagnosticService:
         :param output_path: Pfad zur Ausgabedatei (Executable).
         :return: True bei Erfolg, False sonst.
         """
+        c_file_path = None
         try:
             with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".c") as tmp_c_file:
                 tmp_c_file.write(c_code)
@@ -34,7 +266,7 @@ class OsDiagnosticService:
             # Beispiel: TCC aufrufen, um eine ausführbare Datei zu erstellen
             # '-o' für die Ausgabedatei
             # '-run' ist NICHT hier, da wir NUR kompilieren wollen
-            command = [self.tcc_path, c_file_path, '-o', output_path]
+            command = [self.tcc_path, *self.tcc_flags, c_file_path, '-o', output_path]
             print(f"[OsDiagnosticService] Compiling C code: {' '.join(command)}")
             result = subprocess.run(command, capture_output=True, text=True, check=True)
             print(f"  STDOUT: {result.stdout}")
@@ -47,13 +279,14 @@ class OsDiagnosticService:
             print(f"[OsDiagnosticService] Unexpected Compilation Error: {e}")
             return False
         finally:
-            if os.path.exists(c_file_path):
+            if c_file_path and os.path.exists(c_file_path):
                 os.remove(c_file_path) # Temporäre C-Datei aufräumen
 
-    def _execute_c_program(self, program_path: str) -> tuple[int, str]:
+    def _execute_c_program(self, program_path: str, cleanup: bool = True) -> tuple[int, str]:
         """
         Führt das kompilierte C-Programm aus und gibt den Rückgabewert und die Ausgabe zurück.
         :param program_path: Pfad zur ausführbaren C-Datei.
+        :param cleanup: Binärdatei danach löschen (nicht bei Programmen aus dem Cache).
         :return: Tuple (return_code, stdout_output).
         """
         try:
@@ -67,9 +300,17 @@ class OsDiagnosticService:
             print(f"[OsDiagnosticService] Unexpected Execution Error: {e}")
             return -1, str(e)
         finally:
-            if os.path.exists(program_path):
+            if cleanup and os.path.exists(program_path):
                 os.remove(program_path) # Ausführbare Datei aufräumen
 
+    def _compile_cached(self, c_code: str) -> Tuple[Optional[str], dict]:
+        """Holt die Binärdatei aus dem Cache oder kompiliert sie; liefert Pfad und Cache-Angaben für das Ergebnis."""
+        started = time.perf_counter()
+        exec_path, hit = self.binary_cache.get_or_build(
+            c_code, self.tcc_path, self.tcc_flags, lambda output_path: self._compile_c_code(c_code, output_path))
+        return exec_path, {"cache_hit": hit, "cache_hit_rate": self.binary_cache.get_stats()["hit_rate"],
+                           "compile_time": 0.0 if hit else time.perf_counter() - started}
+
     def perform_self_induced_tcc_check(self) -> dict:
         """
         Führt einen Basis-Check mittels "Self-Induced Tiny CCC Chain" durch.
@@ -80,34 +321,163 @@ class OsDiagnosticService:
         # 1. Generiere einfachen C-Code
         # Dieser Code gibt eine feste Zeichenkette aus und testet printf
         # Bei Erfolg sollte "TCC_CHECK_OK" ausgegeben werden
-        c_code_snippet = """
-        #include <stdio.h>
-        #include <stdlib.h> // Für EXIT_SUCCESS/EXIT_FAILURE
-
-        int main() {
-            printf("TCC_CHECK_OK\\n");
-            return EXIT_SUCCESS;
-        }
-        """
+        c_code_snippet = self.BASIS_CHECK_SOURCE
         
-        # Temporäre Pfade für die kompilierte Binärdatei
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".out") as tmp_exec_file:
-            exec_path = tmp_exec_file.name
-
-        # 2. Kompiliere den C-Code
-        if not self._compile_c_code(c_code_snippet, exec_path):
-            return {"status": "FAILED", "reason": "C compilation failed."}
+        # 2. Kompiliere den C-Code (oder nimm die gecachte Binärdatei)
+        exec_path, cache_info = self._compile_cached(c_code_snippet)
+        if exec_path is None:
+            return dict(cache_info, status="FAILED", reason="C compilation failed.")
 
-        # 3. Führe die kompilierte Binärdatei aus
-        return_code, output = self._execute_c_program(exec_path)
+        # 3. Führe die kompilierte Binärdatei aus (bleibt im Cache erhalten)
+        return_code, output = self._execute_c_program(exec_path, cleanup=False)
 
         # 4. Werte das Ergebnis aus
         if return_code == 0 and "TCC_CHECK_OK" in output:
             print("[OsDiagnosticService] Self-induced Tiny CCC check PASSED.")
-            return {"status": "PASSED", "output": output, "return_code": return_code}
+            return dict(cache_info, status="PASSED", output=output, return_code=return_code)
         else:
             print(f"[OsDiagnosticService] Self-induced Tiny CCC check FAILED (Code: {return_code}, Output: '{output}').")
-            return {"status": "FAILED", "output": output, "return_code": return_code}
+            return dict(cache_info, status="FAILED", output=output, return_code=return_code)
+
+    # --- Diagnose-Suite ---
+
+    def detect_run_mode(self) -> str:
+        """
+        Ermittelt einmalig, wie Checks ausgeführt werden: der Basis-Check wird erst per 'tcc -run -'
+        über stdin, dann per 'tcc -run datei.c' probiert; klappt beides nicht, wird kompiliert.
+        """
+        if self._run_mode is None:
+            self._run_mode = self.COMPILE
+            for mode in (self.RUN_STDIN, self.RUN_FILE):
+                result = self._run_check_in_mode(mode, "mode_probe", self.BASIS_CHECK_SOURCE,
+                                                 self.BASIS_CHECK_OUTPUT, timeout=10.0)
+                if result["status"] == "PASSED":
+                    self._run_mode = mode
+                    break
+            print(f"[OsDiagnosticService] Diagnostic suite execution mode: {self._run_mode}")
+        return self._run_mode
+
+    def run_diagnostic_suite(self, checks: Iterable[Union[Dict[str, Any], Tuple[str, str]]],
+                             max_workers: Optional[int] = None, timeout: float = 10.0) -> dict:
+        """
+        Führt viele C-Checks nebenläufig aus und liefert pro Check Status, Ausgabe und Zeiten.
+        :param checks: Dicts {"name", "code", optional "expect" (erwartete Teilausgabe) und "timeout"}
+                       oder Tupel (name, code). Ein Check besteht bei Rückgabewert 0 und erwarteter Ausgabe.
+        :param max_workers: Obergrenze gleichzeitig laufender Compiler-/Check-Prozesse (Standard: CPU-Anzahl).
+        :param timeout: Zeitlimit pro Check in Sekunden; überschreitende Prozesse werden beendet.
+        """
+        specs = [check if isinstance(check, dict) else {"name": check[0], "code": check[1]} for check in checks]
+        mode = self.detect_run_mode()
+        started = time.perf_counter()
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(specs) or 1))
+        # Jeder Check läuft in einem eigenen Kindprozess; die Threads warten nur auf diese Prozesse,
+        # die Pool-Größe begrenzt also die Anzahl gleichzeitig laufender Prozesse
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tcc-check") as executor:
+            results = list(executor.map(
+                lambda spec: self._run_check_in_mode(mode, spec.get("name", "check"), spec["code"], spec.get("expect"),
+                                                     spec.get("timeout", timeout)), specs))
+        passed = sum(1 for result in results if result["status"] == "PASSED")
+        summary = {"status": "PASSED" if passed == len(results) else "FAILED", "mode": mode,
+                   "passed": passed, "failed": len(results) - passed,
+                   "total_time": time.perf_counter() - started, "checks": results}
+        print(f"[OsDiagnosticService] Diagnostic suite finished: {passed}/{len(results)} passed "
+              f"in {summary['total_time']:.3f}s ({mode}).")
+        return summary
+
+    def _run_check_in_mode(self, mode: str, name: str, c_code: str, expect: Optional[str], timeout: float) -> dict:
+        started = time.perf_counter()
+        result: Dict[str, Any] = {"name": name, "mode": mode, "compile_time": 0.0}
+        c_file_path = None
+        try:
+            if mode == self.RUN_STDIN:
+                completed = self._run_process([self.tcc_path, *self.tcc_flags, '-run', '-'], c_code, timeout)
+            elif mode == self.RUN_FILE:
+                with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".c") as tmp_c_file:
+                    tmp_c_file.write(c_code)
+                    c_file_path = tmp_c_file.name
+                completed = self._run_process([self.tcc_path, *self.tcc_flags, '-run', c_file_path], None, timeout)
+            else:
+                exec_path, cache_info = self._compile_cached(c_code)
+                result.update(cache_info)
+                result["compile_time"] = cache_info["compile_time"]
+                if exec_path is None:
+                    return dict(result, status="FAILED", reason="C compilation failed.", return_code=None,
+                                output="", stderr="", duration=time.perf_counter() - started)
+                completed = self._run_process([exec_path], None, max(timeout - (time.perf_counter() - started), 0.001))
+        except subprocess.TimeoutExpired as e:
+            return dict(result, status="TIMEOUT", return_code=None, output=self._text(e.stdout),
+                        stderr=self._text(e.stderr), duration=time.perf_counter() - started)
+        except OSError as e:
+            return dict(result, status="ERROR", reason=str(e), return_code=None, output="", stderr="",
+                        duration=time.perf_counter() - started)
+        finally:
+            if c_file_path and os.path.exists(c_file_path):
+                os.remove(c_file_path)
+        output = completed.stdout.strip()
+        ok = completed.returncode == 0 and (expect is None or expect in output)
+        return dict(result, status="PASSED" if ok else "FAILED", return_code=completed.returncode,
+                    output=output, stderr=completed.stderr.strip(), duration=time.perf_counter() - started)
+
+    @staticmethod
+    def _run_process(command: List[str], stdin_text: Optional[str], timeout: float) -> subprocess.CompletedProcess:
+        # subprocess.run beendet den Kindprozess selbst, wenn das Zeitlimit überschritten wird
+        return subprocess.run(command, input=stdin_text, capture_output=True, text=True, timeout=timeout)
+
+    @staticmethod
+    def _text(value: Any) -> str:
+        if value is None:
+            return ""
+        return (value.decode(errors='replace') if isinstance(value, bytes) else value).strip()
+
+
+TCC_STAND_IN_SCRIPT = r"""#!/bin/bash
+# TCC-Stand-in: prüft nur, ob die Klammern im Quelltext ausgeglichen sind, und "führt" das Programm
+# aus, indem es die Texte seiner printf-Aufrufe ausgibt. 'tcc -run -' (stdin) wird nicht unterstützt.
+source_file=""
+output_file=""
+args=("$@")
+for ((i = 0; i < ${#args[@]}; i++)); do
+  case "${args[$i]}" in
+    -o) output_file="${args[$((i + 1))]}" ;;
+    *.c) source_file="${args[$i]}" ;;
+  esac
+done
+if [[ -z "$source_file" ]]; then
+  echo 'Simulating TCC call, nothing to compile or run.'
+  exit 0
+fi
+for pair in '()' '{}'; do
+  opened=$(tr -cd "${pair:0:1}" < "$source_file" | wc -c)
+  closed=$(tr -cd "${pair:1:1}" < "$source_file" | wc -c)
+  if [[ "$opened" != "$closed" ]]; then
+    echo "$source_file: error: unbalanced '$pair'" >&2
+    exit 1
+  fi
+done
+output=$(grep -o 'printf("[^"]*' "$source_file" | sed 's/^printf("//; s/\\n$//')
+if [[ -n "$output_file" ]]; then
+  echo 'Simulating TCC compilation...'
+  { echo '#!/bin/bash'; echo "cat <<'EOF'"; echo "$output"; echo 'EOF'; } > "$output_file"
+  chmod +x "$output_file"
+  exit 0
+fi
+echo "$output"
+"""
+
+
+def write_tcc_stand_in(path: str) -> str:
+    """
+    Legt ein Shell-Skript an, das TCC für Demo und Tests simuliert (siehe TCC_STAND_IN_SCRIPT).
+    Syntaxfehler in Form unausgeglichener Klammern schlagen wie beim echten Compiler fehl.
+    :param path: Zielpfad des Skripts.
+    :return: Der absolute Pfad des Skripts (für subprocess, das sonst im PATH sucht).
+    """
+    path = os.path.abspath(path)
+    with open(path, "w") as f:
+        f.write(TCC_STAND_IN_SCRIPT)
+    os.chmod(path, 0o755)
+    return path
+
 
 # --- Beispiel der Nutzung (würde typischerweise von jan_schroeder aufgerufen) ---
 if __name__ == "__main__":
@@ -118,31 +488,16 @@ if __name__ == "__main__":
     
     # Dummy-Pfad für das Beispiel. Du musst hier den echten Pfad angeben!
     # Angenommen, du hast TCC in deinem jan_os Repo unter bin/tcc kompiliert
-    dummy_tcc_path = "tcc" # Oder "./bin/tcc" wenn du es so kompilierst
+    # Absolut, sonst sucht subprocess "tcc" im PATH statt im aktuellen Verzeichnis
+    dummy_tcc_path = os.path.abspath("tcc") # Oder os.path.abspath("./bin/tcc") wenn du es so kompilierst
     
     # Simuliere eine Dummy TCC-Installation, falls du noch keine hast
     # (Diese Zeilen NICHT im Produktivcode verwenden!)
+    created_dummy = False
     if not os.path.exists(dummy_tcc_path):
         print(f"Warning: TCC not found at '{dummy_tcc_path}'. Creating a dummy executable for demonstration.")
-        # Erstelle ein Shell-Skript, das TCC simuliert
-        with open(dummy_tcc_path, "w") as f:
-            f.write("#!/bin/bash\n")
-            f.write("if [[ \"$*\" == *'-o'* && \"$*\" == *'.c'* ]]; then\n")
-            f.write("  echo 'Simulating TCC compilation...'\n")
-            f.write("  output_file=$(echo \"$*\" | sed -n 's/.*-o \\([^ ]*\\).*/\\1/p')\n")
-            f.write("  echo '#!/bin/bash' > \"$output_file\"\n")
-            f.write("  echo \"echo 'TCC_CHECK_OK'\" >> \"$output_file\"\n")
-            f.write("  chmod +x \"$output_file\"\n")
-            f.write("  exit 0\n")
-            f.write("elif [[ \"$*\" == *'.c'* ]]; then\n")
-            f.write("  echo 'Simulating TCC compilation for direct run...'\n")
-            f.write("  echo 'TCC_CHECK_OK'\n")
-            f.write("  exit 0\n")
-            f.write("else\n")
-            f.write("  echo 'Simulating TCC call, nothing to compile or run.'\n")
-            f.write("  exit 0\n")
-            f.write("fi\n")
-        os.chmod(dummy_tcc_path, 0o755)
+        write_tcc_stand_in(dummy_tcc_path)
+        created_dummy = True
         print(f"Dummy TCC executable created at '{dummy_tcc_path}'. Remember to replace with real TCC!")
 
     try:
@@ -160,12 +515,20 @@ if __name__ == "__main__":
         compilation_error_check = os_checker._compile_c_code(error_c_code, exec_path_err)
         print(f"Compilation expected to fail: {not compilation_error_check}")
 
+        # Diagnose-Suite: mehrere Checks parallel, mit Zeitlimit pro Check
+        print("\n--- Diagnostic Suite ---")
+        suite_result = os_checker.run_diagnostic_suite([
+            {"name": "basis", "code": OsDiagnosticService.BASIS_CHECK_SOURCE, "expect": "TCC_CHECK_OK"},
+            ("syntax_error", error_c_code),
+        ], timeout=5.0)
+        print(json.dumps(suite_result, indent=2))
+
     except FileNotFoundError as e:
         print(f"Error: {e}. Please ensure Tiny C is compiled and the path is correct.")
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
     finally:
         # Aufräumen des Dummy-TCCs, falls erstellt
-        if os.path.exists(dummy_tcc_path) and "Dummy" in dummy_tcc_path: # Check, ob es unser Dummy ist
+        if created_dummy and os.path.exists(dummy_tcc_path): # Nur unseren eigenen Dummy entfernen
              os.remove(dummy_tcc_path)
              print(f"Cleaned up dummy TCC executable at '{dummy_tcc_path}'.")
@@ -1,8 +1,9 @@
-import hashlib
 import random
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, TypeVar, Generic
 
+from core.base.canonical_hash import sha256_hex
+
 # Typ-Variable für die Art des generierten Objekts
 T = TypeVar('T')
 
@@ -40,15 +41,14 @@ class RandomGenerator(ABC, Generic[T]):
 
     def get_hash(self, data: Any) -> str:
         """
-        Generiert einen SHA256-Hash der gegebenen Daten.
+        Generiert einen SHA256-Hash der gegebenen Daten über ihre kanonische Kodierung.
         Nützlich für die Integrität oder Einzigartigkeit von generierten Objekten.
+        Nicht kanonisch kodierbare Objekte werden über ihre String-Darstellung gehasht.
         """
-        if isinstance(data, dict):
-            # Für Dictionaries: Sortiere Keys für konsistenten Hash
-            data_str = str(sorted(data.items()))
-        else:
-            data_str = str(data)
-        return hashlib.sha256(data_str.encode('utf-8')).hexdigest()
+        try:
+            return sha256_hex(data)
+        except TypeError:
+            return sha256_hex(str(data))
 
     def set_seed(self, seed: int):
         """Setzt den Seed des Generators neu, um die Abfolge zu ändern."""
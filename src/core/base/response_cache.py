@@ -0,0 +1,113 @@
+# src/core/base/response_cache.py
+
+import collections
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from core.base.serialization import Serializer
+
+CacheKey = Tuple[str, bytes, int] # (Endpunkt, Query-String, Version der Sammlung)
+
+
+def make_etag(collection: str, key: CacheKey) -> str:
+    """
+    Starker ETag aus Sammlung, Version und einem kurzen Hash von Endpunkt und Query.
+    Gleiche Version und gleiche Anfrage ergeben denselben ETag, ohne dass der Body gehasht wird.
+    """
+    endpoint, query, version = key
+    digest = hashlib.blake2b(endpoint.encode('utf-8') + b"?" + query, digest_size=8).hexdigest()
+    return f'"{collection}-{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Prüft einen If-None-Match-Header (Liste, '*' und W/-Präfix; schwacher Vergleich wie in RFC 9110)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    Kleiner LRU-Cache für fertig serialisierte Antworten, Schlüssel (Endpunkt, Query, Version).
+    Da die Version Teil des Schlüssels ist, muss nie invalidiert werden: nach einer Änderung wird
+    der alte Eintrag einfach nicht mehr getroffen und fällt irgendwann aus dem LRU.
+    """
+
+    def __init__(self, max_entries: int = 256, max_body_bytes: int = 1024 * 1024):
+        """
+        :param max_entries: Anzahl gehaltener Antworten.
+        :param max_body_bytes: Größere Antworten werden nicht gecacht (z.B. große Log-Seiten).
+        """
+        self.max_entries = max_entries
+        self.max_body_bytes = max_body_bytes
+        self._entries: "collections.OrderedDict[CacheKey, bytes]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "not_modified": 0}
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return body
+
+    def put(self, key: CacheKey, body: bytes) -> None:
+        if len(body) > self.max_body_bytes:
+            return
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_build(self, key: CacheKey, build: Callable[[], bytes],
+                     current_version: Callable[[], int]) -> bytes:
+        """
+        Liefert den gecachten Body oder baut ihn. Gespeichert wird nur, wenn sich die Version während
+        des Bauens nicht geändert hat, damit ein ETag nie auf zwei verschiedene Bodies zeigt.
+        """
+        body = self.get(key)
+        if body is None:
+            body = build()
+            if current_version() == key[2]:
+                self.put(key, body)
+        return body
+
+    def count_not_modified(self) -> None:
+        with self._lock:
+            self._stats["not_modified"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), max_entries=self.max_entries)
+
+
+def cached_response(cache: ResponseCache, collection: str, serializer: Serializer, path: str, query: bytes,
+                    if_none_match: Optional[str], current_version: Callable[[], int],
+                    build: Callable[[Serializer], bytes]) -> Tuple[int, bytes, Dict[str, str]]:
+    """
+    Gemeinsame Logik der API-Server für gecachte GET-Antworten: starker ETag aus der Version der
+    zugrunde liegenden Sammlung; passt 'If-None-Match', gibt es 304 ohne Body, sonst kommt der Body
+    für (Endpunkt, Format, Query, Version) aus dem Cache und wird nur bei neuer Version neu gebaut.
+    Gibt (Status, Body, Header) zurück; build(serializer) liefert die Bytes.
+    """
+    key = (f"{path}#{serializer.format}", query, current_version())
+    etag = make_etag(collection, key)
+    # no-cache: Client darf speichern, muss aber revalidieren; Vary, weil das Format vom Accept-Header abhängt
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+    if etag_matches(if_none_match, etag):
+        cache.count_not_modified()
+        return 304, b"", headers
+    return 200, cache.get_or_build(key, lambda: build(serializer), current_version), headers
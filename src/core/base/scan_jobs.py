@@ -0,0 +1,293 @@
+# src/core/base/scan_jobs.py
+
+import collections
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable, Iterable, Deque, Union
+
+from core.base.log_store import format_timestamp
+from core.base.target_set import TargetSet
+
+# Zustände eines Scan-Jobs
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+class ScanJob:
+    """Ein einzelner Scan-Auftrag für ein Ziel."""
+    __slots__ = ("job_id", "target", "scan_type", "batch_id", "status", "progress",
+                 "submitted_at", "started_at", "finished_at", "result", "error")
+
+    def __init__(self, job_id: str, target: str, scan_type: str, batch_id: Optional[str] = None):
+        self.job_id = job_id
+        self.target = target
+        self.scan_type = scan_type
+        self.batch_id = batch_id
+        self.status = QUEUED
+        self.progress = 0.0
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "target": self.target,
+            "scan_type": self.scan_type,
+            "batch_id": self.batch_id,
+            "status": self.status,
+            "progress": self.progress,
+            "submitted": format_timestamp(self.submitted_at),
+            "started": format_timestamp(self.started_at) if self.started_at else None,
+            "finished": format_timestamp(self.finished_at) if self.finished_at else None,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class ScanBatch:
+    """Sammel-Auftrag, z.B. ein in Einzel-Hosts zerlegtes Netz. Zählt nur Fortschritt, hält keine Jobs."""
+    __slots__ = ("batch_id", "targets", "total", "queued", "completed", "failed", "submitted_at")
+
+    def __init__(self, batch_id: str, targets: List[str], total: int):
+        self.batch_id = batch_id
+        self.targets = targets
+        self.total = total # Anzahl Einzelziele nach Expansion und Deduplizierung
+        self.queued = 0 # Bisher als Job angelegte Einzelziele
+        self.completed = 0
+        self.failed = 0
+        self.submitted_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        done = self.completed + self.failed
+        return {
+            "batch_id": self.batch_id,
+            "targets": self.targets,
+            "total": self.total,
+            "queued": self.queued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "progress": (done / self.total) if self.total else 1.0,
+            "status": COMPLETED if done == self.total else RUNNING,
+            "submitted": format_timestamp(self.submitted_at),
+        }
+
+
+class ScanJobEngine:
+    """
+    Asynchrone Scan-Job-Engine.
+    Aufträge werden sofort mit einer Job-ID quittiert und auf einem begrenzten Worker-Pool
+    ausgeführt. Pro Ziel laufen höchstens 'per_target_limit' Jobs gleichzeitig, weitere warten.
+    Sammel-Aufträge werden lazy expandiert: Es existieren nie mehr Jobs als gerade benötigt.
+    """
+    _max_retained_batches = 1000
+
+    def __init__(self, scan_function: Callable[[ScanJob, Callable[[float], None]], Dict[str, Any]],
+                 max_workers: int = 8, per_target_limit: int = 1, max_retained_jobs: int = 10000,
+                 on_finished: Optional[Callable[[ScanJob], None]] = None,
+                 on_update: Optional[Callable[[ScanJob], None]] = None):
+        """
+        :param scan_function: Führt den Scan aus; erhält den Job und einen Fortschritts-Callback (0.0-1.0).
+        :param max_workers: Größe des Worker-Pools.
+        :param per_target_limit: Maximale gleichzeitige Jobs pro Ziel.
+        :param max_retained_jobs: Anzahl abgeschlossener Jobs, deren Status abrufbar bleibt.
+        :param on_finished: Optionaler Callback nach Abschluss (erfolgreich oder fehlgeschlagen).
+        :param on_update: Optionaler Callback bei Start, Fortschritt und Abschluss eines Jobs (z.B. Live-Feed).
+        """
+        self._scan_function = scan_function
+        self._max_workers = max_workers
+        self._per_target_limit = per_target_limit
+        self._max_retained_jobs = max_retained_jobs
+        self._on_finished = on_finished
+        self._on_update = on_update
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scan-worker")
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+        self._batch_ids = itertools.count(1)
+        self._jobs: Dict[str, ScanJob] = {} # Aktive Jobs
+        self._finished: "collections.OrderedDict[str, ScanJob]" = collections.OrderedDict() # Begrenzte Historie
+        self._batches: Dict[str, ScanBatch] = {}
+        self._pending_batches: Deque[tuple] = collections.deque() # (ScanBatch, scan_type, Iterator[str])
+        self._ready: Deque[ScanJob] = collections.deque() # Eingereihte Jobs in Startreihenfolge
+        self._waiting: Dict[str, Deque[ScanJob]] = {} # Jobs, deren Ziel gerade ausgelastet ist
+        self._active_per_target: Dict[str, int] = {}
+        self._in_flight = 0
+        self._shutdown = False
+
+    # --- Einreichen ---
+
+    def submit(self, target: str, scan_type: str = "quick_scan") -> str:
+        """Reiht einen Scan ein und gibt sofort die Job-ID zurück."""
+        with self._lock:
+            self._check_running()
+            job = self._new_job(target, scan_type, None)
+            self._ready.append(job)
+            self._pump()
+        return job.job_id
+
+    def submit_many(self, targets: Union[Iterable[str], TargetSet], scan_type: str = "quick_scan", per_host: bool = True) -> str:
+        """
+        Reiht einen Sammel-Auftrag ein und gibt sofort die Batch-ID zurück.
+        Mit per_host=True werden die Ziele als TargetSet ausgewertet: Netze und Bereiche werden
+        lazy in Einzel-Hosts zerlegt (ein Job pro Host), Überlappungen nur einmal gescannt und
+        Specs mit '!'-Präfix ausgeschlossen.
+        """
+        if isinstance(targets, TargetSet):
+            target_set, targets = targets, targets.to_specs()
+        else:
+            targets = list(targets)
+            target_set = TargetSet.from_specs(targets) if per_host else None
+        if target_set is not None:
+            iterator, total = iter(target_set), len(target_set)
+        else:
+            iterator, total = iter(targets), len(targets)
+        with self._lock:
+            self._check_running()
+            batch = ScanBatch(f"batch_{next(self._batch_ids):06d}", targets, total)
+            self._batches[batch.batch_id] = batch
+            while len(self._batches) > self._max_retained_batches:
+                self._batches.pop(next(iter(self._batches)))
+            self._pending_batches.append((batch, scan_type, iterator))
+            self._pump()
+        return batch.batch_id
+
+    def _check_running(self) -> None:
+        if self._shutdown:
+            raise RuntimeError("Die ScanJobEngine wurde heruntergefahren und nimmt keine Jobs mehr an.")
+
+    def _new_job(self, target: str, scan_type: str, batch: Optional[ScanBatch]) -> ScanJob:
+        job = ScanJob(f"job_{next(self._job_ids):08d}", target, scan_type, batch.batch_id if batch else None)
+        self._jobs[job.job_id] = job
+        if batch is not None:
+            batch.queued += 1
+        return job
+
+    def _pump(self) -> None:
+        """
+        Startet Jobs, solange Worker frei sind. Sammel-Aufträge werden dabei nur so weit
+        expandiert, wie es die freien Plätze erfordern. Muss unter self._lock aufgerufen werden.
+        """
+        while not self._shutdown and self._in_flight < self._max_workers:
+            if not self._ready and not self._refill_from_batches():
+                return
+            job = self._ready.popleft()
+            if self._active_per_target.get(job.target, 0) >= self._per_target_limit:
+                # Ziel ausgelastet: Job parken, er wird beim Abschluss eines Jobs für dasselbe Ziel freigegeben
+                self._waiting.setdefault(job.target, collections.deque()).append(job)
+                continue
+            self._active_per_target[job.target] = self._active_per_target.get(job.target, 0) + 1
+            self._in_flight += 1
+            self._executor.submit(self._run, job)
+
+    def _refill_from_batches(self) -> bool:
+        while self._pending_batches and not self._ready:
+            batch, scan_type, iterator = self._pending_batches[0]
+            target = next(iterator, None)
+            if target is None:
+                self._pending_batches.popleft()
+                continue
+            self._ready.append(self._new_job(target, scan_type, batch))
+        return bool(self._ready)
+
+    # --- Ausführen ---
+
+    def _run(self, job: ScanJob) -> None:
+        job.status = RUNNING
+        job.started_at = time.time()
+        self._notify(job)
+
+        def report_progress(fraction: float) -> None:
+            job.progress = max(0.0, min(1.0, fraction))
+            if job.progress < 1.0: # 100 % meldet der Abschluss
+                self._notify(job)
+
+        try:
+            job.result = self._scan_function(job, report_progress)
+            job.status = COMPLETED
+            job.progress = 1.0
+        except Exception as e:
+            job.status = FAILED
+            job.error = str(e)
+        job.finished_at = time.time()
+        self._finish(job)
+        self._notify(job)
+        if self._on_finished:
+            self._on_finished(job)
+
+    def _notify(self, job: ScanJob) -> None:
+        if self._on_update is not None:
+            try:
+                self._on_update(job)
+            except Exception: # Ein fehlerhafter Beobachter darf den Scan nicht abbrechen
+                pass
+
+    def _finish(self, job: ScanJob) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            remaining = self._active_per_target[job.target] - 1
+            if remaining:
+                self._active_per_target[job.target] = remaining
+            else:
+                del self._active_per_target[job.target]
+            waiting = self._waiting.get(job.target)
+            if waiting:
+                self._ready.appendleft(waiting.popleft())
+                if not waiting:
+                    del self._waiting[job.target]
+
+            self._jobs.pop(job.job_id, None)
+            self._finished[job.job_id] = job
+            while len(self._finished) > self._max_retained_jobs:
+                self._finished.popitem(last=False)
+            if job.batch_id:
+                batch = self._batches.get(job.batch_id)
+                if batch is not None:
+                    if job.status == COMPLETED:
+                        batch.completed += 1
+                    else:
+                        batch.failed += 1
+            self._pump()
+
+    # --- Abfragen ---
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id) or self._finished.get(job_id)
+            return job.to_dict() if job else None
+
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            batch = self._batches.get(batch_id)
+            return batch.to_dict() if batch else None
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Listet aktive und zuletzt abgeschlossene Jobs (neueste zuerst)."""
+        with self._lock:
+            candidates = itertools.chain(reversed(list(self._jobs.values())), reversed(self._finished.values()))
+            return [job.to_dict() for job in itertools.islice(
+                (job for job in candidates if status is None or job.status == status), limit)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self._in_flight,
+                "queued": len(self._ready) + sum(len(waiting) for waiting in self._waiting.values()),
+                "pending_batches": len(self._pending_batches),
+                "retained_finished": len(self._finished),
+                "max_workers": self._max_workers,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Nimmt keine neuen Jobs mehr an und wartet optional auf laufende Jobs."""
+        with self._lock:
+            self._shutdown = True
+            self._ready.clear()
+            self._waiting.clear()
+            self._pending_batches.clear()
+        self._executor.shutdown(wait=wait)
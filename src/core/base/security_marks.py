@@ -0,0 +1,165 @@
+# src/core/base/security_marks.py
+
+import collections
+import dbm
+import os
+import threading
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+
+# "Shebang"-Markierungen nach Nutzerempfinden; gespeichert wird nur der Index in dieser Tabelle
+SECURITY_TAGS = (
+    "#!BLAKE2B_CRITICAL_SECURITY_IMPLICATION",
+    "#!BLAKE2B_SUSPICIOUS_ACTIVITY",
+    "#!BLAKE2B_OBSERVED_PROCESS",
+    "#!BLAKE2B_UNKNOWN_PERCEPTION",
+)
+_PERCEPTION_CODES = {"critical": 0, "suspicious": 1, "neutral": 2}
+_UNKNOWN_CODE = 3
+_DIGEST_PREFIX = b"#" # Schlüsselpräfix der Digest-Einträge in der Auslagerungsdatei
+
+
+def perception_code(user_perception: str) -> int:
+    return _PERCEPTION_CODES.get(user_perception, _UNKNOWN_CODE)
+
+
+def format_mark(packed: bytes) -> str:
+    """Baut aus der gepackten Form (Tag-Code + Digest) die lesbare Markierung '<tag> <hex>'."""
+    return f"{SECURITY_TAGS[packed[0]]} {packed[1:].hex()}"
+
+
+class SecurityMarkStore:
+    """
+    Kompakter Speicher für BLAKE2b-Sicherheitsmarkierungen.
+    Pro Prozess-ID wird nur ein Byte Tag-Code plus der binäre Digest gehalten, die Markierung als
+    String entsteht erst beim Lesen. Ein zweites Dict vom Digest zur Prozess-ID erlaubt die Suche
+    nach Inhalt. Mit 'max_resident' bleibt nur die angegebene Zahl neuester Markierungen im Speicher;
+    ältere werden in eine dbm-Datei ausgelagert ('spill_path') oder ohne sie verworfen.
+    Lookups sind in beiden Fällen O(1).
+    """
+
+    def __init__(self, max_resident: Optional[int] = None, spill_path: Optional[str] = None):
+        if max_resident is not None and max_resident <= 0:
+            raise ValueError("max_resident muss größer als 0 sein.")
+        self.max_resident = max_resident
+        self.spill_path = spill_path
+        self._lock = threading.Lock()
+        self._marks: "collections.OrderedDict[str, bytes]" = collections.OrderedDict() # Prozess-ID -> Code + Digest
+        self._by_digest: Dict[bytes, str] = {}
+        self._spill: Any = None # Wird erst bei der ersten Auslagerung geöffnet
+        self._spilled = 0
+        self._dropped = 0
+
+    # --- Schreiben ---
+
+    def put(self, process_id: str, code: int, digest: bytes) -> None:
+        self.put_packed(process_id, bytes((code,)) + digest)
+
+    def put_packed(self, process_id: str, packed: bytes) -> None:
+        with self._lock:
+            self._store(process_id, packed)
+            self._enforce_limit()
+
+    def update_packed(self, items: Iterable[Tuple[str, bytes]]) -> None:
+        with self._lock:
+            for process_id, packed in items:
+                self._store(process_id, packed)
+            self._enforce_limit()
+
+    def _store(self, process_id: str, packed: bytes) -> None:
+        previous = self._marks.pop(process_id, None)
+        if previous is not None:
+            if self._by_digest.get(previous[1:]) == process_id:
+                del self._by_digest[previous[1:]]
+        elif self._spill is not None and process_id.encode('utf-8') in self._spill:
+            # Veraltete ausgelagerte Fassung entfernen, damit Lookups und Zählung eindeutig bleiben
+            stale = self._spill[process_id.encode('utf-8')]
+            del self._spill[process_id.encode('utf-8')]
+            if self._spill.get(_DIGEST_PREFIX + stale[1:]) == process_id.encode('utf-8'):
+                del self._spill[_DIGEST_PREFIX + stale[1:]]
+            self._spilled -= 1
+        self._marks[process_id] = packed
+        self._by_digest[packed[1:]] = process_id
+
+    def _enforce_limit(self) -> None:
+        if self.max_resident is None:
+            return
+        while len(self._marks) > self.max_resident:
+            process_id, packed = self._marks.popitem(last=False)
+            if self._by_digest.get(packed[1:]) == process_id:
+                del self._by_digest[packed[1:]]
+            if self.spill_path is None:
+                self._dropped += 1
+                continue
+            spill = self._open_spill()
+            spill[process_id.encode('utf-8')] = packed
+            spill[_DIGEST_PREFIX + packed[1:]] = process_id.encode('utf-8')
+            self._spilled += 1
+
+    def _open_spill(self) -> Any:
+        if self._spill is None:
+            directory = os.path.dirname(self.spill_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._spill = dbm.open(self.spill_path, 'n') # Immer frisch: enthält nur Auslagerungen dieses Laufs
+        return self._spill
+
+    # --- Lesen ---
+
+    def get_packed(self, process_id: str) -> Optional[bytes]:
+        with self._lock:
+            packed = self._marks.get(process_id)
+            if packed is None and self._spill is not None:
+                packed = self._spill.get(process_id.encode('utf-8'))
+            return packed
+
+    def get(self, process_id: str, default: Optional[str] = None) -> Optional[str]:
+        packed = self.get_packed(process_id)
+        return format_mark(packed) if packed is not None else default
+
+    def find_by_digest(self, digest: bytes) -> Optional[str]:
+        """Prozess-ID, deren Markierung diesen (binären) Inhalts-Digest trägt."""
+        with self._lock:
+            process_id = self._by_digest.get(digest)
+            if process_id is None and self._spill is not None:
+                raw = self._spill.get(_DIGEST_PREFIX + digest)
+                process_id = raw.decode('utf-8') if raw is not None else None
+            return process_id
+
+    def packed_items(self) -> Iterator[Tuple[str, bytes]]:
+        """Die residenten Markierungen in gepackter Form (z.B. zum Übertragen aus Worker-Prozessen)."""
+        with self._lock:
+            return iter(list(self._marks.items()))
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        return ((process_id, format_mark(packed)) for process_id, packed in self.packed_items())
+
+    def __getitem__(self, process_id: str) -> str:
+        mark = self.get(process_id)
+        if mark is None:
+            raise KeyError(process_id)
+        return mark
+
+    def __setitem__(self, process_id: str, mark: str) -> None:
+        """Nimmt eine Markierung in Stringform ('<tag> <hex>') entgegen."""
+        tag, _, digest = mark.partition(" ")
+        if tag not in SECURITY_TAGS:
+            raise ValueError(f"Unbekanntes Markierungs-Tag: '{tag}'")
+        self.put(process_id, SECURITY_TAGS.index(tag), bytes.fromhex(digest))
+
+    def __contains__(self, process_id: object) -> bool:
+        return isinstance(process_id, str) and self.get_packed(process_id) is not None
+
+    def __len__(self) -> int:
+        """Anzahl aller abrufbaren Markierungen (resident plus ausgelagert)."""
+        return len(self._marks) + self._spilled
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"resident": len(self._marks), "spilled": self._spilled, "dropped": self._dropped,
+                    "max_resident": self.max_resident, "spill_path": self.spill_path}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
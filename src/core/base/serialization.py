@@ -0,0 +1,203 @@
+# src/core/base/serialization.py
+
+import itertools
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+try:
+    import orjson # Optional: deutlich schnellerer JSON-Encoder (Rust)
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack # Optional: binäres Format für Maschinen-Clients (Accept: application/msgpack)
+except ImportError:
+    msgpack = None
+
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPES = ("application/msgpack", "application/x-msgpack")
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    _ORJSON_PRETTY = _ORJSON_OPTIONS | orjson.OPT_INDENT_2
+
+
+def _default(value: Any) -> Any:
+    """Fallback für Typen ohne JSON-Entsprechung: Objekte mit to_dict(), Mengen, sonst str()."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    return str(value)
+
+
+def dumps(value: Any) -> bytes:
+    """Kompaktes JSON als UTF-8-Bytes; orjson, sofern installiert, sonst die Standardbibliothek."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError: # z.B. Ganzzahlen über 64 Bit: die Standardbibliothek kann sie
+            pass
+    return json.dumps(value, default=_default, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+
+def dumps_pretty(value: Any) -> str:
+    """Eingerücktes JSON (2 Leerzeichen) für die Ausgabe in Shell und Logs."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=_default, option=_ORJSON_PRETTY).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(value, default=_default, ensure_ascii=False, indent=2)
+
+
+def loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def msgpack_dumps(value: Any) -> bytes:
+    if msgpack is None:
+        raise RuntimeError("msgpack ist nicht installiert (pip install msgpack).")
+    return msgpack.packb(value, default=_default, use_bin_type=True)
+
+
+class Serializer:
+    """
+    Kodiert API-Antworten in einem Format (JSON oder MessagePack).
+    Für große Listen unveränderlicher Einträge (Logs, Scan-Ergebnisse, ...) werden die Einträge einzeln
+    kodiert und als Byte-Chunks unter einem stabilen Schlüssel (z.B. ("logs", seq)) gehalten; weitere
+    Seiten oder Streams, die denselben Eintrag enthalten, setzen ihn nur noch zusammen. Beide Formate
+    erlauben das: ein JSON-Array ist die Verkettung mit Kommas, ein MessagePack-Array Kopf plus Elemente.
+    Das lohnt nur mit dem json-Modul der Standardbibliothek (ca. 5x schneller als Neukodieren); orjson
+    und msgpack kodieren eine ganze Seite schneller, als die Chunks nachzuschlagen sind
+    (siehe tools/benchmarks/bench_serialization.py), dort wird daher direkt kodiert.
+    """
+    chunk_cache_size = 50000 # Gehaltene Einzel-Chunks pro Serializer (FIFO)
+
+    def __init__(self, fmt: str = "json"):
+        if fmt not in ("json", "msgpack"):
+            raise ValueError(f"Unbekanntes Format: '{fmt}'")
+        if fmt == "msgpack" and msgpack is None:
+            raise RuntimeError("msgpack ist nicht installiert (pip install msgpack).")
+        self.format = fmt
+        self.mimetype = JSON_MIMETYPE if fmt == "json" else MSGPACK_MIMETYPES[0]
+        self.dumps: Callable[[Any], bytes] = dumps if fmt == "json" else msgpack_dumps
+        self.reuse_chunks = fmt == "json" and orjson is None
+        self._chunks: Dict[Hashable, bytes] = {}
+        self._lock = threading.Lock()
+        self._stats = {"chunk_hits": 0, "chunk_misses": 0}
+
+    def encode_chunks(self, items: Iterable[Any], key: Optional[Callable[[Any], Hashable]] = None) -> List[bytes]:
+        """Kodiert jeden Eintrag einzeln; mit 'key' werden bereits kodierte Einträge wiederverwendet."""
+        items = list(items)
+        if key is None or not self.reuse_chunks:
+            return [self.dumps(item) for item in items]
+        keys = [key(item) for item in items]
+        with self._lock:
+            chunks = [self._chunks.get(item_key) for item_key in keys]
+        missing = [index for index, chunk in enumerate(chunks) if chunk is None]
+        for index in missing:
+            chunks[index] = self.dumps(items[index])
+        with self._lock:
+            self._stats["chunk_hits"] += len(items) - len(missing)
+            self._stats["chunk_misses"] += len(missing)
+            for index in missing:
+                self._chunks[keys[index]] = chunks[index]
+            overflow = len(self._chunks) - self.chunk_cache_size
+            if overflow > 0: # Älteste zuerst: Dicts behalten die Einfügereihenfolge
+                for stale in list(itertools.islice(self._chunks, overflow)):
+                    del self._chunks[stale]
+        return chunks
+
+    def encode_list(self, items: Iterable[Any], key: Optional[Callable[[Any], Hashable]] = None) -> bytes:
+        return self.join(self.encode_chunks(items, key))
+
+    def join(self, chunks: List[bytes]) -> bytes:
+        """Setzt kodierte Elemente zu einem Array zusammen."""
+        if self.format == "json":
+            return b"[" + b",".join(chunks) + b"]"
+        return _msgpack_array_header(len(chunks)) + b"".join(chunks)
+
+    def encode_envelope(self, envelope: Dict[str, Any], list_field: str, items: Iterable[Any],
+                        key: Optional[Callable[[Any], Hashable]] = None) -> bytes:
+        """
+        Kodiert z.B. {"status": "success", "data": [...], "next_cursor": 42}, wobei die Liste
+        'list_field' aus (wiederverwendbaren) Chunks zusammengesetzt wird statt neu kodiert.
+        """
+        if not self.reuse_chunks:
+            return self.dumps(dict(envelope, **{list_field: list(items)}))
+        listing = self.encode_list(items, key)
+        if self.format == "json":
+            parts = [self.dumps(name) + b":" + self.dumps(value) for name, value in envelope.items()]
+            parts.append(self.dumps(list_field) + b":" + listing)
+            return b"{" + b",".join(parts) + b"}"
+        parts = [self.dumps(name) + self.dumps(value) for name, value in envelope.items()]
+        parts.append(self.dumps(list_field) + listing)
+        return _msgpack_map_header(len(parts)) + b"".join(parts)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, format=self.format, chunks=len(self._chunks), reuse_chunks=self.reuse_chunks,
+                        backend=JSON_BACKEND if self.format == "json" else "msgpack")
+
+
+def _msgpack_array_header(count: int) -> bytes:
+    if count < 16:
+        return bytes((0x90 | count,))
+    if count < 0x10000:
+        return b"\xdc" + count.to_bytes(2, 'big')
+    return b"\xdd" + count.to_bytes(4, 'big')
+
+
+def _msgpack_map_header(count: int) -> bytes:
+    if count < 16:
+        return bytes((0x80 | count,))
+    if count < 0x10000:
+        return b"\xde" + count.to_bytes(2, 'big')
+    return b"\xdf" + count.to_bytes(4, 'big')
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """
+    Wählt das Antwortformat aus einem Accept-Header: "msgpack", wenn der Client es ausdrücklich
+    höher (oder gleich) gewichtet als JSON und msgpack installiert ist, sonst "json".
+    """
+    if not accept or msgpack is None:
+        return "json"
+    best_msgpack, best_json = 0.0, 0.0
+    for part in accept.split(","):
+        media, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        media = media.strip().lower()
+        if media in MSGPACK_MIMETYPES:
+            best_msgpack = max(best_msgpack, quality)
+        elif media in (JSON_MIMETYPE, "*/*", "application/*"):
+            best_json = max(best_json, quality)
+    return "msgpack" if best_msgpack > 0 and best_msgpack >= best_json else "json"
+
+
+_serializers: Dict[str, Serializer] = {}
+_serializers_lock = threading.Lock()
+
+
+def get_serializer(fmt: str = "json") -> Serializer:
+    """Geteilte Serializer-Instanz pro Format (inklusive Chunk-Cache)."""
+    with _serializers_lock:
+        serializer = _serializers.get(fmt)
+        if serializer is None:
+            serializer = _serializers[fmt] = Serializer(fmt)
+        return serializer
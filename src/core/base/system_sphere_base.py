@@ -3,6 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 
+from core.base.log_pipeline import default_pipeline
+
 class SystemSphereBase(ABC):
     """
     Abstrakte Basisklasse für zentrale Komponenten des NEET-OS,
@@ -72,9 +74,14 @@ class SystemSphereBase(ABC):
     def report_status(self, status_message: str, level: str = "INFO") -> None:
         """
         Meldet den Status der Komponente an das System (z.B. an einen zentralen Logger).
+        Nicht-blockierend: die Meldung geht in die Log-Pipeline des Kontext-Managers, dessen Senken
+        sie an Konsole, Log und Journal verteilen; ohne eigene Pipeline in die geteilte Konsolen-Pipeline.
         """
-        formatted_message = f"[{self._component_name}][{level.upper()}]: {status_message}"
-        self._colored_print(formatted_message, color="OKBLUE" if level.upper() == "INFO" else "WARNING" if level.upper() == "WARNING" else "FAIL")
+        pipeline = getattr(self.context_manager, 'status_pipeline', None)
+        if pipeline is not None:
+            pipeline.emit(self._component_name, status_message, level)
+            return
+        default_pipeline().emit(self._component_name, status_message, level)
         if self.context_manager and hasattr(self.context_manager, 'log_system_event'):
             self.context_manager.log_system_event(self._component_name, status_message, level)
 
@@ -0,0 +1,209 @@
+# src/core/base/target_set.py
+
+import bisect
+import ipaddress
+import socket
+from array import array
+from typing import Iterable, Iterator, List, Tuple, Union
+
+TargetSpec = Union[str, Iterable[str], "TargetSet", None]
+
+
+def _merge(intervals: List[Tuple[int, int]]) -> Tuple[array, array]:
+    """Sortiert inklusive Intervalle und verschmilzt überlappende oder angrenzende Bereiche."""
+    starts, ends = array('L'), array('L')
+    for start, end in sorted(intervals):
+        if ends and start <= ends[-1] + 1:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+class TargetSet:
+    """
+    Menge von Scan-Zielen.
+    IPv4-Adressen werden als sortierte, disjunkte Integer-Intervalle in zwei array('L')-Spalten
+    (Start, Ende inklusive) gehalten; Hostnamen und einzelne IPv6-Adressen als sortierte Namensliste.
+    Vereinigung, Schnitt und Differenz arbeiten linear über die Intervalle, die Iteration ist lazy:
+    Ein /8 wird nie als Liste materialisiert.
+    """
+    __slots__ = ("_starts", "_ends", "_names")
+
+    def __init__(self, specs: TargetSpec = None, hosts_only: bool = True):
+        """
+        :param specs: Ein Spec-String oder eine Liste davon. Erlaubt sind Adressen ("10.0.0.1"),
+                      Netze ("10.0.0.0/24"), Bereiche ("10.0.0.5-10.0.0.9") und Hostnamen.
+                      Mehrere Specs in einem String dürfen per Komma oder Leerzeichen getrennt sein.
+        :param hosts_only: Netz- und Broadcast-Adresse von Netzen ausklammern (wie ipaddress.hosts()).
+        """
+        if isinstance(specs, TargetSet):
+            self._starts, self._ends, self._names = array('L', specs._starts), array('L', specs._ends), list(specs._names)
+            return
+        if isinstance(specs, str):
+            specs = [specs]
+        intervals: List[Tuple[int, int]] = []
+        names = set()
+        for spec in specs or []:
+            for token in spec.replace(",", " ").split():
+                parsed = self.parse(token, hosts_only)
+                if isinstance(parsed, str):
+                    names.add(parsed)
+                else:
+                    intervals.append(parsed)
+        self._starts, self._ends = _merge(intervals)
+        self._names = sorted(names)
+
+    @staticmethod
+    def parse(token: str, hosts_only: bool = True) -> Union[Tuple[int, int], str]:
+        """Wandelt einen einzelnen Spec in ein Intervall (IPv4) oder einen Namen um."""
+        if "-" in token and not token.startswith("-"):
+            first, last = token.split("-", 1)
+            try:
+                start = int(ipaddress.IPv4Address(first))
+                end = int(ipaddress.IPv4Address(last)) if "." in last else int(last)
+            except ValueError:
+                return token.lower() # Hostname mit Bindestrich
+            if "." not in last: # Kurzform 10.0.0.5-20: nur das letzte Oktett
+                if not 0 <= end <= 255:
+                    raise ValueError(f"Ungültiges letztes Oktett im Adressbereich: '{token}'")
+                end |= start & 0xFFFFFF00
+            if end < start:
+                raise ValueError(f"Ungültiger Adressbereich: '{token}'")
+            return start, end
+        try:
+            network = ipaddress.ip_network(token, strict=False)
+        except ValueError:
+            return token.lower() # Hostname
+        if network.version == 6:
+            if network.num_addresses != 1:
+                raise ValueError(f"IPv6-Netze werden nicht expandiert: '{token}'")
+            return str(network.network_address)
+        start, end = int(network.network_address), int(network.broadcast_address)
+        if hosts_only and network.prefixlen < 31:
+            start, end = start + 1, end - 1
+        return start, end
+
+    @classmethod
+    def _from_parts(cls, starts: array, ends: array, names: List[str]) -> "TargetSet":
+        target_set = cls.__new__(cls)
+        target_set._starts, target_set._ends, target_set._names = starts, ends, names
+        return target_set
+
+    # --- Mengenoperationen ---
+
+    def union(self, other: TargetSpec) -> "TargetSet":
+        other = other if isinstance(other, TargetSet) else TargetSet(other)
+        starts, ends = _merge(list(self.intervals()) + list(other.intervals()))
+        return self._from_parts(starts, ends, sorted(set(self._names) | set(other._names)))
+
+    def intersection(self, other: TargetSpec) -> "TargetSet":
+        other = other if isinstance(other, TargetSet) else TargetSet(other)
+        starts, ends = array('L'), array('L')
+        i = j = 0
+        while i < len(self._starts) and j < len(other._starts):
+            start = max(self._starts[i], other._starts[j])
+            end = min(self._ends[i], other._ends[j])
+            if start <= end:
+                starts.append(start)
+                ends.append(end)
+            if self._ends[i] < other._ends[j]:
+                i += 1
+            else:
+                j += 1
+        return self._from_parts(starts, ends, sorted(set(self._names) & set(other._names)))
+
+    def exclude(self, other: TargetSpec) -> "TargetSet":
+        """Differenz: alle Ziele dieser Menge, die nicht in 'other' liegen."""
+        other = other if isinstance(other, TargetSet) else TargetSet(other)
+        starts, ends = array('L'), array('L')
+        j = 0
+        for start, end in self.intervals():
+            # Ausschluss-Intervalle, die vollständig vor diesem Intervall enden, überspringen
+            while j < len(other._starts) and other._ends[j] < start:
+                j += 1
+            k = j
+            while k < len(other._starts) and other._starts[k] <= end:
+                if other._starts[k] > start:
+                    starts.append(start)
+                    ends.append(other._starts[k] - 1)
+                start = max(start, other._ends[k] + 1)
+                k += 1
+            if start <= end:
+                starts.append(start)
+                ends.append(end)
+        return self._from_parts(starts, ends, sorted(set(self._names) - set(other._names)))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = exclude
+
+    # --- Abfragen ---
+
+    def intervals(self) -> Iterator[Tuple[int, int]]:
+        """Die IPv4-Intervalle als (Start, Ende)-Integer, inklusive."""
+        return zip(self._starts, self._ends)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def to_specs(self) -> List[str]:
+        """
+        Die Menge als Specs (Einzeladressen, Bereiche 'a.b.c.d-e.f.g.h', dann Namen), aus denen
+        TargetSet(...) genau diese Menge wieder aufbaut; Bereiche sind unabhängig von hosts_only.
+        """
+        specs = [str(ipaddress.IPv4Address(start)) if start == end
+                 else f"{ipaddress.IPv4Address(start)}-{ipaddress.IPv4Address(end)}"
+                 for start, end in self.intervals()]
+        return specs + self._names
+
+    def address_count(self) -> int:
+        return sum(end - start + 1 for start, end in self.intervals())
+
+    def __len__(self) -> int:
+        return self.address_count() + len(self._names)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts) or bool(self._names)
+
+    def __contains__(self, target: str) -> bool:
+        try:
+            value = int(ipaddress.IPv4Address(target))
+        except ValueError:
+            return target.lower() in self._names
+        index = bisect.bisect_right(self._starts, value) - 1
+        return index >= 0 and value <= self._ends[index]
+
+    def __iter__(self) -> Iterator[str]:
+        """Liefert alle Adressen aufsteigend (lazy), danach die Namen."""
+        for start, end in self.intervals():
+            for value in range(start, end + 1):
+                yield socket.inet_ntoa(value.to_bytes(4, 'big'))
+        yield from self._names
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TargetSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends and self._names == other._names
+
+    def __repr__(self) -> str:
+        ranges = [f"{ipaddress.IPv4Address(s)}-{ipaddress.IPv4Address(e)}" if s != e else str(ipaddress.IPv4Address(s))
+                  for s, e in list(self.intervals())[:4]]
+        more = ", ..." if len(self._starts) > 4 else ""
+        return f"<TargetSet {len(self)} Ziele: [{', '.join(ranges + self._names[:4])}{more}]>"
+
+    @classmethod
+    def from_specs(cls, specs: Iterable[str], hosts_only: bool = True) -> "TargetSet":
+        """
+        Baut eine Menge aus Specs, wobei Specs mit '!'-Präfix ausgeschlossen werden
+        (z.B. ["10.0.0.0/16", "!10.0.5.0/24"]).
+        """
+        include, exclude = [], []
+        for spec in specs:
+            for token in spec.replace(",", " ").split():
+                (exclude if token.startswith("!") else include).append(token.lstrip("!"))
+        target_set = cls(include, hosts_only)
+        return target_set.exclude(cls(exclude, hosts_only=False)) if exclude else target_set
@@ -0,0 +1,70 @@
+# src/core/base/tests/test_canonical_hash.py
+"""Tests der kanonischen Kodierung und des CanonicalHasher (Typtreue, Reihenfolge, Memo)."""
+import enum
+import hashlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+from core.base.canonical_hash import canonical_encode, get_hasher, list_header, md5_hex # noqa: E402
+
+
+class _Level(enum.IntEnum):
+    HIGH = 1
+
+
+def test_scalars_of_different_types_stay_distinct():
+    values = [1, 1.0, True, "1", b"1", None, 0, 0.0, -0.0, False, ""]
+    encodings = [canonical_encode(value) for value in values]
+    assert len(set(encodings)) == len(values)
+    assert len({md5_hex(value) for value in values}) == len(values)
+
+
+def test_containers_keep_types_apart():
+    assert canonical_encode({"a": 1}) != canonical_encode({"a": 1.0})
+    assert canonical_encode({"a": 1}) != canonical_encode({"a": True})
+    assert canonical_encode({1: "x"}) != canonical_encode({"1": "x"})
+    assert canonical_encode([1, 2]) != canonical_encode({1, 2})
+    assert canonical_encode(["ab"]) != canonical_encode(["a", "b"]) # Längen sind vorangestellt
+
+
+def test_dicts_and_sets_ignore_insertion_order():
+    assert canonical_encode({"b": 2, "a": [1, {"y": 0, "x": 1}]}) == canonical_encode({"a": [1, {"x": 1, "y": 0}], "b": 2})
+    assert canonical_encode({3, 1, 2}) == canonical_encode({2, 3, 1})
+    assert canonical_encode({1: "a", "1": "b"}) == canonical_encode({"1": "b", 1: "a"}) # Gemischte Schlüsseltypen
+    assert canonical_encode((1, 2)) == canonical_encode([1, 2]) # Tupel und Listen sind gleichwertig
+
+
+def test_subclasses_encode_like_their_base_type():
+    assert canonical_encode(_Level.HIGH) == canonical_encode(1)
+    assert canonical_encode(_Level.HIGH) != canonical_encode(True)
+
+
+def test_objects_with_to_dict_and_unsupported_types():
+    class Card:
+        def to_dict(self):
+            return {"id": 7}
+
+    assert canonical_encode(Card()) == canonical_encode({"id": 7})
+    with pytest.raises(TypeError):
+        canonical_encode(object())
+
+
+def test_memo_does_not_mix_equal_values_of_different_types():
+    hasher = get_hasher("sha256")
+    first = [hasher.hash(value) for value in (1, 1.0, True, 0.0, -0.0)]
+    second = [hasher.hash(value) for value in (True, -0.0, 1.0, 1, 0.0)]
+    assert first == [second[3], second[2], second[0], second[4], second[1]]
+    assert hasher.hash((1, "a")) == hashlib.sha256(canonical_encode([1, "a"])).hexdigest()
+
+
+def test_streamed_list_matches_whole_list():
+    items = [{"n": n} for n in range(5)]
+    streamed = get_hasher("md5").new()
+    streamed.update(list_header(len(items)))
+    for item in items:
+        streamed.update(canonical_encode(item))
+    assert streamed.hexdigest() == md5_hex(items)
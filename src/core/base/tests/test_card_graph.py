@@ -0,0 +1,115 @@
+# src/core/base/tests/test_card_graph.py
+"""Tests des inkrementellen CardGraph: Fragmente, geteilte Knoten und Netto-Differenzen per diff(since)."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+from core.base.card_graph import CardGraph # noqa: E402
+
+
+class _Card:
+    """Minimale Karte: card_id, card_type und ein frei setzbares Graphen-Fragment."""
+
+    def __init__(self, card_id: str, links=(), card_type: str = "Host"):
+        self.card_id = card_id
+        self.card_type = card_type
+        self.links = list(links)
+
+    def get_graph_data(self):
+        return {"edges": [{"source": self.card_id, "target": target, "type": "link"} for target in self.links]}
+
+
+def _ids(items):
+    return sorted(item["id"] for item in items)
+
+
+def _edges(items):
+    return sorted((item["source"], item["target"]) for item in items)
+
+
+def test_snapshot_contains_card_nodes_and_edge_endpoints():
+    graph = CardGraph()
+    graph.mark_dirty(_Card("a", ["net"]))
+    graph.mark_dirty(_Card("b", ["net"]))
+
+    snapshot = graph.snapshot()
+    assert _ids(snapshot["nodes"]) == ["a", "b", "net"]
+    assert _edges(snapshot["edges"]) == [("a", "net"), ("b", "net")]
+    assert graph.neighbors("net") == ["a", "b"]
+
+
+def test_fragment_is_captured_when_marked():
+    graph = CardGraph()
+    card = _Card("a", ["x"])
+    graph.mark_dirty(card)
+    card.links = ["y"] # Spätere Änderungen ohne erneutes mark_dirty zählen nicht
+    assert graph.neighbors("a") == ["x"]
+
+
+def test_diff_reports_net_changes_only():
+    graph = CardGraph()
+    card = _Card("a", ["x"])
+    graph.mark_dirty(card)
+    since = graph.version
+
+    card.links = ["z"]
+    graph.mark_dirty(card)
+    graph.version # Lesen wendet die Markierung an
+    card.links = ["z", "y"]
+    graph.mark_dirty(card)
+    graph.version
+    card.links = ["z"] # y entsteht und verschwindet innerhalb des Fensters
+    graph.mark_dirty(card)
+
+    diff = graph.diff(since)
+    assert diff["reset"] is False
+    assert _ids(diff["added_nodes"]) == ["z"]
+    assert _ids(diff["removed_nodes"]) == ["x"]
+    assert _edges(diff["added_edges"]) == [("a", "z")]
+    assert _edges(diff["removed_edges"]) == [("a", "x")]
+    assert graph.diff(graph.version)["added_nodes"] == []
+
+
+def test_shared_node_survives_until_last_owner_releases_it():
+    graph = CardGraph()
+    first, second = _Card("a", ["net"]), _Card("b", ["net"])
+    graph.mark_dirty(first)
+    graph.mark_dirty(second)
+    since = graph.version
+
+    first.links = []
+    graph.mark_dirty(first)
+    assert "net" in _ids(graph.snapshot()["nodes"])
+    second.links = []
+    graph.mark_dirty(second)
+
+    diff = graph.diff(since)
+    assert _ids(diff["removed_nodes"]) == ["net"]
+    assert _edges(diff["removed_edges"]) == [("a", "net"), ("b", "net")]
+
+
+def test_removed_then_readded_node_is_an_update():
+    graph = CardGraph()
+    card = _Card("a", ["x"])
+    graph.mark_dirty(card)
+    since = graph.version
+
+    card.links = []
+    graph.mark_dirty(card)
+    graph.version
+    card.links = ["x"]
+    graph.mark_dirty(card)
+
+    diff = graph.diff(since)
+    assert _ids(diff["updated_nodes"]) == ["x"]
+    assert diff["added_nodes"] == [] and diff["removed_nodes"] == []
+
+
+def test_diff_beyond_retained_changes_returns_a_snapshot():
+    graph = CardGraph(max_changes=4)
+    for index in range(5):
+        graph.mark_dirty(_Card(f"c{index}"))
+    diff = graph.diff(0)
+    assert diff["reset"] is True
+    assert len(diff["nodes"]) == 5
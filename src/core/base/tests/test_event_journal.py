@@ -0,0 +1,90 @@
+# src/core/base/tests/test_event_journal.py
+"""Tests des hashverketteten EventJournal: Anhängen, Lesen, Checkpoints und Manipulationserkennung."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+from core.base.event_journal import EventJournal # noqa: E402
+
+
+def _journal(tmp_path, **options) -> EventJournal:
+    return EventJournal(str(tmp_path / "journal.bin"), **options)
+
+
+def _fill(journal: EventJournal, count: int) -> None:
+    for n in range(count):
+        journal.append("card_changed", {"n": n}, component="Test", timestamp=1000.0 + n)
+
+
+def _flip_payload_byte(path: str, marker: bytes) -> None:
+    """Ändert genau ein Byte in den Nutzdaten des Satzes, der 'marker' enthält (Länge bleibt gleich)."""
+    with open(path, "r+b") as handle:
+        data = handle.read()
+        position = data.index(marker) + len(marker) - 2 # Die Ziffer vor der schließenden Klammer
+        handle.seek(position)
+        handle.write(b"9" if data[position:position + 1] != b"9" else b"8")
+
+
+def test_append_read_and_verify(tmp_path):
+    journal = _journal(tmp_path)
+    _fill(journal, 10)
+
+    records = journal.read(start_seq=3, limit=4)
+    assert [record["seq"] for record in records] == [3, 4, 5, 6]
+    assert [record["data"] for record in records] == [{"n": 3}, {"n": 4}, {"n": 5}, {"n": 6}]
+    # Jeder Satz verweist auf den Hash seines Vorgängers
+    assert all(later["prev_hash"] == earlier["hash"] for earlier, later in zip(records, records[1:]))
+    assert journal.read(since=1007.0)[0]["seq"] == 7
+
+    result = journal.verify(full=True)
+    assert result["valid"] is True
+    assert (result["checked"], result["head_seq"]) == (10, 9)
+    journal.close()
+
+
+def test_tampered_byte_breaks_the_chain(tmp_path):
+    journal = _journal(tmp_path)
+    _fill(journal, 10)
+    assert journal.verify(full=True)["valid"] is True
+    journal.close()
+
+    _flip_payload_byte(journal.path, b'"data":{"n":3}')
+
+    reopened = _journal(tmp_path)
+    result = reopened.verify(full=True)
+    assert result["valid"] is False
+    assert result["failed_seq"] == 3
+    assert result["error"] == "Hashkette unterbrochen."
+    reopened.close()
+
+
+def test_verify_from_checkpoint_checks_only_newer_records(tmp_path):
+    journal = _journal(tmp_path, checkpoint_interval=4)
+    _fill(journal, 10) # Checkpoints nach Satz 3 und 7
+
+    result = journal.verify()
+    assert result["valid"] is True
+    assert (result["from_seq"], result["checked"]) == (8, 2)
+    journal.close()
+
+    _flip_payload_byte(journal.path, b'"data":{"n":9}')
+    reopened = _journal(tmp_path, checkpoint_interval=4)
+    result = reopened.verify()
+    assert result["valid"] is False
+    assert result["failed_seq"] == 9
+    reopened.close()
+
+
+def test_truncated_last_record_is_dropped_on_reopen(tmp_path):
+    journal = _journal(tmp_path)
+    _fill(journal, 5)
+    journal.close()
+    with open(journal.path, "r+b") as handle:
+        handle.truncate(os.path.getsize(journal.path) - 3) # Absturz mitten im letzten Satz
+
+    reopened = _journal(tmp_path)
+    assert len(reopened) == 4
+    assert reopened.verify(full=True)["valid"] is True
+    assert reopened.append("after_crash") == 4
+    reopened.close()
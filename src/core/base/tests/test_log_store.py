@@ -0,0 +1,67 @@
+# src/core/base/tests/test_log_store.py
+"""Tests des LogStore-Ringpuffers: Überlauf, Cursor-Paginierung, Level- und Zeitfilter."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+from core.base.log_store import LogStore # noqa: E402
+
+
+def _store(capacity: int, count: int) -> LogStore:
+    store = LogStore(capacity=capacity)
+    for n in range(count):
+        store.append("ERROR" if n % 3 == 0 else "INFO", f"message {n}", timestamp=100.0 + n)
+    return store
+
+
+def test_wraparound_keeps_only_the_newest_entries():
+    store = _store(capacity=8, count=20)
+
+    entries, cursor = store.query()
+    assert len(store) == 8
+    assert [entry["seq"] for entry in entries] == list(range(12, 20))
+    assert entries[0]["message"] == "message 12"
+    assert cursor == store.next_cursor == 20
+
+
+def test_cursor_paginates_and_skips_overwritten_entries():
+    store = _store(capacity=8, count=10)
+    page, cursor = store.query(limit=3, cursor=0) # Sequenz 0 und 1 sind schon überschrieben
+    assert [entry["seq"] for entry in page] == [2, 3, 4]
+    assert cursor == 5
+
+    for n in range(10, 14):
+        store.append("INFO", f"message {n}", timestamp=100.0 + n)
+    page, cursor = store.query(limit=3, cursor=cursor) # Sequenz 5 wurde inzwischen überschrieben
+    assert [entry["seq"] for entry in page] == [6, 7, 8]
+    page, cursor = store.query(cursor=cursor)
+    assert [entry["seq"] for entry in page] == [9, 10, 11, 12, 13]
+    assert store.query(cursor=cursor) == ([], 14)
+
+
+def test_level_index_after_wraparound():
+    store = _store(capacity=8, count=20)
+    entries, _ = store.query(level="error")
+    assert [entry["seq"] for entry in entries] == [12, 15, 18]
+
+    tail, cursor = store.query(level="ERROR", limit=2, tail=True)
+    assert [entry["seq"] for entry in tail] == [15, 18]
+    assert cursor == 20
+
+
+def test_time_range_and_monotonic_timestamps():
+    store = _store(capacity=8, count=20)
+    entries, _ = store.query(since=114.0, until=117.0)
+    assert [entry["seq"] for entry in entries] == [14, 15, 16]
+
+    store.append("INFO", "late clock", timestamp=50.0) # Zeitstempel werden monoton gehalten
+    assert store.query(tail=True, limit=1)[0][0]["timestamp"] == 119.0
+
+
+def test_clear_keeps_sequence_numbers_running():
+    store = _store(capacity=8, count=5)
+    store.clear()
+    assert len(store) == 0
+    assert store.query(cursor=0) == ([], 5)
+    assert store.append("INFO", "after clear") == 5
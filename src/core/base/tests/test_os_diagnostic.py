@@ -0,0 +1,62 @@
+# src/core/base/tests/test_os_diagnostic.py
+"""Tests des OsDiagnosticService mit dem Shell-Skript-Stand-in für TCC (kein echter Compiler nötig)."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+
+from core.base.polyglot_orm_base import OsDiagnosticService, write_tcc_stand_in # noqa: E402
+
+SYNTAX_ERROR_SOURCE = "int main() { printf(\"Hello\"; return 0; }"
+
+
+def _service(tmp_path) -> OsDiagnosticService:
+    tcc_path = write_tcc_stand_in(str(tmp_path / "tcc"))
+    return OsDiagnosticService(tcc_path=tcc_path, cache_dir=str(tmp_path / "cache"))
+
+
+def test_stand_in_path_is_absolute(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert write_tcc_stand_in("tcc") == str(tmp_path / "tcc")
+
+
+def test_suite_passes_basis_and_fails_syntax_error(tmp_path):
+    service = _service(tmp_path)
+    result = service.run_diagnostic_suite([
+        {"name": "basis", "code": OsDiagnosticService.BASIS_CHECK_SOURCE, "expect": "TCC_CHECK_OK"},
+        ("syntax_error", SYNTAX_ERROR_SOURCE),
+    ], timeout=5.0)
+
+    # Der Stand-in kann kein 'tcc -run -', also fällt die Erkennung auf Dateien zurück
+    assert result["mode"] == OsDiagnosticService.RUN_FILE
+    assert (result["status"], result["passed"], result["failed"]) == ("FAILED", 1, 1)
+    checks = {check["name"]: check for check in result["checks"]}
+    assert checks["basis"]["status"] == "PASSED"
+    assert checks["basis"]["output"] == "TCC_CHECK_OK"
+    assert checks["syntax_error"]["status"] == "FAILED"
+    assert checks["syntax_error"]["return_code"] != 0
+    assert "error" in checks["syntax_error"]["stderr"]
+    assert all(check["duration"] >= 0 for check in checks.values())
+
+
+def test_compile_mode_uses_binary_cache(tmp_path):
+    service = _service(tmp_path)
+    service._run_mode = OsDiagnosticService.COMPILE
+    checks = [{"name": "basis", "code": OsDiagnosticService.BASIS_CHECK_SOURCE, "expect": "TCC_CHECK_OK"},
+              ("syntax_error", SYNTAX_ERROR_SOURCE)]
+
+    first = service.run_diagnostic_suite(checks, timeout=5.0)
+    second = service.run_diagnostic_suite(checks, timeout=5.0)
+
+    assert (first["passed"], first["failed"]) == (1, 1)
+    assert (second["passed"], second["failed"]) == (1, 1)
+    basis_first, basis_second = first["checks"][0], second["checks"][0]
+    assert basis_first["cache_hit"] is False
+    assert basis_second["cache_hit"] is True
+    assert basis_second["compile_time"] == 0.0
+
+
+def test_self_induced_check_passes_with_stand_in(tmp_path):
+    result = _service(tmp_path).perform_self_induced_tcc_check()
+    assert result["status"] == "PASSED"
+    assert result["output"] == "TCC_CHECK_OK"
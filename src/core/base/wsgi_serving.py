@@ -0,0 +1,211 @@
+# src/core/base/wsgi_serving.py
+
+import signal
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from core.base.core_ipc import CoreContextIPCServer, connect_core_context
+
+# Baut die WSGI-App aus einem Kontext (echter CoreContextManager oder CoreContextClient)
+AppFactory = Callable[[Any], Callable]
+
+SERVING_DEFAULTS: Dict[str, Any] = {
+    "workers": 2, # Worker-Prozesse (nur gunicorn)
+    "threads": 8, # Threads pro Worker
+    "keepalive": 5, # Sekunden, die eine Keep-Alive-Verbindung auf die nächste Anfrage wartet
+    "max_concurrency": 64, # Gleichzeitig bearbeitete Anfragen pro Prozess, darüber 503
+    # Gleichzeitige Live-Feed-Verbindungen (SSE) pro Prozess, darüber 503. Jede belegt dauerhaft einen
+    # Thread, daher muss der Wert unter 'threads' liegen; der Rest bleibt für normale Anfragen frei
+    "max_streams": 4,
+    "graceful_timeout": 30, # Sekunden, die laufende Anfragen beim Herunterfahren bekommen
+    "timeout": 60, # Worker ohne Lebenszeichen werden nach dieser Zeit neu gestartet (nur gunicorn)
+}
+
+STREAM_PATHS = ("/api/events",) # Langlebige Antworten (Server-Sent Events), die unter 'max_streams' fallen
+
+
+class ConcurrencyLimiter:
+    """
+    WSGI-Middleware, die gleichzeitig laufende Anfragen begrenzt.
+    Ist das Limit erreicht, wird sofort mit 503 und 'Retry-After' geantwortet, statt die Anfrage
+    in einer unbegrenzten Warteschlange liegen zu lassen. Der Platz wird erst freigegeben, wenn der
+    Response-Body vollständig ausgeliefert (bzw. geschlossen) ist, damit auch Streams zählen.
+    Streams unter 'stream_paths' halten ihren Thread so lange wie der Client verbunden ist; sie sind
+    zusätzlich auf 'max_streams' begrenzt, damit sie den Thread-Pool nicht aufzehren.
+    """
+
+    def __init__(self, app: Callable, max_concurrency: int, retry_after: int = 1, max_streams: Optional[int] = None,
+                 stream_paths: Iterable[str] = STREAM_PATHS, stream_retry_after: int = 5):
+        self.app = app
+        self.max_concurrency = max_concurrency
+        self.retry_after = retry_after
+        self.max_streams = max_streams
+        self.stream_paths = frozenset(stream_paths)
+        self.stream_retry_after = stream_retry_after
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._stream_slots = threading.BoundedSemaphore(max_streams) if max_streams is not None else None
+        self._lock = threading.Lock()
+        self._stats = {"active": 0, "served": 0, "rejected": 0, "streams": 0, "streams_rejected": 0}
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        if not self._slots.acquire(blocking=False):
+            return self._reject(start_response, "rejected", self.retry_after)
+        stream = self._stream_slots is not None and environ.get("PATH_INFO") in self.stream_paths
+        if stream and not self._stream_slots.acquire(blocking=False):
+            self._slots.release()
+            return self._reject(start_response, "streams_rejected", self.stream_retry_after)
+        with self._lock:
+            self._stats["active"] += 1
+            if stream:
+                self._stats["streams"] += 1
+        release = lambda: self._release(stream) # noqa: E731
+        try:
+            body = self.app(environ, start_response)
+        except BaseException:
+            release()
+            raise
+        return _ClosingBody(body, release)
+
+    def _reject(self, start_response: Callable, counter: str, retry_after: int) -> Iterable[bytes]:
+        with self._lock:
+            self._stats[counter] += 1
+        start_response("503 Service Unavailable", [("Content-Type", "application/json"),
+                                                   ("Retry-After", str(retry_after))])
+        return [b'{"error": "Server ausgelastet, bitte erneut versuchen."}']
+
+    def _release(self, stream: bool = False) -> None:
+        with self._lock:
+            self._stats["active"] -= 1
+            self._stats["served"] += 1
+            if stream:
+                self._stats["streams"] -= 1
+        if stream:
+            self._stream_slots.release()
+        self._slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, max_concurrency=self.max_concurrency, max_streams=self.max_streams)
+
+
+class _ClosingBody:
+    """Reicht den Response-Body durch und ruft beim close() des Servers genau einmal 'on_close' auf."""
+
+    def __init__(self, body: Iterable[bytes], on_close: Callable[[], None]):
+        self._body = body
+        self._on_close = on_close
+
+    def __iter__(self):
+        return iter(self._body)
+
+    def close(self) -> None:
+        on_close, self._on_close = self._on_close, None
+        try:
+            if hasattr(self._body, "close"):
+                self._body.close()
+        finally:
+            if on_close is not None:
+                on_close()
+
+
+def serve_production(app_factory: AppFactory, context_manager: Any, host: str = '0.0.0.0', port: int = 5000,
+                     **options: Any) -> str:
+    """
+    Startet einen Produktionsserver und blockiert, bis er beendet wird (SIGINT/SIGTERM).
+    Bevorzugt gunicorn mit mehreren Worker-Prozessen (gthread: Threads pro Worker, Keep-Alive);
+    die Worker erreichen den Kern über CoreContextIPCServer statt über eigene Singleton-Kopien.
+    Ohne gunicorn (z.B. unter Windows) wird waitress verwendet, in einem Prozess mit Thread-Pool.
+    Das Herunterfahren des Kerns (shutdown_component) bleibt Sache des Aufrufers.
+
+    Thread-Budget: Jede offene Live-Feed-Verbindung (/api/events) belegt einen Thread ihres Prozesses,
+    solange der Client verbunden ist. Pro Prozess sind daher höchstens 'max_streams' davon erlaubt
+    (weitere bekommen 503 mit Retry-After), und 'max_streams' muss kleiner als 'threads' sein.
+    Bei waitress (ein Prozess) gilt das Limit für den ganzen Server, bei gunicorn je Worker.
+    Wer mehr gleichzeitige Dashboards braucht, erhöht 'threads' und 'max_streams' gemeinsam.
+
+    :param options: Überschreibt SERVING_DEFAULTS (workers, threads, keepalive, max_concurrency, max_streams, ...).
+    :return: Name des verwendeten Servers ("gunicorn" oder "waitress").
+    """
+    unknown = set(options) - set(SERVING_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unbekannte Server-Optionen: {', '.join(sorted(unknown))}")
+    settings = dict(SERVING_DEFAULTS, **{key: value for key, value in options.items() if value is not None})
+    if not 0 <= settings["max_streams"] < settings["threads"]:
+        raise ValueError(f"max_streams ({settings['max_streams']}) muss kleiner als threads ({settings['threads']}) sein, "
+                         "sonst können Live-Feed-Verbindungen alle Threads belegen.")
+    try:
+        import gunicorn # noqa: F401
+    except ImportError:
+        gunicorn = None
+    if gunicorn is not None:
+        _serve_gunicorn(app_factory, context_manager, host, port, settings)
+        return "gunicorn"
+    try:
+        import waitress # noqa: F401
+    except ImportError:
+        raise RuntimeError("Für den Produktionsmodus wird 'gunicorn' oder 'waitress' benötigt (pip install gunicorn).")
+    _serve_waitress(app_factory, context_manager, host, port, settings)
+    return "waitress"
+
+
+def _serve_gunicorn(app_factory: AppFactory, context_manager: Any, host: str, port: int,
+                    settings: Dict[str, Any]) -> None:
+    from gunicorn.app.base import BaseApplication
+
+    ipc_server = CoreContextIPCServer(context_manager).start()
+    address, authkey = ipc_server.address, ipc_server.authkey
+
+    class _DurgaApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", settings["workers"])
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("threads", settings["threads"])
+            self.cfg.set("keepalive", settings["keepalive"])
+            # Offene Verbindungen pro Worker; Anfragen darüber hinaus begrenzt der ConcurrencyLimiter
+            self.cfg.set("worker_connections", max(settings["max_concurrency"], settings["threads"]))
+            self.cfg.set("graceful_timeout", settings["graceful_timeout"])
+            self.cfg.set("timeout", settings["timeout"])
+
+        def load(self):
+            # Läuft im Worker nach dem fork(): die App spricht den Kern nur über IPC an
+            return ConcurrencyLimiter(app_factory(connect_core_context(address, authkey)), settings["max_concurrency"],
+                                      max_streams=settings["max_streams"])
+
+    context_manager.report_status(f"Produktionsserver (gunicorn, {settings['workers']} Worker x "
+                                  f"{settings['threads']} Threads, je {settings['max_streams']} Live-Feeds) "
+                                  f"startet auf {host}:{port}", "INFO")
+    try:
+        _DurgaApplication().run()
+    except SystemExit: # Der Arbiter beendet sich nach SIGINT/SIGTERM per sys.exit()
+        pass
+    finally:
+        ipc_server.stop()
+
+
+def _serve_waitress(app_factory: AppFactory, context_manager: Any, host: str, port: int,
+                    settings: Dict[str, Any]) -> None:
+    from waitress import create_server
+
+    app = ConcurrencyLimiter(app_factory(context_manager), settings["max_concurrency"], max_streams=settings["max_streams"])
+    server = create_server(app, host=host, port=port, threads=settings["threads"],
+                           connection_limit=max(settings["max_concurrency"], settings["threads"]),
+                           channel_timeout=max(settings["keepalive"], 1))
+    previous_handler = None
+    if threading.current_thread() is threading.main_thread():
+        # SIGTERM wie Strg+C behandeln, damit der Aufrufer regulär herunterfahren kann
+        previous_handler = signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    context_manager.report_status(f"Produktionsserver (waitress, {settings['threads']} Threads, "
+                                  f"{settings['max_streams']} Live-Feeds) startet auf {host}:{port}", "INFO")
+    try:
+        server.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if previous_handler is not None:
+            signal.signal(signal.SIGTERM, previous_handler)
+
+
+def _raise_keyboard_interrupt(signum: int, frame: Optional[Any]) -> None:
+    raise KeyboardInterrupt
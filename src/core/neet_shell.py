@@ -1,10 +1,14 @@
 import cmd2
 import os
+import time
 from typing import Dict, Any, List, Optional
 
 # Importiere den CoreContextManager
 # Annahme: src/python_core/core_context_manager.py ist im PYTHONPATH
 from python_core.core_context_manager import CoreContextManager
+from core.base.command_batch import check_max_parallel, summarize
+from core.base.command_registry import CommandError
+from core.base.serialization import dumps_pretty, loads
 
 class NEETShell(cmd2.Cmd):
     """
@@ -48,7 +52,7 @@ class NEETShell(cmd2.Cmd):
         """Zeigt den aktuellen Systemstatus von Jan (ZNS)."""
         status_data = self.core_context_manager.get_system_status()
         self._colored_output("\n--- System Status (Jan als ZNS) ---", "HEADER")
-        self._colored_output(json.dumps(status_data, indent=2), "OKBLUE")
+        self._colored_output(dumps_pretty(status_data), "OKBLUE")
 
     @cmd2.with_argparser(cmd2.Cmd2ArgumentParser(description="Zeigt die System Logs aus der Datenbank."))
     def do_logs(self, _):
@@ -84,22 +88,95 @@ class NEETShell(cmd2.Cmd):
         for dev in devices:
             self._colored_output(f"ID: {dev.get('id')}, Name: {dev.get('name')}, IP: {dev.get('ip')}, OS: {dev.get('os')}", "OKBLUE")
 
-    scan_parser = cmd2.Cmd2ArgumentParser(description="Startet einen simulierten Netzwerk-Scan.")
-    scan_parser.add_argument('target', help='Das Ziel des Scans (z.B. 192.168.1.1 oder example.com)')
+    scan_parser = cmd2.Cmd2ArgumentParser(description="Reiht einen simulierten Netzwerk-Scan ein.")
+    scan_parser.add_argument('targets', nargs='+', help='Ziele des Scans (z.B. 192.168.1.1, example.com oder 10.0.0.0/16)')
+    scan_parser.add_argument('--per-host', action='store_true', help='Netze in einen Job pro Host zerlegen')
 
     @cmd2.with_argparser(scan_parser)
     def do_scan(self, args):
-        """Startet einen simulierten Netzwerk-Scan."""
-        result = self.core_context_manager.execute_system_command(f"scan {args.target}")
-        self._colored_output(f"\n--- Scan Ergebnis für {args.target} ---", "HEADER")
-        self._colored_output(json.dumps(result, indent=2), "OKGREEN" if result.get('status') == 'success' else "FAIL")
+        """Reiht einen simulierten Netzwerk-Scan ein; mehrere Ziele oder --per-host erzeugen einen Sammel-Auftrag."""
+        targets = " ".join(args.targets)
+        if args.per_host or len(args.targets) > 1:
+            result = self.core_context_manager.execute_system_command(f"scan bulk {targets}")
+        else:
+            result = self.core_context_manager.execute_system_command(f"scan {targets}")
+        self._colored_output(f"\n--- Scan-Auftrag für {targets} ---", "HEADER")
+        self._colored_output(dumps_pretty(result), "OKGREEN" if result.get('status') == 'success' else "FAIL")
+
+    scan_status_parser = cmd2.Cmd2ArgumentParser(description="Zeigt Status und Fortschritt eines Scan-Jobs oder Batches.")
+    scan_status_parser.add_argument('job_id', nargs='?', help='Job- oder Batch-ID (ohne Angabe: alle Jobs)')
+
+    @cmd2.with_argparser(scan_status_parser)
+    def do_scan_status(self, args):
+        """Zeigt Status und Fortschritt eines Scan-Jobs oder Batches."""
+        command = f"scan status {args.job_id}" if args.job_id else "scan jobs"
+        result = self.core_context_manager.execute_system_command(command)
+        self._colored_output(dumps_pretty(result), "OKGREEN" if result.get('status') == 'success' else "FAIL")
 
     @cmd2.with_argparser(cmd2.Cmd2ArgumentParser(description="Löscht alle System Logs aus der Datenbank."))
     def do_clear_logs(self, _):
         """Löscht alle System Logs aus der Datenbank."""
         result = self.core_context_manager.execute_system_command("clear logs")
-        self._colored_output(json.dumps(result, indent=2), "OKGREEN" if result.get('status') == 'success' else "FAIL")
+        self._colored_output(dumps_pretty(result), "OKGREEN" if result.get('status') == 'success' else "FAIL")
+
 
+    batch_parser = cmd2.Cmd2ArgumentParser(description="Führt Befehle aus einer Datei als Batch aus.")
+    batch_parser.add_argument('file', help='Textdatei (ein Befehl pro Zeile, # für Kommentare) oder JSON-Liste '
+                                           'mit {"id", "command", "params", "depends_on"}')
+    batch_parser.add_argument('--parallel', action='store_true',
+                              help='Zeilen einer Textdatei unabhängig voneinander ausführen (sonst nacheinander)')
+    batch_parser.add_argument('--max-parallel', type=int, help='Höchstens so viele Befehle gleichzeitig')
+    batch_parser.add_argument('--verbose', action='store_true', help='Vollständige Ergebnisse ausgeben')
+
+    @cmd2.with_argparser(batch_parser)
+    def do_batch(self, args):
+        """Führt Befehle aus einer Datei aus; Ergebnisse erscheinen in Abschlussreihenfolge mit Dauer."""
+        try:
+            check_max_parallel(args.max_parallel)
+        except ValueError as e:
+            self._colored_output(f"Ungültige Option --max-parallel: {e}", "FAIL")
+            return
+        try:
+            with open(args.file, 'r', encoding='utf-8') as handle:
+                content = handle.read()
+        except OSError as e:
+            self._colored_output(f"Fehler beim Lesen von '{args.file}': {e}", "FAIL")
+            return
+        if args.file.endswith('.json'):
+            try:
+                commands = loads(content)
+            except ValueError as e:
+                self._colored_output(f"Ungültiges JSON in '{args.file}': {e}", "FAIL")
+                return
+            if isinstance(commands, dict):
+                commands = commands.get('commands')
+        else:
+            lines = [line.strip() for line in content.splitlines()]
+            commands = [line for line in lines if line and not line.startswith('#')]
+            if not args.parallel: # Skript-Semantik: jede Zeile wartet auf den Erfolg der vorherigen
+                commands = [{"id": str(index), "command": command, "depends_on": [str(index - 1)] if index else []}
+                            for index, command in enumerate(commands)]
+        try:
+            results = self.core_context_manager.execute_command_batch(commands, max_parallel=args.max_parallel)
+        except ValueError as e:
+            self._colored_output(f"Ungültiger Batch: {e}", "FAIL")
+            return
+
+        self._colored_output(f"\n--- Batch aus {args.file} ---", "HEADER")
+        start = time.perf_counter()
+        entries = []
+        for entry in results:
+            entries.append(entry)
+            color = "OKGREEN" if entry["status"] == "success" else "WARNING" if entry["status"] == "skipped" else "FAIL"
+            message = entry["result"].get("message", "") if isinstance(entry["result"], dict) else ""
+            self._colored_output(f"[{entry['id']}] {entry['command']} -> {entry['status']} "
+                                 f"({entry['duration_ms']:.1f} ms) {message}", color)
+            if args.verbose:
+                self._colored_output(dumps_pretty(entry["result"]), color)
+        summary = summarize(entries, time.perf_counter() - start)
+        self._colored_output(f"{summary['succeeded']}/{summary['total']} erfolgreich, {summary['failed']} fehlgeschlagen, "
+                             f"{summary['skipped']} übersprungen in {summary['duration_ms']:.1f} ms",
+                             "OKGREEN" if summary['succeeded'] == summary['total'] else "WARNING")
 
     @cmd2.with_argparser(cmd2.Cmd2ArgumentParser(description="Zeigt die verfügbaren Plugins an."))
     def do_plugins(self, _):
@@ -109,7 +186,7 @@ class NEETShell(cmd2.Cmd):
             self._colored_output("Keine Plugins registriert.", "WARNING")
             return
         for name, plugin in self.core_context_manager.plugins.items():
-            self._colored_output(f"  - {name} (Typ: {plugin.description})", "OKBLUE") # description nutzen
+            self._colored_output(f"  - {name} (Typ: {plugin.description}, Ausführung: {plugin.execution_mode})", "OKBLUE") # description nutzen
             # Hier könnte man auch plugin.get_metadata() aufrufen, wenn es eine solche Methode hat
         
     # --- Beispiel für einen einfachen OS-Befehl (BusyBox-like) ---
@@ -134,11 +211,23 @@ class NEETShell(cmd2.Cmd):
 
     # --- CLI Helper Commands ---
     def default(self, inp):
-        """Standardaktion für unbekannte Befehle."""
-        if inp.startswith('!'): # Erlaube Shell-Befehle mit '!' Präfix
-            os.system(inp[1:])
+        """
+        Standardaktion für Befehle ohne eigene do_-Methode.
+        Verben aus der CommandRegistry des Kerns (inkl. Plugins) werden direkt ausgeführt.
+        """
+        line = inp.raw if hasattr(inp, 'raw') else str(inp)
+        if line.startswith('!'): # Erlaube Shell-Befehle mit '!' Präfix
+            os.system(line[1:])
+            return
+        try:
+            known = self.core_context_manager.commands.resolve(line) is not None
+        except CommandError:
+            known = True # Verb bekannt, Argumente fehlerhaft: Fehlermeldung kommt aus execute_system_command
+        if known:
+            result = self.core_context_manager.execute_system_command(line)
+            self._colored_output(dumps_pretty(result), "OKGREEN" if result.get('status') == 'success' else "FAIL")
         else:
-            self._colored_output(f"Unbekannter Befehl: {inp}. Tippen Sie 'help' für eine Liste der Befehle.", "WARNING")
+            self._colored_output(f"Unbekannter Befehl: {line}. Tippen Sie 'help' für eine Liste der Befehle.", "WARNING")
 
     def postcmd(self, stop, line):
         """Wird nach jeder Befehlsausführung aufgerufen."""
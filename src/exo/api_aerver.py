@@ -1,21 +1,38 @@
 # src/exo-kernel/api_server.py
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, send_from_directory, Response, stream_with_context
 from flask_cors import CORS # Wichtig für Frontend-Zugriff
 from threading import Thread
 import os
-import pandas as pd # Importiere Pandas
+from core.base.command_batch import stream_ndjson
+from core.base.response_cache import ResponseCache, cached_response
+from core.base.serialization import Serializer, dumps, get_serializer, negotiate
+from core.base.wsgi_serving import serve_production
 
 # Annahme: CoreContextManager (Jan) ist verfügbar und initialisiert
 # from python_core.core_context_manager import CoreContextManager
 # from core.base.system_sphere_base import SystemSphereBase # Für Typ-Hints und Basis-Methoden
 
+def _log_key(entry):
+    return ("logs", entry["seq"]) # Log-Einträge sind unveränderlich, ihre Sequenznummer ist eindeutig
+
+
+def _scan_key(scan):
+    return ("scan_results", scan["seq"])
+
+
 class DurgaAPIServer:
+    default_page_size = 200 # Einträge pro Seite, wenn kein 'limit' angegeben ist
+    max_page_size = 5000 # Obergrenze für 'limit'
+    stream_chunk_size = 500 # Einträge pro Chunk im NDJSON-Streaming-Modus
+    event_heartbeat = 15.0 # Sekunden ohne Ereignis, nach denen der Live-Feed einen Keep-Alive-Kommentar sendet
+
     def __init__(self, context_manager: 'CoreContextManager', host: str = '0.0.0.0', port: int = 5000):
         self.app = Flask(__name__, static_folder='../tesseract-ui/public') # Statische Dateien aus dem Frontend-Ordner
         CORS(self.app) # Ermöglicht Cross-Origin-Requests vom Frontend
         self.context_manager = context_manager
         self.host = host
         self.port = port
+        self.response_cache = ResponseCache() # Serialisierte Antworten nach (Endpunkt, Query, Version)
         self._setup_routes()
         self.server_thread = None
         self.context_manager.report_status(f"DurgaAPI Server initialisiert auf {host}:{port}.", "INFO")
@@ -26,27 +43,38 @@ class DurgaAPIServer:
         def serve_index():
             return send_from_directory(self.app.static_folder, 'index.html')
 
-        # API-Endpunkt für den Systemstatus
+        # API-Endpunkt für den Systemstatus (nur versionierte Teile, daher mit ETag cachebar)
         @self.app.route('/api/system/status', methods=['GET'])
         def get_system_status():
-            status = self.context_manager.get_system_status() # Annahme: Methode in CoreContextManager
-            return jsonify(status)
+            return self._cached_response("status", lambda serializer: serializer.dumps(
+                self.context_manager.get_system_status(include_runtime_stats=False)))
+
+        # Laufzeit-Statistiken (Durga 2, Caches, Pipelines, Ereignisse, Plugins); ändern sich laufend, daher ungecacht
+        @self.app.route('/api/system/stats', methods=['GET'])
+        def get_runtime_stats():
+            return self._respond({"status": "success", "data": self.context_manager.get_runtime_stats()})
 
-        # API-Endpunkt zum Abrufen von Logs (mit Pandas-Formatierung)
+        # API-Endpunkt zum Abrufen von Logs (Cursor-Paginierung, optional als NDJSON-Stream)
         @self.app.route('/api/logs', methods=['GET'])
         def get_logs():
-            logs_raw = self.context_manager.get_system_logs() # Annahme: Methode in CoreContextManager
-            if not logs_raw:
-                return jsonify({"status": "success", "data": []})
-            
-            # Pandas nutzen, um Logs zu einem DataFrame zu verarbeiten
-            df_logs = pd.DataFrame(logs_raw)
-            # Optional: Zeitstempel formatieren
-            if 'timestamp' in df_logs.columns:
-                df_logs['timestamp'] = pd.to_datetime(df_logs['timestamp'], unit='s').dt.strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Rückgabe als JSON (Pandas DataFrame kann direkt zu JSON serialisiert werden)
-            return jsonify({"status": "success", "data": df_logs.to_dict(orient='records')})
+            filters = {
+                "since": request.args.get('since', type=float),
+                "until": request.args.get('until', type=float),
+                "level": request.args.get('level'),
+            }
+            cursor = request.args.get('cursor', type=int)
+            if self._wants_stream():
+                def fetch_page(page_cursor):
+                    return self.context_manager.get_system_logs(limit=self.stream_chunk_size, cursor=page_cursor, **filters)
+                return self._stream_ndjson(fetch_page, cursor, _log_key)
+
+            def build(serializer):
+                # Ohne Cursor die neueste Seite (Dashboard-Polling), danach mit 'next_cursor' vorwärts lesen
+                logs, next_cursor = self.context_manager.query_system_logs(
+                    limit=self._page_limit(), cursor=cursor, tail=cursor is None, **filters)
+                # Zeitstempel sind bereits beim Schreiben formatiert ('time'), hier wird nichts mehr umgerechnet
+                return serializer.encode_envelope({"status": "success", "next_cursor": next_cursor}, "data", logs, _log_key)
+            return self._cached_response("logs", build)
 
         # API-Endpunkt zum Ausführen von CLI-Befehlen (wie in der Django-App)
         @self.app.route('/api/execute_command', methods=['POST'])
@@ -54,26 +82,181 @@ class DurgaAPIServer:
             data = request.json
             command = data.get('command')
             if not command:
-                return jsonify({"status": "error", "message": "No command provided."}), 400
+                return self._respond({"status": "error", "message": "No command provided."}, 400)
             
             # Rufe die Methode im CoreContextManager auf, die den Befehl verarbeitet
             result = self.context_manager.execute_system_command(command)
-            return jsonify(result)
+            return self._respond(result)
+
+        # Mehrere Befehle in einer Anfrage: {"commands": [...], "max_parallel": n}; Einträge sind Strings oder
+        # {"id", "command", "params", "depends_on"}. Unabhängige Befehle laufen parallel, die Ergebnisse kommen
+        # als NDJSON in Abschlussreihenfolge (mit Dauer), zum Schluss eine Zeile {"summary": {...}}
+        @self.app.route('/api/commands/batch', methods=['POST'])
+        def execute_command_batch():
+            data = request.json
+            commands = data.get('commands') if isinstance(data, dict) else data
+            max_parallel = data.get('max_parallel') if isinstance(data, dict) else None
+            try:
+                results = self.context_manager.execute_command_batch(commands, max_parallel=max_parallel)
+            except ValueError as e: # Leerer Batch, unbekannte Abhängigkeit, Zyklus oder ungültiges max_parallel
+                return self._respond({"status": "error", "message": str(e)}, 400)
+            return Response(stream_ndjson(results), mimetype='application/x-ndjson')
 
-        # Beispiel: API-Endpunkt für Scan-Ergebnisse
+        # API-Endpunkt für Scan-Ergebnisse (Offset-Paginierung, optional als NDJSON-Stream)
         @self.app.route('/api/scan_results', methods=['GET'])
         def get_scan_results():
-            scan_data_raw = self.context_manager.get_scan_results() # Annahme: Methode in CoreContextManager
-            if not scan_data_raw:
-                return jsonify({"status": "success", "data": []})
-            
-            df_scan = pd.DataFrame(scan_data_raw)
-            # Beispiel: Konvertiere JSON-Spalten, wenn nötig
-            # if 'result_data' in df_scan.columns:
-            #     df_scan['result_data_summary'] = df_scan['result_data'].apply(lambda x: json.dumps(x) if x else None)
-            
-            return jsonify({"status": "success", "data": df_scan.to_dict(orient='records')})
+            since = request.args.get('since', type=float)
+            offset = request.args.get('offset', default=request.args.get('cursor', default=0, type=int), type=int)
+            if self._wants_stream():
+                def fetch_page(page_offset):
+                    return self.context_manager.get_scan_results(since=since, offset=page_offset or 0, limit=self.stream_chunk_size)
+                return self._stream_ndjson(fetch_page, offset, _scan_key)
+
+            def build(serializer):
+                scans = self.context_manager.get_scan_results(since=since, offset=offset, limit=self._page_limit())
+                next_offset = scans[-1]["seq"] + 1 if scans else offset
+                return serializer.encode_envelope({"status": "success", "next_offset": next_offset}, "data", scans, _scan_key)
+            return self._cached_response("scan_results", build)
+
+        # API-Endpunkt für den Kartengraphen; mit '?since=<version>' nur die Änderungen seit dieser Version
+        @self.app.route('/api/graph', methods=['GET'])
+        def get_graph():
+            graph = self.context_manager.get_graph(since=request.args.get('since', type=int))
+            return self._respond({"status": "success", "data": graph})
 
+        # API-Endpunkt für das hashverkettete Ereignis-Journal; '?since_seq=' bzw. '?since=' blättern, '?verify=1' prüft die Kette
+        @self.app.route('/api/blockchain/history', methods=['GET'])
+        def get_blockchain_history():
+            verify = request.args.get('verify', '').lower() in ('1', 'true', 'yes')
+
+            def fetch():
+                return self.context_manager.get_blockchain_data(
+                    limit=self._page_limit(), since_seq=request.args.get('since_seq', type=int),
+                    since=request.args.get('since', type=float), verify=verify)
+            if verify:
+                # Die Prüfung soll die Datei tatsächlich nachrechnen (z.B. nach Manipulation), nie aus dem Cache
+                return self._respond({"status": "success", "data": fetch()})
+            return self._cached_response("journal", lambda serializer: serializer.dumps({"status": "success", "data": fetch()}))
+
+        # Live-Feed (Server-Sent Events): Logs, Scan-Jobs, Karten und Status als inkrementelle Ereignisse.
+        # Wiederaufsetzen per 'Last-Event-ID' (sendet EventSource automatisch) oder '?since=<seq>',
+        # Filter per '?types=log,scan_job'
+        @self.app.route('/api/events', methods=['GET'])
+        def stream_events():
+            since = request.headers.get('Last-Event-ID', type=int)
+            if since is None:
+                since = request.args.get('since', type=int)
+            types = [t for t in request.args.get('types', '').split(',') if t] or None
+            subscription = self.context_manager.events.subscribe(since=since, event_types=types)
+            return Response(self._stream_events(subscription), mimetype='text/event-stream',
+                            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+        # Scan-Job-Engine: Einreichen (einzeln oder als Sammel-Auftrag), Status und Fortschritt
+        @self.app.route('/api/scan/jobs', methods=['POST'])
+        def submit_scan_jobs():
+            data = request.json or {}
+            targets = data.get('targets') or ([data['target']] if data.get('target') else [])
+            if not targets:
+                return self._respond({"status": "error", "message": "No targets provided."}, 400)
+            scan_type = data.get('scan_type', 'quick_scan')
+            if len(targets) == 1 and not data.get('per_host', False):
+                job_id = self.context_manager.scan_jobs.submit(targets[0], scan_type=scan_type)
+                return self._respond({"status": "success", "job_id": job_id}, 202)
+            try:
+                batch_id = self.context_manager.scan_jobs.submit_many(targets, scan_type=scan_type,
+                                                                       per_host=data.get('per_host', True))
+            except ValueError as e: # Ungültiger Ziel-Spec (z.B. umgekehrter Bereich)
+                return self._respond({"status": "error", "message": str(e)}, 400)
+            return self._respond({"status": "success", "batch_id": batch_id}, 202)
+
+        @self.app.route('/api/scan/jobs', methods=['GET'])
+        def list_scan_jobs():
+            jobs = self.context_manager.scan_jobs.list_jobs(status=request.args.get('status'), limit=self._page_limit())
+            return self._respond({"status": "success", "stats": self.context_manager.scan_jobs.get_stats(), "data": jobs})
+
+        @self.app.route('/api/scan/jobs/<job_id>', methods=['GET'])
+        def get_scan_job(job_id):
+            job = self.context_manager.scan_jobs.get_job(job_id)
+            if job is None:
+                return self._respond({"status": "error", "message": f"Unknown job '{job_id}'."}, 404)
+            return self._respond({"status": "success", "data": job})
+
+        @self.app.route('/api/scan/batches/<batch_id>', methods=['GET'])
+        def get_scan_batch(batch_id):
+            batch = self.context_manager.scan_jobs.get_batch(batch_id)
+            if batch is None:
+                return self._respond({"status": "error", "message": f"Unknown batch '{batch_id}'."}, 404)
+            return self._respond({"status": "success", "data": batch})
+
+    def _page_limit(self) -> int:
+        """Liest 'limit' aus der Anfrage und begrenzt es auf max_page_size."""
+        limit = request.args.get('limit', default=self.default_page_size, type=int)
+        return max(1, min(limit, self.max_page_size))
+
+    def _serializer(self) -> Serializer:
+        """Serializer nach Accept-Header: MessagePack für Maschinen-Clients, die es anfordern, sonst JSON."""
+        return get_serializer(negotiate(request.headers.get('Accept')))
+
+    def _respond(self, payload, status: int = 200):
+        serializer = self._serializer()
+        return Response(serializer.dumps(payload), status=status, mimetype=serializer.mimetype, headers={"Vary": "Accept"})
+
+    def _cached_response(self, collection: str, build):
+        """Gecachte Antwort mit ETag aus der Sammlungsversion (siehe response_cache.cached_response)."""
+        serializer = self._serializer()
+        status, body, headers = cached_response(self.response_cache, collection, serializer, request.path,
+                                                request.query_string, request.headers.get('If-None-Match'),
+                                                lambda: self.context_manager.get_versions()[collection], build)
+        return Response(body, status=status, mimetype=serializer.mimetype, headers=headers)
+
+    def _wants_stream(self) -> bool:
+        """Streaming-Modus per '?stream=1' oder 'Accept: application/x-ndjson'."""
+        if request.args.get('stream', '').lower() in ('1', 'true', 'yes'):
+            return True
+        return request.accept_mimetypes.best == 'application/x-ndjson'
+
+    def _stream_ndjson(self, fetch_page, cursor, chunk_key=None):
+        """
+        Streamt Einträge seitenweise als NDJSON (eine JSON-Zeile pro Eintrag).
+        fetch_page(cursor) liefert die nächste Seite; der Cursor ergibt sich aus 'seq' des letzten Eintrags.
+        Mit 'chunk_key' werden bereits kodierte Einträge aus dem Chunk-Cache des Serializers übernommen.
+        """
+        serializer = get_serializer("json")
+        def generate():
+            page_cursor = cursor
+            while True:
+                page = fetch_page(page_cursor)
+                if not page:
+                    break
+                yield b"\n".join(serializer.encode_chunks(page, chunk_key)) + b"\n"
+                page_cursor = page[-1]["seq"] + 1
+                if len(page) < self.stream_chunk_size:
+                    break
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+    def _stream_events(self, subscription):
+        """
+        SSE-Generator über einem Abonnement des EventBus. Jeder Frame ist pro Ereignis nur einmal
+        serialisiert; 'reset' fordert nach zu langer Trennung ein vollständiges Neuladen an,
+        'dropped' meldet Ereignisse, die ein zu langsamer Client verpasst hat.
+        """
+        try:
+            yield b"retry: 3000\n\n"
+            if subscription.reset:
+                yield f"event: reset\ndata: {dumps({'last_seq': self.context_manager.events.last_seq}).decode('utf-8')}\n\n".encode('utf-8')
+            while True:
+                events = subscription.get(timeout=self.event_heartbeat)
+                dropped = subscription.take_dropped()
+                if dropped:
+                    yield f"event: dropped\ndata: {dumps({'count': dropped}).decode('utf-8')}\n\n".encode('utf-8')
+                if events:
+                    yield b"".join(event.sse_frame() for event in events)
+                elif subscription.closed:
+                    return
+                else:
+                    yield b": keepalive\n\n" # Hält Proxys offen und erkennt getrennte Clients
+        finally:
+            subscription.close() # Client getrennt (GeneratorExit) oder Server fährt herunter
 
     def run_server(self):
         self.app.run(host=self.host, port=self.port)
@@ -85,6 +268,15 @@ class DurgaAPIServer:
         self.server_thread.start()
         self.context_manager.report_status(f"DurgaAPI Server im Hintergrund gestartet auf {self.host}:{self.port}", "OKGREEN")
 
+    def serve_production(self, **options):
+        """
+        Blockierender Produktionsbetrieb (gunicorn bzw. waitress) statt des Flask-Entwicklungsservers.
+        Worker-Prozesse bauen ihre eigene App und erreichen den Kern über die IPC-Grenze (core_ipc).
+        """
+        def app_factory(context):
+            return self.app if context is self.context_manager else type(self)(context, self.host, self.port).app
+        return serve_production(app_factory, self.context_manager, host=self.host, port=self.port, **options)
+
 # --- Integration in main.py (konzeptionell) ---
 # In main.py:
 # from src.exo_kernel.api_server import DurgaAPIServer
@@ -0,0 +1,190 @@
+# src/python/async_port_scanner.py
+import asyncio
+import collections
+import time
+from typing import AsyncIterator, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Zustände einer Port-Probe
+OPEN = "open"
+CLOSED = "closed"
+FILTERED = "filtered" # Timeout nach allen Wiederholungen
+ERROR = "error"
+
+
+class PortProbeResult(NamedTuple):
+    host: str
+    port: int
+    state: str
+    latency: Optional[float] # Sekunden bis zur Antwort (nur bei open/closed)
+    attempts: int
+    error: Optional[str] = None
+
+
+class RateLimiter:
+    """Token-Bucket für asyncio: 'rate' Tokens pro Sekunde, höchstens 'burst' auf Vorrat."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("Die Rate muss größer als 0 sein.")
+        self._rate = rate
+        self._capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+
+def interleave_pairs(hosts: Iterable[str], ports: List[int], window: int) -> Iterator[Tuple[str, int]]:
+    """
+    (Host, Port)-Paare im Round-Robin über bis zu 'window' gleichzeitig aktive Hosts: erst Port 1 aller
+    aktiven Hosts, dann Port 2 usw.; ist ein Host fertig, rückt der nächste nach. So verteilen sich die
+    Worker auf viele Hosts, statt sich am Ratenlimit eines einzelnen Hosts anzustellen, und 'hosts'
+    wird trotzdem lazy gelesen (ein /8 wird nie materialisiert).
+    """
+    hosts = iter(hosts)
+    active: Deque[Tuple[str, Iterator[int]]] = collections.deque()
+    for host in hosts:
+        active.append((host, iter(ports)))
+        if len(active) >= window:
+            break
+    while active:
+        host, host_ports = active.popleft()
+        port = next(host_ports, None)
+        if port is None:
+            next_host = next(hosts, None)
+            if next_host is not None:
+                active.append((next_host, iter(ports)))
+            continue
+        yield host, port
+        active.append((host, host_ports))
+
+
+async def _open_connection(host: str, port: int, timeout: float):
+    if hasattr(asyncio, "timeout"):
+        # Python >= 3.11: asyncio.wait_for kann einen Abbruch verschlucken, wenn die Verbindung im selben
+        # Moment zustande kommt; der Worker liefe dann nach dem Abbruch des Scans weiter
+        async with asyncio.timeout(timeout):
+            return await asyncio.open_connection(host, port)
+    return await asyncio.wait_for(asyncio.open_connection(host, port), timeout=timeout)
+
+
+class AsyncPortScanner:
+    """
+    TCP-Connect-Scanner auf Basis von asyncio.
+    Eine feste Anzahl Worker-Tasks (concurrency) arbeitet die (Host, Port)-Paare lazy ab, über die
+    aktiven Hosts verschränkt (siehe interleave_pairs); die Ergebnisse werden über eine begrenzte
+    Queue als asynchroner Generator zurückgegeben.
+    """
+
+    def __init__(self, concurrency: int = 500, timeout: float = 1.0, retries: int = 1, retry_backoff: float = 0.05,
+                 global_rate: Optional[float] = None, per_host_rate: Optional[float] = None):
+        """
+        :param concurrency: Maximale Anzahl gleichzeitiger Verbindungsversuche.
+        :param timeout: Timeout pro Verbindungsversuch in Sekunden.
+        :param retries: Zusätzliche Versuche nach einem Timeout (abgelehnte Verbindungen werden nicht wiederholt).
+        :param retry_backoff: Basis-Wartezeit vor einer Wiederholung (verdoppelt sich pro Versuch).
+        :param global_rate: Optionale Obergrenze für Verbindungsversuche pro Sekunde insgesamt.
+        :param per_host_rate: Optionale Obergrenze für Verbindungsversuche pro Sekunde und Host.
+        """
+        if concurrency <= 0:
+            raise ValueError("concurrency muss größer als 0 sein.")
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.global_rate = global_rate
+        self.per_host_rate = per_host_rate
+
+    async def probe(self, host: str, port: int, global_limiter: Optional[RateLimiter] = None,
+                    host_limiters: Optional[Dict[str, RateLimiter]] = None) -> PortProbeResult:
+        """Prüft einen einzelnen Port mit Timeout- und Wiederholungs-Policy."""
+        error = None
+        for attempt in range(1, self.retries + 2):
+            if global_limiter is not None:
+                await global_limiter.acquire()
+            if host_limiters is not None:
+                limiter = host_limiters.get(host)
+                if limiter is None:
+                    limiter = host_limiters[host] = RateLimiter(self.per_host_rate)
+                await limiter.acquire()
+            started = time.monotonic()
+            try:
+                _, writer = await _open_connection(host, port, self.timeout)
+            except ConnectionRefusedError:
+                return PortProbeResult(host, port, CLOSED, time.monotonic() - started, attempt)
+            except asyncio.TimeoutError:
+                error = "timeout"
+            except OSError as e:
+                return PortProbeResult(host, port, ERROR, None, attempt, str(e))
+            else:
+                latency = time.monotonic() - started
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
+                return PortProbeResult(host, port, OPEN, latency, attempt)
+            if attempt <= self.retries:
+                await asyncio.sleep(self.retry_backoff * (2 ** (attempt - 1)))
+        return PortProbeResult(host, port, FILTERED, None, self.retries + 1, error)
+
+    async def scan(self, hosts: Iterable[str], ports: Iterable[int]) -> AsyncIterator[PortProbeResult]:
+        """
+        Scannt alle Kombinationen aus Hosts und Ports und liefert die Ergebnisse in Abschlussreihenfolge.
+        Bricht der Aufrufer die Iteration ab, werden die laufenden Worker abgebrochen.
+        """
+        ports = list(ports)
+        if not ports:
+            return
+        pairs = interleave_pairs(hosts, ports, self.concurrency)
+        global_limiter = RateLimiter(self.global_rate) if self.global_rate else None
+        host_limiters: Optional[Dict[str, RateLimiter]] = {} if self.per_host_rate else None
+        remaining: Dict[str, int] = {} # Offene Probes je Host; bei 0 wird sein Token-Bucket freigegeben
+        results: "asyncio.Queue[Optional[PortProbeResult]]" = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        stopped = False
+
+        async def worker() -> None:
+            # Der Generator wird von allen Workern gemeinsam konsumiert (asyncio ist single-threaded)
+            for host, port in pairs:
+                remaining.setdefault(host, len(ports))
+                result = await self.probe(host, port, global_limiter, host_limiters)
+                if stopped: # Abbruch verpasst: nicht auf die Queue warten, die niemand mehr liest
+                    return
+                remaining[host] -= 1
+                if not remaining[host]:
+                    del remaining[host]
+                    if host_limiters is not None:
+                        host_limiters.pop(host, None)
+                await results.put(result)
+
+        async def close_when_done() -> None:
+            await asyncio.gather(*workers, return_exceptions=True)
+            await results.put(None) # Abschlussmarke
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        closer = asyncio.create_task(close_when_done())
+        try:
+            while True:
+                result = await results.get()
+                if result is None:
+                    break
+                yield result
+            for task in workers:
+                if task.exception() is not None:
+                    raise task.exception()
+        finally:
+            stopped = True
+            for task in workers + [closer]:
+                task.cancel()
+            await asyncio.gather(*workers, closer, return_exceptions=True)
@@ -1,22 +1,129 @@
 # src/python/neet_wrapper.py
-import neet_core_py as nc
+import asyncio
+import itertools
+import os
+import sys
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, Union
+
+from async_port_scanner import AsyncPortScanner, PortProbeResult, OPEN
+
+# Ziel-Mengen (CIDR, Bereiche, Ausschlüsse) kommen aus core.base; src/ ergänzen, falls nur src/python im Pfad ist
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from core.base.target_set import TargetSet, TargetSpec # noqa: E402
+
+try:
+    import neet_core_py as nc
+except ImportError: # Native Erweiterung nicht gebaut: reiner Python-Fallback
+    nc = None
+
+# Ports, die ohne native Erweiterung von scan_ports() geprüft werden
+DEFAULT_PORTS = [21, 22, 23, 25, 53, 80, 110, 139, 143, 443, 445, 3306, 3389, 5432, 8080, 8443]
+
+
+class PyNetworkDevice:
+    """Minimaler Ersatz für nc.NetworkDevice, wenn neet_core_py nicht verfügbar ist."""
+    def __init__(self, ip_address: str, hostname: str = "unknown"):
+        self.ip_address = ip_address
+        self.hostname = hostname
+
 
 class NEET:
-    def __init__(self):
-        pass
+    def __init__(self, scanner: Optional[AsyncPortScanner] = None):
+        self.scanner = scanner or AsyncPortScanner()
+
+    @staticmethod
+    def _target_set(targets: TargetSpec) -> TargetSet:
+        """TargetSet unverändert, Specs (auch mit '!'-Ausschlüssen) über TargetSet.from_specs."""
+        if isinstance(targets, TargetSet):
+            return targets
+        return TargetSet.from_specs([targets] if isinstance(targets, str) else list(targets or []))
 
-    def discover_device(self, ip_address: str, hostname: str = "unknown"):
-        device = nc.NetworkDevice(ip_address, hostname)
-        print(f"Discovering device: {device.hostname} ({device.ip_address})")
+    def discover_device(self, ip_address: TargetSpec, hostname: str = "unknown"):
+        """
+        Legt das Gerät für genau ein Ziel an. Specs, die mehrere Ziele ergeben (Netze, Bereiche),
+        gehören zu discover_devices(); hier wäre unklar, welches Gerät zurückkommt.
+        """
+        targets = self._target_set(ip_address)
+        first_two = list(itertools.islice(targets, 2))
+        if len(first_two) != 1:
+            raise ValueError(f"'{ip_address}' ergibt {len(targets)} Ziele; für mehrere Ziele discover_devices() nutzen.")
+        return self._make_device(first_two[0], hostname)
+
+    def discover_devices(self, targets: TargetSpec, hostname: str = "unknown") -> Iterator[Union["PyNetworkDevice", object]]:
+        """
+        Liefert die Geräte einer Ziel-Menge (TargetSet oder Specs wie "10.0.0.0/16 !10.0.5.0/24") lazy
+        und ohne Duplikate; ein großes Netz wird dabei nie als Liste materialisiert.
+        """
+        target_set = self._target_set(targets)
+        print(f"Discovering {len(target_set)} targets: {target_set!r}")
+        for address in target_set:
+            yield self._make_device(address, hostname, verbose=False)
+
+    def _make_device(self, ip_address: str, hostname: str, verbose: bool = True):
+        device = nc.NetworkDevice(ip_address, hostname) if nc else PyNetworkDevice(ip_address, hostname)
+        if verbose:
+            print(f"Discovering device: {device.hostname} ({device.ip_address})")
         return device
 
-    def scan_ports(self, device: nc.NetworkDevice):
-        ports = device.discover_ports()
+    def scan_ports(self, device):
+        if nc and isinstance(device, nc.NetworkDevice):
+            ports = device.discover_ports()
+        else:
+            ports = asyncio.run(self._collect_open_ports([device], DEFAULT_PORTS))
         print(f"Discovered ports for {device.ip_address}: {ports}")
         return ports
 
+    async def scan_many(self, devices: Union[TargetSpec, Iterable["PyNetworkDevice"]],
+                        ports: Optional[Iterable[int]] = None) -> AsyncIterator[PortProbeResult]:
+        """
+        Scannt viele Geräte nebenläufig und liefert die Ergebnisse als asynchronen Generator.
+        'devices' ist eine Ziel-Menge (TargetSet oder Spec-String, lazy expandiert) oder eine Folge von
+        Geräten bzw. Specs; Specs in einer Folge werden einzeln expandiert.
+        Mit neet_core_py wird discover_ports() der nativen Geräte genutzt (gefiltert auf 'ports'),
+        sonst der reine Python-Scanner (AsyncPortScanner) mit seinen Nebenläufigkeits- und Ratenlimits.
+        Achtung: Der native Pfad übernimmt von der Scanner-Policy nur 'concurrency' (Geräte gleichzeitig);
+        timeout, retries und die Ratenlimits gelten dort nicht, und er meldet nur offene Ports (OPEN),
+        keine closed/filtered-Ergebnisse. Wer diese Policy braucht, setzt einen AsyncPortScanner ohne nc ein.
+        """
+        if isinstance(devices, (str, TargetSet)):
+            devices = iter(self._target_set(devices))
+        else:
+            devices = itertools.chain.from_iterable(
+                self._target_set(device) if isinstance(device, str) else (device,) for device in devices)
+        if nc is not None:
+            async for result in self._scan_many_native(devices, ports):
+                yield result
+            return
+        hosts = (device if isinstance(device, str) else device.ip_address for device in devices)
+        async for result in self.scanner.scan(hosts, ports if ports is not None else DEFAULT_PORTS):
+            yield result
+
+    async def _scan_many_native(self, devices, ports: Optional[Iterable[int]]) -> AsyncIterator[PortProbeResult]:
+        """
+        Führt discover_ports() der nativen Geräte im Thread-Pool aus, begrenzt durch die Scanner-Nebenläufigkeit.
+        Timeout, Wiederholungen und Rate bestimmt die native Erweiterung selbst; geliefert werden nur offene Ports.
+        """
+        wanted = set(ports) if ports is not None else None
+        semaphore = asyncio.Semaphore(self.scanner.concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def discover(device):
+            if isinstance(device, str):
+                device = nc.NetworkDevice(device, "unknown")
+            async with semaphore:
+                return device, await loop.run_in_executor(None, device.discover_ports)
+
+        for future in asyncio.as_completed([discover(device) for device in devices]):
+            device, open_ports = await future
+            for port in open_ports:
+                if wanted is None or port in wanted:
+                    yield PortProbeResult(device.ip_address, port, OPEN, None, 1)
+
+    async def _collect_open_ports(self, devices, ports: Iterable[int]) -> List[int]:
+        return sorted([result.port async for result in self.scan_many(devices, ports) if result.state == OPEN])
+
 # Beispiel der Nutzung
 if __name__ == "__main__":
     neet_tool = NEET()
     my_device = neet_tool.discover_device("192.168.1.1", "Router")
-    neet_tool.scan_ports(my_device)
\ No newline at end of file
+    neet_tool.scan_ports(my_device)
@@ -0,0 +1,123 @@
+# src/python/tests/test_async_port_scanner.py
+"""Tests des AsyncPortScanner gegen lokale Listener auf 127.0.0.1 (keine Netzwerkzugriffe nach außen)."""
+import asyncio
+import contextlib
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from async_port_scanner import CLOSED, OPEN, AsyncPortScanner, interleave_pairs # noqa: E402
+
+
+def _free_port() -> int:
+    """Ein Port, auf dem (gerade) niemand lauscht: binden, Nummer merken, wieder schließen."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _start_listeners(count: int):
+    async def accept(reader, writer):
+        writer.close()
+    servers = [await asyncio.start_server(accept, "127.0.0.1", 0) for _ in range(count)]
+    return servers, [server.sockets[0].getsockname()[1] for server in servers]
+
+
+async def _close(servers) -> None:
+    for server in servers:
+        server.close()
+        await server.wait_closed()
+
+
+def test_open_and_closed_ports():
+    async def run():
+        servers, open_ports = await _start_listeners(2)
+        closed_port = _free_port()
+        try:
+            scanner = AsyncPortScanner(concurrency=4, timeout=1.0)
+            return {result.port: result async for result in scanner.scan(["127.0.0.1"], open_ports + [closed_port])}, \
+                open_ports, closed_port
+        finally:
+            await _close(servers)
+
+    results, open_ports, closed_port = asyncio.run(run())
+    assert [results[port].state for port in open_ports] == [OPEN, OPEN]
+    assert results[closed_port].state == CLOSED
+    assert all(result.attempts == 1 and result.latency is not None for result in results.values())
+
+
+def test_early_break_cancels_workers():
+    async def run():
+        servers, open_ports = await _start_listeners(1)
+        try:
+            scanner = AsyncPortScanner(concurrency=8, timeout=1.0)
+            ports = open_ports + [_free_port() for _ in range(200)]
+            seen = 0
+            async with contextlib.aclosing(scanner.scan(["127.0.0.1"], ports)) as results:
+                async for _ in results:
+                    seen += 1
+                    if seen == 3:
+                        break
+            return seen, [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        finally:
+            await _close(servers)
+
+    seen, leftover = asyncio.run(run())
+    assert seen == 3
+    assert leftover == []
+
+
+def test_break_without_aclose_does_not_hang_event_loop_shutdown():
+    async def run():
+        scanner = AsyncPortScanner(concurrency=8, timeout=1.0)
+        async for _ in scanner.scan(["127.0.0.1"], [_free_port() for _ in range(200)]):
+            break # Generator bleibt offen; asyncio.run bricht die Worker beim Beenden ab
+
+    started = time.monotonic()
+    asyncio.run(run())
+    assert time.monotonic() - started < 5
+
+
+def test_per_host_rate_limit():
+    async def run():
+        scanner = AsyncPortScanner(concurrency=10, timeout=1.0, per_host_rate=20)
+        started = time.monotonic()
+        results = [result async for result in scanner.scan(["127.0.0.1"], [_free_port() for _ in range(30)])]
+        return results, time.monotonic() - started
+
+    results, elapsed = asyncio.run(run())
+    assert len(results) == 30
+    # 20 Tokens Vorrat, die restlichen 10 mit 20/s: mindestens ca. 0,5 s
+    assert elapsed >= 0.45
+
+
+def test_hosts_are_interleaved_under_per_host_rate():
+    async def run():
+        scanner = AsyncPortScanner(concurrency=10, timeout=1.0, per_host_rate=10)
+        ports = [_free_port() for _ in range(20)]
+        started = time.monotonic()
+        first_seen = {}
+        async for result in scanner.scan(["127.0.0.1", "127.0.0.2"], ports):
+            first_seen.setdefault(result.host, time.monotonic() - started)
+        return first_seen, time.monotonic() - started
+
+    first_seen, elapsed = asyncio.run(run())
+    # Beide Hosts starten sofort und teilen sich die Worker: ca. 1 s statt ca. 2 s nacheinander
+    assert first_seen["127.0.0.2"] < 0.3
+    assert elapsed < 1.6
+
+
+def test_interleave_pairs_is_round_robin_and_lazy():
+    read = []
+
+    def hosts():
+        for index in range(10 ** 6):
+            read.append(index)
+            yield f"h{index}"
+
+    pairs = interleave_pairs(hosts(), [1, 2], window=2)
+    assert [next(pairs) for _ in range(6)] == [("h0", 1), ("h1", 1), ("h0", 2), ("h1", 2), ("h2", 1), ("h3", 1)]
+    assert len(read) == 4 # Nur so viele Hosts wie aktiv, nie die ganze Folge
@@ -1,17 +1,26 @@
 const API_BASE_URL = 'http://localhost:5000';
 
-export async function getLogs() {
+export async function getLogs(params = {}) {
+    // params: { since, until, level, limit, cursor } - siehe /api/logs; ohne cursor die neueste Seite
+    const page = await getLogsPage(params);
+    return page.data;
+}
+
+export async function getLogsPage(params = {}) {
+    // Liefert { data, next_cursor }: next_cursor beim nächsten Aufruf als cursor übergeben,
+    // um nur neue Einträge zu holen (inkrementelles Polling statt immer die ganze Seite)
     try {
-        const response = await fetch(`${API_BASE_URL}/api/logs`);
+        const query = new URLSearchParams(params).toString();
+        const response = await fetch(`${API_BASE_URL}/api/logs${query ? `?${query}` : ''}`);
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
         const result = await response.json();
-        // The data is already clean thanks to your Pandas backend
-        return result.data; 
+        // Zeitstempel sind bereits im Backend formatiert (Feld 'time')
+        return { data: result.data, next_cursor: result.next_cursor };
     } catch (error) {
         console.error("Failed to fetch logs:", error);
-        return []; // Return empty array on error
+        return { data: [], next_cursor: params.cursor ?? null }; // Return empty page on error
     }
 }
 
@@ -32,4 +41,44 @@ export async function executeCommand(command) {
         console.error(`Failed to execute command "${command}":`, error);
         return { status: 'error', message: error.message };
     }
-}
\ No newline at end of file
+}
+export function subscribeEvents(handlers = {}, types = [], retryDelay = 5000) {
+    // Live-Feed statt Polling: handlers { log, scan_job, card, status, reset, dropped }.
+    // EventSource setzt nach einem Verbindungsabbruch automatisch per Last-Event-ID wieder auf;
+    // 'reset' bedeutet, dass der Verlauf nicht mehr reicht und einmal vollständig neu geladen werden muss.
+    // Sind alle Live-Feed-Plätze des Servers belegt (503), gibt EventSource endgültig auf; dann wird
+    // nach 'retryDelay' ms ein neues Abonnement ab dem zuletzt gesehenen Ereignis aufgebaut.
+    let source = null;
+    let retryTimer = null;
+    let lastEventId = null;
+    let closed = false;
+    const connect = () => {
+        const params = new URLSearchParams();
+        if (types.length) params.set('types', types.join(','));
+        if (lastEventId) params.set('since', lastEventId);
+        const query = params.toString() ? `?${params}` : '';
+        source = new EventSource(`${API_BASE_URL}/api/events${query}`);
+        for (const [type, handler] of Object.entries(handlers)) {
+            source.addEventListener(type, (message) => {
+                if (message.lastEventId) lastEventId = message.lastEventId;
+                handler(JSON.parse(message.data));
+            });
+        }
+        source.onerror = (error) => {
+            if (source.readyState !== EventSource.CLOSED) {
+                console.error("Live feed interrupted, reconnecting:", error);
+            } else if (!closed) {
+                console.error(`Live feed rejected, retrying in ${retryDelay} ms:`, error);
+                retryTimer = setTimeout(connect, retryDelay);
+            }
+        };
+    };
+    connect();
+    return {
+        close() { // Beendet das Abonnement
+            closed = true;
+            clearTimeout(retryTimer);
+            source.close();
+        },
+    };
+}
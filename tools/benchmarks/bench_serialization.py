@@ -0,0 +1,107 @@
+# tools/benchmarks/bench_serialization.py
+"""
+Micro-Benchmark der Serialisierungsschicht (core.base.serialization) auf realistischen Payloads:
+eine Log-Seite, eine Seite Scan-Ergebnisse und eine Liste von Karten, jeweils in der Form, die
+die API ausliefert. Verglichen werden die Standardbibliothek (wie bisher über flask.jsonify),
+der aktive JSON-Backend (orjson, falls installiert), MessagePack (falls installiert) und die
+Wiederverwendung vorkodierter Chunks für Listen.
+
+Aufruf: python tools/benchmarks/bench_serialization.py [--entries 1000] [--repeat 5] [--stdlib]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from core.base import serialization # noqa: E402
+from core.base.log_store import format_timestamp # noqa: E402
+
+LEVELS = ["INFO", "INFO", "INFO", "DEBUG", "WARNING", "ERROR"]
+COMPONENTS = ["CoreContextManager", "ScanJobEngine", "DurgaStore", "NEETShell", "DummyWebFetcher"]
+
+
+def make_logs(count: int) -> list:
+    start = time.time() - count
+    return [{"seq": seq, "timestamp": start + seq, "time": format_timestamp(start + seq),
+             "level": random.choice(LEVELS), "component": random.choice(COMPONENTS),
+             "message": f"Karte 'OSI_Security' mit ID 'card_{seq:06d}' hinzugefügt. Größe: {random.randint(100, 9999)} Bytes"}
+            for seq in range(count)]
+
+
+def make_scans(count: int) -> list:
+    scans = []
+    for seq in range(count):
+        target = f"10.{seq // 65536 % 256}.{seq // 256 % 256}.{seq % 256}"
+        scans.append({"id": f"scan_job_{seq:08d}", "job_id": f"job_{seq:08d}", "scan_type": "quick_scan",
+                      "target": target, "status": "completed", "timestamp": time.time(), "time": format_timestamp(time.time()),
+                      "seq": seq, "results": [f"Simulierter Port {port} offen auf {target}" for port in (22, 80, 443)]})
+    return scans
+
+
+def make_cards(count: int) -> list:
+    return [{"card_id": f"card_{seq:06d}", "card_type": "OSI_Security",
+             "data": {"target_ip": f"192.168.{seq // 256 % 256}.{seq % 256}", "port": random.randint(1, 65535),
+                      "cve_id": f"CVE-2024-{random.randint(1000, 99999)}", "value": random.random() * 10,
+                      "hostname": f"host-{seq}.example.com", "tags": ["web", "exposed", "critical"][:seq % 3 + 1],
+                      "url": f"https://app.example.com/api/v1/items/{seq}?q=%C3%A4"}}
+            for seq in range(count)]
+
+
+def bench(label: str, func, repeat: int, payload_bytes: int) -> None:
+    number = max(1, int(0.2 / max(timeit.timeit(func, number=1), 1e-6)))
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print(f"  {label:<42} {best * 1e3:9.3f} ms   {payload_bytes / best / 1e6:8.1f} MB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vergleicht JSON-/MessagePack-Encoder auf API-Payloads.")
+    parser.add_argument('--entries', type=int, default=1000, help='Einträge pro Payload (Seitengröße).')
+    parser.add_argument('--repeat', type=int, default=5, help='Wiederholungen, gewertet wird die schnellste.')
+    parser.add_argument('--stdlib', action='store_true', help='orjson ignorieren (Fallback-Pfad messen).')
+    args = parser.parse_args()
+    if args.stdlib:
+        serialization.orjson = None
+        serialization.JSON_BACKEND = "json"
+    random.seed(42)
+
+    print(f"JSON-Backend: {serialization.JSON_BACKEND}, msgpack: "
+          f"{'ja' if serialization.msgpack is not None else 'nicht installiert'}, {args.entries} Einträge pro Payload\n")
+    payloads = {"logs": make_logs(args.entries), "scan_results": make_scans(args.entries), "cards": make_cards(args.entries)}
+    for name, items in payloads.items():
+        envelope = {"status": "success", "data": items, "next_cursor": len(items)}
+        size = len(json.dumps(envelope).encode('utf-8'))
+        print(f"{name} ({size / 1024:.0f} KiB als JSON)")
+        bench("json.dumps (wie flask.jsonify)", lambda: json.dumps(envelope).encode('utf-8'), args.repeat, size)
+        bench("json.dumps(indent=2) (Shell alt)", lambda: json.dumps(envelope, indent=2), args.repeat, size)
+        bench(f"dumps ({serialization.JSON_BACKEND})", lambda: serialization.dumps(envelope), args.repeat, size)
+        bench(f"dumps_pretty ({serialization.JSON_BACKEND})", lambda: serialization.dumps_pretty(envelope), args.repeat, size)
+        if serialization.msgpack is not None:
+            bench("msgpack", lambda: serialization.msgpack_dumps(envelope), args.repeat, size)
+
+        key_field = "seq" if "seq" in items[0] else "card_id"
+        for fmt in (["json", "msgpack"] if serialization.msgpack is not None else ["json"]):
+            def cold(fmt=fmt):
+                serializer = serialization.Serializer(fmt)
+                serializer.reuse_chunks = True
+                return serializer.encode_envelope({"status": "success", "next_cursor": len(items)}, "data", items,
+                                                  lambda item: (name, item[key_field]))
+            warm_serializer = serialization.Serializer(fmt)
+            warm_serializer.reuse_chunks = True # Im Serializer nur mit stdlib-json aktiv; hier immer messen
+            cold()
+            warm_serializer.encode_envelope({}, "data", items, lambda item: (name, item[key_field]))
+
+            def warm(serializer=warm_serializer):
+                return serializer.encode_envelope({"status": "success", "next_cursor": len(items)}, "data", items,
+                                                  lambda item: (name, item[key_field]))
+            bench(f"Chunks {fmt}, kalt (kodieren + cachen)", cold, args.repeat, size)
+            bench(f"Chunks {fmt}, warm (nur zusammensetzen)", warm, args.repeat, size)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# tools/benchmarks/bench_template_columns.py
+"""
+Micro-Benchmark der Template-Befüllung im CardGenerator (core.base.crypt_trans): pro Karte über
+_populate_template_data gegen spaltenweise über populate_template_columns, einmal nur die Spalten
+und einmal inklusive der Daten-Dicts (records()). Mit NumPy wird numpy.random.Generator genutzt,
+sonst der array-Fallback; '--no-numpy' misst den Fallback auch dann, wenn NumPy installiert ist.
+
+Die Django-Modelle am Ende von crypt_trans.py sind hypothetisch und ohne Django-Projekt nicht
+importierbar; geladen und gemessen wird daher nur der Generator-Teil davor.
+
+Aufruf: python tools/benchmarks/bench_template_columns.py [--count 100000] [--repeat 3] [--no-numpy]
+"""
+import argparse
+import os
+import sys
+import timeit
+import types
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src')
+sys.path.insert(0, SRC)
+
+
+def load_generator_module() -> types.ModuleType:
+    path = os.path.join(SRC, 'core', 'base', 'crypt_trans.py')
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    source = source[:source.index('# app_name/models.py')]
+    module = types.ModuleType('crypt_trans_generator')
+    module.__file__ = path
+    exec(compile(source, path, 'exec'), module.__dict__)
+    return module
+
+
+def best_of(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vergleicht Template-Befüllung pro Karte und spaltenweise.")
+    parser.add_argument('--count', type=int, default=100000, help='Karten pro Template.')
+    parser.add_argument('--repeat', type=int, default=3, help='Wiederholungen, gewertet wird die schnellste.')
+    parser.add_argument('--no-numpy', action='store_true', help='NumPy ignorieren (Fallback-Pfad messen).')
+    args = parser.parse_args()
+    crypt_trans = load_generator_module()
+    if args.no_numpy:
+        crypt_trans.np = None
+
+    generator = crypt_trans.CardGenerator(seed=42, verbose=False)
+    print(f"Spalten aus: {'NumPy ' + crypt_trans.np.__version__ if crypt_trans.np is not None else 'random.Random (Fallback)'}, "
+          f"{args.count} Karten pro Template\n")
+    print(f"  {'Template':<18} {'pro Karte':>10} {'Spalten':>10} {'Faktor':>7} {'+ Dicts':>10} {'Faktor':>7}")
+    for template in generator.card_templates:
+        per_card = best_of(lambda: [generator._populate_template_data(template["data_template"], None)
+                                    for _ in range(args.count)], args.repeat)
+        columns = best_of(lambda: generator.populate_template_columns(template, args.count, seed=7), args.repeat)
+        records = best_of(lambda: generator.populate_template_columns(template, args.count, seed=7).records(), args.repeat)
+        print(f"  {template['name']:<18} {per_card * 1e3:8.1f}ms {columns * 1e3:8.1f}ms {per_card / columns:6.1f}x "
+              f"{records * 1e3:8.1f}ms {per_card / records:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()